@@ -1,5 +1,27 @@
 from .machine_executor import MachineExecutor
 from .step_explainer import StepExplainer
+from .result_cache import CachedRun, ResultCache
+from .chrome_trace import ChromeTraceRecorder, ChromeTraceObserver, TracingStepExplainer
+from .busy_beaver_search import (
+    BusyBeaverSearch, SearchReport, HaltingMachine, read_results, spec_to_machine
+)
+from .machine_verifier import MachineVerifier, VerificationReport, Counterexample
+from .configuration_store import MachineConfiguration, ConfigurationStore
+from .engine_process import EngineProcess
+from .output_verifier import (
+    OutputVerifier, OutputReport, OutputCheck, CheckResult, SymbolCountCheck,
+    DecodedValueCheck, TapeRegexCheck, symbol_counter, multiply_output_verifier
+)
+from .trace_regression import (
+    TraceRegression, GoldenFile, GoldenTrace, ReplayReport, Divergence, TraceHasher
+)
 
-__all__ = ['MachineExecutor', 'StepExplainer']
+__all__ = ['MachineExecutor', 'StepExplainer', 'CachedRun', 'ResultCache',
+           'MachineVerifier', 'VerificationReport', 'Counterexample', 'ChromeTraceRecorder',
+           'ChromeTraceObserver', 'TracingStepExplainer', 'BusyBeaverSearch', 'SearchReport',
+           'HaltingMachine', 'read_results', 'spec_to_machine', 'MachineConfiguration',
+           'ConfigurationStore', 'EngineProcess', 'OutputVerifier', 'OutputReport', 'OutputCheck',
+           'CheckResult', 'SymbolCountCheck', 'DecodedValueCheck', 'TapeRegexCheck',
+           'symbol_counter', 'multiply_output_verifier', 'TraceRegression', 'GoldenFile',
+           'GoldenTrace', 'ReplayReport', 'Divergence', 'TraceHasher']
 
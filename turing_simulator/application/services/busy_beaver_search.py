@@ -0,0 +1,456 @@
+import json
+import os
+import struct
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from ...domain.entities.state import State
+from ...domain.entities.transition import Transition
+from ...domain.entities.turing_machine import TuringMachine
+
+
+UNDEFINED = 'undefined'
+CYCLE = 'cycle'
+ESCAPE = 'escape'
+STEP_BUDGET = 'step_budget'
+SPACE_BUDGET = 'space_budget'
+NO_HALT = 'no_halt'
+
+RESULTS_MAGIC = b'TMBB'
+RESULTS_HEADER = struct.Struct('<4sBBH')
+RESULTS_VERSION = 1
+RECORD_TAIL = struct.Struct('<QI')
+
+Config = Tuple[bytearray, int, int, int, int, int]
+
+
+@dataclass
+class HaltingMachine:
+    spec: bytes
+    step_count: int
+    nonblank_count: int
+    
+    def __str__(self) -> str:
+        return (f"{self.spec.hex()} | adım: {self.step_count} | "
+                f"boş olmayan hücre: {self.nonblank_count}")
+
+
+@dataclass
+class SearchReport:
+    states: int
+    symbols: int
+    task_count: int
+    completed_tasks: int = 0
+    counts: Dict[str, int] = field(default_factory=dict)
+    longest: Optional[HaltingMachine] = None
+    most_symbols: Optional[HaltingMachine] = None
+    elapsed_seconds: float = 0.0
+    
+    def is_complete(self) -> bool:
+        return self.completed_tasks == self.task_count
+    
+    def __str__(self) -> str:
+        labels = {
+            'halting': "Duran",
+            CYCLE: "Döngü",
+            ESCAPE: "Kaçış",
+            NO_HALT: "Durma geçişi kalmayan",
+            STEP_BUDGET: "Adım bütçesi aşılan",
+            SPACE_BUDGET: "Alan bütçesi aşılan",
+        }
+        lines = [
+            f"{self.states} durum, {self.symbols} sembol | "
+            f"Görev: {self.completed_tasks}/{self.task_count} | "
+            f"Süre: {self.elapsed_seconds:.2f} s",
+        ]
+        for key, label in labels.items():
+            lines.append(f"  {label}: {self.counts.get(key, 0):,}")
+        if self.longest is not None:
+            lines.append(f"En uzun çalışan: {self.longest}")
+        if self.most_symbols is not None:
+            lines.append(f"En çok sembol yazan: {self.most_symbols}")
+        if not self.is_complete():
+            lines.append("Arama tamamlanmadı; kontrol noktasından devam edilebilir.")
+        return "\n".join(lines)
+
+
+def encode_entry(states: int, write: int, move_right: bool, next_state: int) -> int:
+    return 1 + (write * 2 + int(move_right)) * states + next_state
+
+
+def decode_spec(
+    spec: bytes,
+    states: int
+) -> Tuple[List[int], List[int], List[int]]:
+    next_states, writes, moves = [], [], []
+    for entry in spec:
+        if entry == 0:
+            next_states.append(-1)
+            writes.append(0)
+            moves.append(0)
+            continue
+        code, next_state = divmod(entry - 1, states)
+        write, move_right = divmod(code, 2)
+        next_states.append(next_state)
+        writes.append(write)
+        moves.append(1 if move_right else -1)
+    return next_states, writes, moves
+
+
+def spec_to_machine(spec: bytes, states: int, symbols: int) -> TuringMachine:
+    state_list = [
+        State(name=chr(ord('A') + index), is_initial=(index == 0))
+        for index in range(states)
+    ]
+    next_states, writes, moves = decode_spec(spec, states)
+    transitions: Dict[Tuple[State, str], Transition] = {}
+    for index, next_state in enumerate(next_states):
+        if next_state < 0:
+            continue
+        from_state = state_list[index // symbols]
+        read_symbol = str(index % symbols)
+        transitions[(from_state, read_symbol)] = Transition(
+            from_state, state_list[next_state], read_symbol,
+            str(writes[index]), 'R' if moves[index] > 0 else 'L'
+        )
+    return TuringMachine(
+        states=state_list,
+        initial_state=state_list[0],
+        transitions=transitions,
+        blank_symbol='0',
+        final_states=[]
+    )
+
+
+def initial_config(max_cells: int) -> Config:
+    return (bytearray(2 * max_cells + 1), max_cells, 0, 0, max_cells, max_cells)
+
+
+def _escapes(
+    next_states: List[int],
+    moves: List[int],
+    states: int,
+    symbols: int,
+    state: int,
+    direction: int
+) -> bool:
+    for _ in range(states):
+        blank_index = state * symbols
+        if next_states[blank_index] < 0 or moves[blank_index] != direction:
+            return False
+        state = next_states[blank_index]
+    return True
+
+
+def simulate(
+    spec: bytes,
+    states: int,
+    symbols: int,
+    config: Config,
+    max_steps: int
+) -> Tuple[str, Config]:
+    next_states, writes, moves = decode_spec(spec, states)
+    tape, head, state, steps, low, high = config
+    size = len(tape)
+    saved_tape = None
+    saved_state = saved_head = saved_low = saved_high = -1
+    power = 1
+    next_snapshot = steps + 1
+    
+    while True:
+        index = state * symbols + tape[head]
+        next_state = next_states[index]
+        if next_state < 0:
+            return UNDEFINED, (tape, head, state, steps, low, high)
+        if steps >= max_steps:
+            return STEP_BUDGET, (tape, head, state, steps, low, high)
+        
+        tape[head] = writes[index]
+        head += moves[index]
+        state = next_state
+        steps += 1
+        
+        if head < low:
+            if head < 0:
+                return SPACE_BUDGET, (tape, head + 1, state, steps, low, high)
+            low = head
+            if _escapes(next_states, moves, states, symbols, state, -1):
+                return ESCAPE, (tape, head, state, steps, low, high)
+        elif head > high:
+            if head >= size:
+                return SPACE_BUDGET, (tape, head - 1, state, steps, low, high)
+            high = head
+            if _escapes(next_states, moves, states, symbols, state, 1):
+                return ESCAPE, (tape, head, state, steps, low, high)
+        elif (state == saved_state and head == saved_head and low == saved_low
+              and high == saved_high and tape[low:high + 1] == saved_tape):
+            return CYCLE, (tape, head, state, steps, low, high)
+        
+        if steps == next_snapshot:
+            saved_state, saved_head, saved_low, saved_high = state, head, low, high
+            saved_tape = bytes(tape[low:high + 1])
+            power *= 2
+            next_snapshot = steps + power
+
+
+def expand(
+    spec: bytes,
+    states: int,
+    symbols: int,
+    config: Config
+) -> List[bytes]:
+    tape, head, state, _, _, _ = config
+    index = state * symbols + tape[head]
+    if spec.count(0) == 1:
+        return []
+    
+    next_states, writes, _ = decode_spec(spec, states)
+    defined = [i for i, next_state in enumerate(next_states) if next_state >= 0]
+    if not defined:
+        first_states = [1] if states > 1 else [0]
+        directions = (True,)
+        write_limit = min(symbols, 2)
+    else:
+        highest_state = max(next_states[i] for i in defined)
+        first_states = range(min(states, highest_state + 2))
+        directions = (False, True)
+        write_limit = min(symbols, max(writes[i] for i in defined) + 2)
+    
+    children = []
+    for next_state in first_states:
+        for write in range(write_limit):
+            for move_right in directions:
+                child = bytearray(spec)
+                child[index] = encode_entry(states, write, move_right, next_state)
+                children.append(bytes(child))
+    return children
+
+
+def _nonblank_count(config: Config) -> int:
+    tape, _, _, _, low, high = config
+    return (high - low + 1) - tape.count(0, low, high + 1)
+
+
+def _copy_config(config: Config) -> Config:
+    tape, head, state, steps, low, high = config
+    return (bytearray(tape), head, state, steps, low, high)
+
+
+def _visit(
+    spec: bytes,
+    config: Config,
+    states: int,
+    symbols: int,
+    max_steps: int,
+    counts: Counter,
+    halting: List[HaltingMachine]
+) -> Tuple[List[bytes], Optional[Config]]:
+    outcome, config = simulate(spec, states, symbols, config, max_steps)
+    if outcome != UNDEFINED:
+        counts[outcome] += 1
+        return [], None
+    
+    counts['halting'] += 1
+    halting.append(HaltingMachine(spec, config[3] + 1, _nonblank_count(config)))
+    children = expand(spec, states, symbols, config)
+    if not children:
+        counts[NO_HALT] += 1
+    return children, config
+
+
+def _search_subtree(
+    spec: bytes,
+    states: int,
+    symbols: int,
+    max_steps: int,
+    max_cells: int
+) -> Tuple[List[HaltingMachine], Counter]:
+    counts: Counter = Counter()
+    halting: List[HaltingMachine] = []
+    stack = [(spec, initial_config(max_cells))]
+    
+    while stack:
+        spec, config = stack.pop()
+        children, config = _visit(
+            spec, config, states, symbols, max_steps, counts, halting
+        )
+        for child in reversed(children):
+            stack.append((child, _copy_config(config)))
+    
+    return halting, counts
+
+
+class BusyBeaverSearch:
+    
+    def __init__(
+        self,
+        states: int,
+        symbols: int = 2,
+        max_steps: int = 10_000,
+        max_cells: int = 1_000,
+        workers: Optional[int] = None,
+        tasks_per_worker: int = 16
+    ):
+        if states < 1 or symbols < 2:
+            raise ValueError("En az 1 durum ve 2 sembol gereklidir.")
+        if 2 * states * symbols >= 256:
+            raise ValueError("Durum ve sembol sayısı sonuç biçimi için çok büyük.")
+        
+        self._states = states
+        self._symbols = symbols
+        self._max_steps = max_steps
+        self._max_cells = max_cells
+        self._workers = workers or os.cpu_count() or 1
+        self._tasks_per_worker = tasks_per_worker
+    
+    def _parameters(self) -> Dict[str, int]:
+        return {
+            'states': self._states,
+            'symbols': self._symbols,
+            'max_steps': self._max_steps,
+            'max_cells': self._max_cells,
+        }
+    
+    def _build_frontier(self) -> Tuple[List[bytes], List[HaltingMachine], Counter]:
+        counts: Counter = Counter()
+        halting: List[HaltingMachine] = []
+        frontier = [bytes(self._states * self._symbols)]
+        target = self._workers * self._tasks_per_worker
+        
+        while frontier and len(frontier) < target:
+            expanded = []
+            for spec in frontier:
+                children, _ = _visit(
+                    spec, initial_config(self._max_cells), self._states,
+                    self._symbols, self._max_steps, counts, halting
+                )
+                expanded.extend(children)
+            if not expanded:
+                return [], halting, counts
+            frontier = expanded
+        
+        return frontier, halting, counts
+    
+    def run(
+        self,
+        results_path: str,
+        checkpoint_path: Optional[str] = None
+    ) -> SearchReport:
+        started = time.perf_counter()
+        checkpoint_path = checkpoint_path or results_path + '.checkpoint.json'
+        tasks, prelude, prelude_counts = self._build_frontier()
+        report = SearchReport(self._states, self._symbols, len(tasks))
+        
+        checkpoint = self._load_checkpoint(checkpoint_path)
+        if checkpoint is None:
+            with open(results_path, 'wb') as f:
+                f.write(RESULTS_HEADER.pack(
+                    RESULTS_MAGIC, self._states, self._symbols, RESULTS_VERSION
+                ))
+                self._write_records(f, prelude)
+            counts = Counter(prelude_counts)
+            completed = set()
+            self._save_checkpoint(
+                checkpoint_path, completed, os.path.getsize(results_path), counts
+            )
+        else:
+            with open(results_path, 'r+b') as f:
+                f.truncate(checkpoint['results_size'])
+            counts = Counter(checkpoint['counts'])
+            completed = set(checkpoint['completed'])
+        
+        pending_tasks = [
+            (index, spec) for index, spec in enumerate(tasks) if index not in completed
+        ]
+        executor = ProcessPoolExecutor(max_workers=self._workers)
+        try:
+            with open(results_path, 'ab') as results:
+                futures = {
+                    executor.submit(
+                        _search_subtree, spec, self._states, self._symbols,
+                        self._max_steps, self._max_cells
+                    ): index
+                    for index, spec in pending_tasks
+                }
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        halting, task_counts = future.result()
+                        self._write_records(results, halting)
+                        results.flush()
+                        os.fsync(results.fileno())
+                        counts.update(task_counts)
+                        completed.add(futures[future])
+                        self._save_checkpoint(
+                            checkpoint_path, completed, results.tell(), counts
+                        )
+        except KeyboardInterrupt:
+            pass
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        report.completed_tasks = len(completed)
+        report.counts = dict(counts)
+        for machine in read_results(results_path)[2]:
+            if report.longest is None or machine.step_count > report.longest.step_count:
+                report.longest = machine
+            if (report.most_symbols is None
+                    or machine.nonblank_count > report.most_symbols.nonblank_count):
+                report.most_symbols = machine
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+    
+    def _write_records(self, f, halting: List[HaltingMachine]) -> None:
+        f.write(b''.join(
+            machine.spec + RECORD_TAIL.pack(machine.step_count, machine.nonblank_count)
+            for machine in halting
+        ))
+    
+    def _load_checkpoint(self, checkpoint_path: str) -> Optional[Dict]:
+        if not os.path.exists(checkpoint_path):
+            return None
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+        if checkpoint.get('parameters') != self._parameters():
+            raise ValueError(
+                "Kontrol noktası farklı arama parametreleriyle oluşturulmuş."
+            )
+        return checkpoint
+    
+    def _save_checkpoint(
+        self,
+        checkpoint_path: str,
+        completed: set,
+        results_size: int,
+        counts: Counter
+    ) -> None:
+        temporary_path = checkpoint_path + '.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'parameters': self._parameters(),
+                'completed': sorted(completed),
+                'results_size': results_size,
+                'counts': dict(counts),
+            }, f)
+        os.replace(temporary_path, checkpoint_path)
+
+
+def read_results(results_path: str) -> Tuple[int, int, List[HaltingMachine]]:
+    with open(results_path, 'rb') as f:
+        data = f.read()
+    magic, states, symbols, version = RESULTS_HEADER.unpack_from(data)
+    if magic != RESULTS_MAGIC or version != RESULTS_VERSION:
+        raise ValueError("Geçersiz sonuç dosyası.")
+    
+    spec_size = states * symbols
+    record_size = spec_size + RECORD_TAIL.size
+    machines = []
+    for offset in range(RESULTS_HEADER.size, len(data) - record_size + 1, record_size):
+        step_count, nonblank_count = RECORD_TAIL.unpack_from(data, offset + spec_size)
+        machines.append(HaltingMachine(
+            data[offset:offset + spec_size], step_count, nonblank_count
+        ))
+    return states, symbols, machines
@@ -0,0 +1,178 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+from ...domain.entities.state import State
+from ...domain.entities.step_result import StepResult
+from ...domain.interfaces.istep_explainer import IStepExplainer
+from ...domain.interfaces.istep_observer import IStepObserver
+
+
+class ChromeTraceRecorder:
+    
+    def __init__(
+        self,
+        process_name: str = "Turing Makinesi Simülatörü",
+        max_events: int = 1_000_000
+    ):
+        self._pid = os.getpid()
+        self._max_events = max_events
+        self._dropped_events = 0
+        self._lock = threading.Lock()
+        self._events: List[Dict[str, Any]] = [{
+            'name': 'process_name', 'ph': 'M', 'pid': self._pid, 'tid': 0,
+            'args': {'name': process_name},
+        }]
+        self._thread_names: Dict[int, str] = {}
+    
+    @staticmethod
+    def now_us() -> float:
+        return time.perf_counter_ns() / 1000
+    
+    def _append(self, event: Dict[str, Any]) -> None:
+        tid = threading.get_ident()
+        event['pid'] = self._pid
+        event['tid'] = tid
+        with self._lock:
+            if tid not in self._thread_names:
+                name = threading.current_thread().name
+                self._thread_names[tid] = name
+                self._events.append({
+                    'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid,
+                    'args': {'name': name},
+                })
+            if len(self._events) >= self._max_events:
+                self._dropped_events += 1
+                return
+            self._events.append(event)
+    
+    def complete(
+        self,
+        name: str,
+        category: str,
+        start_us: float,
+        end_us: float,
+        args: Optional[Dict[str, Any]] = None
+    ) -> None:
+        event = {'name': name, 'cat': category, 'ph': 'X',
+                 'ts': start_us, 'dur': end_us - start_us}
+        if args:
+            event['args'] = args
+        self._append(event)
+    
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        category: str = 'gui',
+        args: Optional[Dict[str, Any]] = None
+    ) -> Iterator[None]:
+        started = self.now_us()
+        try:
+            yield
+        finally:
+            self.complete(name, category, started, self.now_us(), args)
+    
+    def instant(
+        self,
+        name: str,
+        category: str,
+        args: Optional[Dict[str, Any]] = None
+    ) -> None:
+        event = {'name': name, 'cat': category, 'ph': 'i', 's': 't', 'ts': self.now_us()}
+        if args:
+            event['args'] = args
+        self._append(event)
+    
+    def counter(self, name: str, values: Dict[str, float], category: str = 'engine') -> None:
+        self._append({
+            'name': name, 'cat': category, 'ph': 'C', 'ts': self.now_us(), 'args': values,
+        })
+    
+    def get_event_count(self) -> int:
+        with self._lock:
+            return len(self._events)
+    
+    def get_dropped_event_count(self) -> int:
+        return self._dropped_events
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._events = self._events[:1]
+            self._thread_names.clear()
+            self._dropped_events = 0
+    
+    def save(self, file_path: str) -> None:
+        with self._lock:
+            payload = {
+                'traceEvents': list(self._events),
+                'displayTimeUnit': 'ms',
+                'otherData': {'dropped_events': self._dropped_events},
+            }
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+
+
+class ChromeTraceObserver(IStepObserver):
+    
+    def __init__(
+        self,
+        recorder: ChromeTraceRecorder,
+        category: str = 'engine',
+        counter_every: int = 1
+    ):
+        self._recorder = recorder
+        self._category = category
+        self._counter_every = max(1, counter_every)
+        self._started = 0.0
+    
+    def on_pre_step(self, step_number: int, state: State, head_position: int) -> None:
+        self._started = self._recorder.now_us()
+    
+    def on_post_step(self, result: StepResult) -> None:
+        recorder = self._recorder
+        recorder.complete(
+            f"{self._category}.adım", self._category, self._started, recorder.now_us(),
+            {
+                'adım': result.step_number,
+                'durum': f"{result.previous_state.name} → {result.current_state.name}",
+                'okunan': result.read_symbol,
+                'yazılan': result.write_symbol,
+            }
+        )
+        if result.step_number % self._counter_every == 0:
+            recorder.counter(
+                f"{self._category}.kafa",
+                {'konum': result.head_position},
+                self._category
+            )
+    
+    def on_halt(self, result: StepResult) -> None:
+        self._recorder.instant(
+            f"{self._category}.durdu", self._category,
+            {'adım': result.step_number, 'durum': result.current_state.name}
+        )
+    
+    def on_budget(self, step_count: int, max_steps: int) -> None:
+        self._recorder.instant(
+            f"{self._category}.bütçe_aşıldı", self._category,
+            {'adım': step_count, 'sınır': max_steps}
+        )
+
+
+class TracingStepExplainer(IStepExplainer):
+    
+    def __init__(self, inner: IStepExplainer):
+        self._inner = inner
+        self._recorder: Optional[ChromeTraceRecorder] = None
+    
+    def set_recorder(self, recorder: Optional[ChromeTraceRecorder]) -> None:
+        self._recorder = recorder
+    
+    def explain_step(self, step_result: StepResult) -> str:
+        if self._recorder is None:
+            return self._inner.explain_step(step_result)
+        with self._recorder.span('gui.açıklama', 'gui'):
+            return self._inner.explain_step(step_result)
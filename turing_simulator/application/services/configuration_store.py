@@ -0,0 +1,250 @@
+import json
+import re
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, Optional
+from ...domain.entities.tape import Tape
+from ...domain.interfaces.itape import ITape
+from ...domain.interfaces.ituring_machine import ITuringMachine
+
+
+@dataclass
+class MachineConfiguration:
+    machine_fingerprint: str
+    state_name: str
+    head_position: int
+    step_count: int
+    tape: ITape
+    is_halted: bool = False
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def capture(
+        cls,
+        machine: ITuringMachine,
+        tape: ITape,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> 'MachineConfiguration':
+        return cls(
+            machine_fingerprint=machine.get_fingerprint(),
+            state_name=machine.get_current_state().name,
+            head_position=machine.get_head_position(),
+            step_count=machine.get_step_count(),
+            tape=tape.snapshot(),
+            is_halted=machine.is_halted(),
+            metadata=dict(metadata or {})
+        )
+    
+    def apply(self, machine: ITuringMachine) -> None:
+        if machine.get_fingerprint() != self.machine_fingerprint:
+            raise ValueError("Kayıtlı yapılandırma bu makineye ait değil.")
+        for state in machine.get_states():
+            if state.name == self.state_name:
+                machine.restore(
+                    self.tape.fork(), state, self.head_position,
+                    self.step_count, self.is_halted
+                )
+                return
+        raise ValueError(f"Makinede '{self.state_name}' durumu tanımlı değil.")
+
+
+class _StreamWriter:
+    
+    def __init__(self, file: BinaryIO, compress: bool):
+        self._file = file
+        self._compressor = zlib.compressobj(6) if compress else None
+        self._buffer = bytearray()
+    
+    def write(self, data: bytes) -> None:
+        self._buffer += data
+        if len(self._buffer) >= ConfigurationStore.CHUNK_SIZE:
+            self._flush_buffer()
+    
+    def write_varint(self, value: int) -> None:
+        while value > 0x7F:
+            self._buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self._buffer.append(value)
+    
+    def write_signed(self, value: int) -> None:
+        self.write_varint((value << 1) if value >= 0 else ((-value << 1) - 1))
+    
+    def write_text(self, text: str) -> None:
+        data = text.encode('utf-8')
+        self.write_varint(len(data))
+        self.write(data)
+    
+    def _flush_buffer(self) -> None:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        self._file.write(data)
+    
+    def close(self) -> None:
+        self._flush_buffer()
+        if self._compressor is not None:
+            self._file.write(self._compressor.flush())
+
+
+class _StreamReader:
+    
+    def __init__(self, file: BinaryIO, compressed: bool):
+        self._file = file
+        self._decompressor = zlib.decompressobj() if compressed else None
+        self._buffer = b''
+        self._offset = 0
+    
+    def _next_chunk(self) -> bytes:
+        if self._decompressor is None:
+            return self._file.read(ConfigurationStore.CHUNK_SIZE)
+        
+        decompressor = self._decompressor
+        while True:
+            source = (decompressor.unconsumed_tail
+                      or self._file.read(ConfigurationStore.CHUNK_SIZE))
+            if not source:
+                return decompressor.flush()
+            try:
+                chunk = decompressor.decompress(source, ConfigurationStore.CHUNK_SIZE)
+            except zlib.error as e:
+                raise ValueError("Yapılandırma dosyası bozuk.") from e
+            if chunk:
+                return chunk
+    
+    def _fill(self, size: int) -> None:
+        while len(self._buffer) - self._offset < size:
+            chunk = self._next_chunk()
+            if not chunk:
+                raise ValueError("Yapılandırma dosyası beklenenden kısa.")
+            self._buffer = self._buffer[self._offset:] + chunk
+            self._offset = 0
+    
+    def read(self, size: int) -> bytes:
+        self._fill(size)
+        data = self._buffer[self._offset:self._offset + size]
+        self._offset += size
+        return data
+    
+    def read_varint(self) -> int:
+        value = 0
+        shift = 0
+        while True:
+            self._fill(1)
+            byte = self._buffer[self._offset]
+            self._offset += 1
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value
+            shift += 7
+    
+    def read_signed(self) -> int:
+        value = self.read_varint()
+        return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+    
+    def read_text(self) -> str:
+        return self.read(self.read_varint()).decode('utf-8')
+
+
+class ConfigurationStore:
+    
+    MAGIC = b'TMCF'
+    VERSION = 1
+    FLAG_ZLIB = 0x01
+    CHUNK_SIZE = 1 << 16
+    
+    _RUN = re.compile(r'(.)\1*', re.S)
+    
+    def __init__(self, compress: bool = True):
+        self._compress = compress
+    
+    def save(self, file_path: str, configuration: MachineConfiguration) -> None:
+        with open(file_path, 'wb') as f:
+            self.write(f, configuration)
+    
+    def write(self, file: BinaryIO, configuration: MachineConfiguration) -> None:
+        tape = configuration.tape
+        file.write(self.MAGIC)
+        file.write(bytes([self.VERSION, self.FLAG_ZLIB if self._compress else 0]))
+        
+        stream = _StreamWriter(file, self._compress)
+        stream.write_text(configuration.machine_fingerprint)
+        stream.write_text(configuration.state_name)
+        stream.write_text(json.dumps(configuration.metadata, ensure_ascii=False))
+        stream.write(tape.get_blank_symbol().encode('latin-1'))
+        stream.write_signed(configuration.head_position)
+        stream.write_varint(configuration.step_count)
+        stream.write(b'\x01' if configuration.is_halted else b'\x00')
+        
+        if tape.is_empty():
+            start, cell_count = 0, 0
+        else:
+            start, end = tape.get_visible_range()
+            cell_count = end - start + 1
+        stream.write_signed(start)
+        stream.write_varint(cell_count)
+        
+        run_symbol: Optional[str] = None
+        run_length = 0
+        for chunk_start in range(start, start + cell_count, self.CHUNK_SIZE):
+            chunk = tape.read_range(
+                chunk_start, min(chunk_start + self.CHUNK_SIZE, start + cell_count)
+            )
+            for match in self._RUN.finditer(chunk):
+                symbol = match.group(1)
+                if symbol == run_symbol:
+                    run_length += match.end() - match.start()
+                    continue
+                if run_symbol is not None:
+                    stream.write(run_symbol.encode('latin-1'))
+                    stream.write_varint(run_length)
+                run_symbol = symbol
+                run_length = match.end() - match.start()
+        if run_symbol is not None:
+            stream.write(run_symbol.encode('latin-1'))
+            stream.write_varint(run_length)
+        stream.close()
+    
+    def load(self, file_path: str) -> MachineConfiguration:
+        with open(file_path, 'rb') as f:
+            return self.read(f)
+    
+    def read(self, file: BinaryIO) -> MachineConfiguration:
+        header = file.read(len(self.MAGIC) + 2)
+        if len(header) != len(self.MAGIC) + 2 or header[:len(self.MAGIC)] != self.MAGIC:
+            raise ValueError("Geçersiz yapılandırma dosyası.")
+        version, flags = header[len(self.MAGIC)], header[len(self.MAGIC) + 1]
+        if version != self.VERSION:
+            raise ValueError(f"Desteklenmeyen yapılandırma sürümü: {version}")
+        
+        stream = _StreamReader(file, bool(flags & self.FLAG_ZLIB))
+        fingerprint = stream.read_text()
+        state_name = stream.read_text()
+        metadata = json.loads(stream.read_text())
+        blank_symbol = stream.read(1).decode('latin-1')
+        head_position = stream.read_signed()
+        step_count = stream.read_varint()
+        is_halted = stream.read(1) == b'\x01'
+        
+        tape = Tape(blank_symbol=blank_symbol)
+        position = stream.read_signed()
+        remaining = stream.read_varint()
+        while remaining > 0:
+            symbol = stream.read(1).decode('latin-1')
+            length = stream.read_varint()
+            if length == 0 or length > remaining:
+                raise ValueError("Yapılandırma dosyası bozuk.")
+            if symbol != blank_symbol:
+                tape.fill(position, position + length, symbol)
+            position += length
+            remaining -= length
+        
+        return MachineConfiguration(
+            machine_fingerprint=fingerprint,
+            state_name=state_name,
+            head_position=head_position,
+            step_count=step_count,
+            tape=tape,
+            is_halted=is_halted,
+            metadata=metadata
+        )
@@ -0,0 +1,179 @@
+import multiprocessing
+import queue
+import time
+from typing import List, Optional, Tuple
+from ...domain.entities.shared_tape import SharedConfiguration, SharedTape
+from ...domain.entities.turing_machine import TuringMachine
+from ...domain.engine.generated_runner import GeneratedRunner
+from ...domain.machines.machine_registry import create_machine
+
+
+def _engine_main(
+    tape_name: str,
+    machine_id: str,
+    chunk_steps: int,
+    publish_interval: float,
+    max_steps: int,
+    running,
+    stopping,
+    messages
+) -> None:
+    tape = SharedTape.attach(tape_name, read_only=False)
+    try:
+        machine = create_machine(machine_id)
+        runner = GeneratedRunner(machine)
+        states = runner.get_states()
+        capacity = tape.get_capacity()
+        origin = tape.get_origin()
+        
+        cells = bytearray(tape.read_cells())
+        configuration = tape.read_configuration()
+        head = configuration.head_position - origin
+        state_id = runner.get_state_id(configuration.state_name)
+        step_count = configuration.step_count
+        is_halted = False
+        last_publish = time.perf_counter()
+        
+        while not is_halted and step_count < max_steps and not stopping.is_set():
+            if not running.is_set():
+                tape.publish(cells, origin + head, step_count, states[state_id].name)
+                while not running.wait(0.1):
+                    if stopping.is_set():
+                        break
+                continue
+            
+            budget = min(chunk_steps, max_steps - step_count)
+            state_id, head, steps, is_halted, shift = runner.advance(
+                cells, head, state_id, budget
+            )
+            step_count += steps
+            if shift or len(cells) != capacity:
+                messages.put(('error', f"Paylaşılan şerit kapasitesi ({capacity}) aşıldı."))
+                return
+            
+            now = time.perf_counter()
+            if is_halted or now - last_publish >= publish_interval:
+                tape.publish(
+                    cells, origin + head, step_count, states[state_id].name, is_halted
+                )
+                last_publish = now
+        
+        tape.publish(cells, origin + head, step_count, states[state_id].name, is_halted)
+        if is_halted:
+            messages.put(('halted', step_count))
+        elif step_count >= max_steps:
+            messages.put((
+                'error',
+                f"Makine {max_steps} adım içinde durmadı. Sonsuz döngü olabilir."
+            ))
+    except Exception as e:
+        messages.put(('error', str(e)))
+    finally:
+        tape.close()
+
+
+class EngineProcess:
+    
+    DEFAULT_CAPACITY = 1 << 20
+    CHUNK_STEPS = 20000
+    PUBLISH_INTERVAL = 1 / 60
+    
+    def __init__(
+        self,
+        machine_id: str,
+        capacity: int = DEFAULT_CAPACITY,
+        chunk_steps: int = CHUNK_STEPS,
+        publish_interval: float = PUBLISH_INTERVAL,
+        max_steps: int = TuringMachine.MAX_STEPS
+    ):
+        self._machine_id = machine_id
+        self._capacity = capacity
+        self._chunk_steps = chunk_steps
+        self._publish_interval = publish_interval
+        self._max_steps = max_steps
+        self._context = multiprocessing.get_context('spawn')
+        self._tape: Optional[SharedTape] = None
+        self._view: Optional[SharedTape] = None
+        self._process = None
+        self._running = None
+        self._stopping = None
+        self._messages = None
+    
+    def start(self, symbols: List[str], start_position: int = 0) -> SharedTape:
+        if self._process is not None:
+            raise RuntimeError("Motor süreci zaten çalışıyor.")
+        
+        machine = create_machine(self._machine_id)
+        tape = SharedTape.create(self._capacity, blank_symbol=machine.get_blank_symbol())
+        cells = bytearray(self._capacity)
+        for offset, symbol in enumerate(symbols):
+            if symbol != machine.get_blank_symbol():
+                cells[start_position + offset - tape.get_origin()] = ord(symbol)
+        tape.publish(cells, 0, 0, machine.get_initial_state().name)
+        
+        self._tape = tape
+        self._view = SharedTape.attach(tape.get_name(), read_only=True)
+        self._running = self._context.Event()
+        self._running.set()
+        self._stopping = self._context.Event()
+        self._messages = self._context.Queue()
+        self._process = self._context.Process(
+            target=_engine_main,
+            args=(
+                tape.get_name(), self._machine_id, self._chunk_steps,
+                self._publish_interval, self._max_steps,
+                self._running, self._stopping, self._messages
+            ),
+            daemon=True
+        )
+        self._process.start()
+        return self._view
+    
+    def get_tape(self) -> Optional[SharedTape]:
+        return self._view
+    
+    def read_configuration(self) -> Optional[SharedConfiguration]:
+        if self._view is None:
+            return None
+        return self._view.read_configuration()
+    
+    def poll_message(self) -> Optional[Tuple[str, object]]:
+        if self._messages is None:
+            return None
+        try:
+            return self._messages.get_nowait()
+        except queue.Empty:
+            return None
+    
+    def pause(self) -> None:
+        if self._running is not None:
+            self._running.clear()
+    
+    def resume(self) -> None:
+        if self._running is not None:
+            self._running.set()
+    
+    def is_paused(self) -> bool:
+        return self._running is not None and not self._running.is_set()
+    
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+    
+    def stop(self, timeout: float = 2.0) -> None:
+        if self._process is not None:
+            self._stopping.set()
+            self._running.set()
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+            self._process = None
+        if self._messages is not None:
+            self._messages.close()
+            self._messages = None
+        if self._view is not None:
+            self._view.close()
+            self._view = None
+        if self._tape is not None:
+            self._tape.close()
+            self._tape = None
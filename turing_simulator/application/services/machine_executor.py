@@ -1,14 +1,26 @@
+import time
 from typing import Callable, Optional
 from ...domain.interfaces.ituring_machine import ITuringMachine
 from ...domain.interfaces.itape import ITape
 from ...domain.interfaces.istep_explainer import IStepExplainer
+from ...domain.entities.state import State
 from ...domain.entities.step_result import StepResult
+from ...domain.entities.tape_text_window import TapeTextTracker
+from ...domain.entities.run_summary import RunSummary
+from ...domain.entities.turing_machine import TuringMachine
+from ...domain.engine.macro_runner import MacroRunner
+from .result_cache import CachedRun, ResultCache
 
 
 class MachineExecutor:
     
-    def __init__(self, step_explainer: IStepExplainer):
+    def __init__(
+        self,
+        step_explainer: IStepExplainer,
+        result_cache: Optional[ResultCache] = None
+    ):
         self._step_explainer = step_explainer
+        self._result_cache = result_cache
     
     def execute_with_explanation(
         self,
@@ -24,11 +36,81 @@ class MachineExecutor:
             if step_callback:
                 step_callback(result)
         
+        machine.set_tape_window_radius(TapeTextTracker.RADIUS)
         return machine.execute(initial_tape, enhanced_callback)
     
     def step_with_explanation(self, machine: ITuringMachine) -> StepResult:
-        result = machine.step()
+        machine.set_tape_window_radius(TapeTextTracker.RADIUS)
+        return self.explain(machine.step())
+    
+    def explain(self, result: StepResult) -> StepResult:
         explanation = self._step_explainer.explain_step(result)
         result.explanation = explanation
         return result
+    
+    def run_cached(
+        self,
+        machine: TuringMachine,
+        initial_tape: ITape,
+        max_steps: int = TuringMachine.MAX_STEPS
+    ) -> RunSummary:
+        started = time.perf_counter()
+        machine_hash = machine.get_fingerprint()
+        key = None
+        
+        if self._result_cache is not None:
+            key = ResultCache.make_key(machine_hash, initial_tape)
+            cached = self._result_cache.get(key)
+            if cached is not None and cached.step_count < max_steps:
+                self._restore_tape(initial_tape, cached)
+                statistics = dict(cached.statistics)
+                statistics['cache_hit'] = 1
+                statistics['elapsed_seconds'] = time.perf_counter() - started
+                return RunSummary(
+                    final_state=self._find_state(machine, cached.state_name),
+                    head_position=cached.head_position,
+                    step_count=cached.step_count,
+                    is_halted=cached.is_halted,
+                    statistics=statistics
+                )
+        
+        summary = MacroRunner(machine).run(initial_tape, max_steps)
+        summary.statistics['cache_hit'] = 0
+        
+        if self._result_cache is not None:
+            if initial_tape.is_empty():
+                tape_start, tape = 0, ""
+            else:
+                tape_start, tape_end = initial_tape.get_visible_range()
+                tape = initial_tape.read_range(tape_start, tape_end + 1)
+            self._result_cache.put(key, machine_hash, CachedRun(
+                state_name=summary.final_state.name,
+                head_position=summary.head_position,
+                step_count=summary.step_count,
+                is_halted=summary.is_halted,
+                tape_start=tape_start,
+                tape=tape,
+                statistics={
+                    name: value for name, value in summary.statistics.items()
+                    if name != 'cache_hit'
+                }
+            ))
+        
+        return summary
+    
+    def _restore_tape(self, tape: ITape, cached: CachedRun) -> None:
+        if not tape.is_empty():
+            start, end = tape.get_visible_range()
+            blank = tape.get_blank_symbol()
+            for position in range(start, end + 1):
+                tape.write(position, blank)
+        
+        for offset, symbol in enumerate(cached.tape):
+            tape.write(cached.tape_start + offset, symbol)
+    
+    def _find_state(self, machine: TuringMachine, name: str) -> State:
+        for state in machine.get_states():
+            if state.name == name:
+                return state
+        return State(name=name)
 
@@ -0,0 +1,236 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from ...domain.entities.tape import Tape
+from ...domain.interfaces.itape import ITape
+from ...domain.engine.engine_selector import create_fastest_runner
+from ...domain.machines.machine_registry import create_machine
+
+
+def multiply_spec(n: int, m: int) -> int:
+    return n * m
+
+
+def unary_input(n: int, m: int) -> List[str]:
+    return ['0'] * n + ['1'] * m
+
+
+def count_twos(tape: ITape) -> int:
+    return tape.count_symbol('2')
+
+
+def default_step_budget(n: int, m: int) -> int:
+    product = (n + 1) * (m + 1)
+    return 2 * product * (product + n + m + 2)
+
+
+@dataclass
+class Counterexample:
+    n: int
+    m: int
+    expected: Optional[int]
+    actual: Optional[int]
+    step_count: int
+    reason: str
+    
+    def __str__(self) -> str:
+        return (f"n={self.n}, m={self.m}: beklenen {self.expected}, "
+                f"bulunan {self.actual} ({self.reason}, {self.step_count} adım)")
+
+
+@dataclass
+class ShardResult:
+    shard_index: int
+    checked: List[Tuple[int, int]]
+    counterexamples: List[Counterexample]
+    step_count: int
+    elapsed_seconds: float
+
+
+@dataclass
+class VerificationReport:
+    machine_id: str
+    engine: str
+    total_inputs: int
+    checked_inputs: int = 0
+    step_count: int = 0
+    elapsed_seconds: float = 0.0
+    counterexamples: List[Counterexample] = field(default_factory=list)
+    shard_timings: Dict[int, float] = field(default_factory=dict)
+    stopped_early: bool = False
+    
+    def coverage(self) -> float:
+        if self.total_inputs == 0:
+            return 1.0
+        return self.checked_inputs / self.total_inputs
+    
+    def is_verified(self) -> bool:
+        return not self.counterexamples and self.checked_inputs == self.total_inputs
+    
+    def __str__(self) -> str:
+        lines = [
+            f"Makine: {self.machine_id} | Motor: {self.engine}",
+            f"Kapsam: {self.checked_inputs}/{self.total_inputs} "
+            f"(%{self.coverage() * 100:.1f})",
+            f"Toplam adım: {self.step_count:,} | Süre: {self.elapsed_seconds:.2f} s",
+        ]
+        if self.elapsed_seconds > 0:
+            lines.append(f"Hız: {self.step_count / self.elapsed_seconds:,.0f} adım/s")
+        if self.shard_timings:
+            slowest = max(self.shard_timings.values())
+            lines.append(
+                f"Parça sayısı: {len(self.shard_timings)} | "
+                f"En yavaş parça: {slowest:.2f} s"
+            )
+        if self.counterexamples:
+            lines.append(f"Karşı örnekler ({len(self.counterexamples)}):")
+            lines.extend(f"  {example}" for example in self.counterexamples)
+        else:
+            lines.append("Karşı örnek bulunamadı.")
+        if self.stopped_early:
+            lines.append("İlk karşı örnekte durduruldu.")
+        return "\n".join(lines)
+
+
+_stop_event = None
+
+
+def _init_worker(stop_event) -> None:
+    global _stop_event
+    _stop_event = stop_event
+
+
+def _verify_shard(
+    shard_index: int,
+    machine_id: str,
+    inputs: List[Tuple[int, int]],
+    spec: Callable[[int, int], int],
+    encoder: Callable[[int, int], List[str]],
+    decoder: Callable[[ITape], int],
+    step_budget: Callable[[int, int], int],
+    stop_on_first: bool
+) -> ShardResult:
+    started = time.perf_counter()
+    machine = create_machine(machine_id)
+    runner = create_fastest_runner(machine)
+    checked = []
+    counterexamples = []
+    step_count = 0
+    
+    for n, m in inputs:
+        if _stop_event is not None and _stop_event.is_set():
+            break
+        
+        expected = spec(n, m)
+        tape = Tape(blank_symbol=machine.get_blank_symbol())
+        tape.initialize_from_list(encoder(n, m), start_position=0)
+        try:
+            summary = runner.run(tape, step_budget(n, m))
+        except RuntimeError as e:
+            counterexamples.append(
+                Counterexample(n, m, expected, None, step_budget(n, m), str(e))
+            )
+        else:
+            step_count += summary.step_count
+            actual = decoder(tape)
+            if actual != expected:
+                counterexamples.append(
+                    Counterexample(n, m, expected, actual, summary.step_count, "yanlış çıktı")
+                )
+        checked.append((n, m))
+        
+        if counterexamples and stop_on_first:
+            if _stop_event is not None:
+                _stop_event.set()
+            break
+    
+    return ShardResult(
+        shard_index, checked, counterexamples, step_count,
+        time.perf_counter() - started
+    )
+
+
+class MachineVerifier:
+    
+    def __init__(
+        self,
+        machine_id: str = 'multiply',
+        spec: Callable[[int, int], int] = multiply_spec,
+        encoder: Callable[[int, int], List[str]] = unary_input,
+        decoder: Callable[[ITape], int] = count_twos,
+        step_budget: Callable[[int, int], int] = default_step_budget,
+        workers: Optional[int] = None
+    ):
+        self._machine_id = machine_id
+        self._spec = spec
+        self._encoder = encoder
+        self._decoder = decoder
+        self._step_budget = step_budget
+        self._workers = workers or os.cpu_count() or 1
+    
+    def verify(
+        self,
+        max_n: int,
+        max_m: int,
+        min_n: int = 1,
+        min_m: int = 1,
+        stop_on_first: bool = False,
+        shard_count: Optional[int] = None
+    ) -> VerificationReport:
+        inputs = [
+            (n, m)
+            for n in range(min_n, max_n + 1)
+            for m in range(min_m, max_m + 1)
+        ]
+        inputs.sort(key=lambda pair: self._step_budget(*pair), reverse=True)
+        
+        shard_count = max(1, min(len(inputs), shard_count or self._workers * 4))
+        shards = [inputs[index::shard_count] for index in range(shard_count)]
+        
+        machine = create_machine(self._machine_id)
+        report = VerificationReport(
+            machine_id=self._machine_id,
+            engine=type(create_fastest_runner(machine)).__name__,
+            total_inputs=len(inputs)
+        )
+        
+        started = time.perf_counter()
+        context = multiprocessing.get_context()
+        stop_event = context.Event()
+        with ProcessPoolExecutor(
+            max_workers=self._workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(stop_event,)
+        ) as executor:
+            pending = {
+                executor.submit(
+                    _verify_shard, index, self._machine_id, shard, self._spec,
+                    self._encoder, self._decoder, self._step_budget, stop_on_first
+                )
+                for index, shard in enumerate(shards) if shard
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if not future.cancelled():
+                        self._merge(report, future.result())
+                
+                if stop_on_first and report.counterexamples:
+                    stop_event.set()
+                    report.stopped_early = True
+                    for future in pending:
+                        future.cancel()
+        
+        report.counterexamples.sort(key=lambda example: (example.n, example.m))
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+    
+    def _merge(self, report: VerificationReport, result: ShardResult) -> None:
+        report.checked_inputs += len(result.checked)
+        report.step_count += result.step_count
+        report.counterexamples.extend(result.counterexamples)
+        report.shard_timings[result.shard_index] = result.elapsed_seconds
@@ -0,0 +1,123 @@
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Union
+from ...domain.interfaces.itape import ITape
+
+
+OutputDecoder = Callable[[ITape], int]
+
+
+def symbol_counter(symbol: str) -> OutputDecoder:
+    def decode(tape: ITape) -> int:
+        return tape.count_symbol(symbol)
+    return decode
+
+
+def used_bytes(tape: ITape) -> bytes:
+    if tape.is_empty():
+        return b""
+    low, high = tape.get_visible_range()
+    data = bytes(tape.read_range_bytes(low, high + 1))
+    return data.translate(bytes.maketrans(b'\x00', tape.get_blank_symbol().encode('latin-1')))
+
+
+@dataclass
+class CheckResult:
+    description: str
+    passed: bool
+    expected: object
+    actual: object
+    
+    def __str__(self) -> str:
+        mark = "✓" if self.passed else "✗"
+        return f"{mark} {self.description}: beklenen {self.expected}, bulunan {self.actual}"
+
+
+@dataclass
+class OutputReport:
+    results: List[CheckResult] = field(default_factory=list)
+    
+    def is_valid(self) -> bool:
+        return all(result.passed for result in self.results)
+    
+    def get_failures(self) -> List[CheckResult]:
+        return [result for result in self.results if not result.passed]
+    
+    def __str__(self) -> str:
+        return "\n".join(str(result) for result in self.results)
+
+
+class OutputCheck(ABC):
+    
+    @abstractmethod
+    def check(self, tape: ITape) -> CheckResult:
+        pass
+
+
+class SymbolCountCheck(OutputCheck):
+    
+    def __init__(self, symbol: str, expected: int):
+        self._symbol = symbol
+        self._expected = expected
+    
+    def check(self, tape: ITape) -> CheckResult:
+        actual = tape.count_symbol(self._symbol)
+        return CheckResult(
+            f"'{self._symbol}' sayısı", actual == self._expected, self._expected, actual
+        )
+
+
+class DecodedValueCheck(OutputCheck):
+    
+    def __init__(self, description: str, decoder: OutputDecoder, expected: int):
+        self._description = description
+        self._decoder = decoder
+        self._expected = expected
+    
+    def check(self, tape: ITape) -> CheckResult:
+        actual = self._decoder(tape)
+        return CheckResult(self._description, actual == self._expected, self._expected, actual)
+
+
+class TapeRegexCheck(OutputCheck):
+    
+    PREVIEW_LENGTH = 40
+    
+    def __init__(self, pattern: Union[str, bytes], description: Optional[str] = None):
+        if isinstance(pattern, str):
+            pattern = pattern.encode('latin-1')
+        self._pattern = re.compile(pattern)
+        self._description = description or "Şerit deseni"
+    
+    def check(self, tape: ITape) -> CheckResult:
+        data = used_bytes(tape)
+        actual = data[:self.PREVIEW_LENGTH].decode('latin-1')
+        if len(data) > self.PREVIEW_LENGTH:
+            actual += "…"
+        return CheckResult(
+            self._description,
+            self._pattern.fullmatch(data) is not None,
+            self._pattern.pattern.decode('latin-1'),
+            actual
+        )
+
+
+class OutputVerifier:
+    
+    def __init__(self, checks: Sequence[OutputCheck]):
+        self._checks = list(checks)
+    
+    def verify(self, tape: ITape) -> OutputReport:
+        return OutputReport([check.check(tape) for check in self._checks])
+
+
+def multiply_output_verifier(n: int, m: int) -> OutputVerifier:
+    if n < 0 or m < 0:
+        raise ValueError("n ve m negatif olamaz.")
+    if not n or not m:
+        return OutputVerifier([SymbolCountCheck('2', 0)])
+    return OutputVerifier([
+        SymbolCountCheck('2', n * m),
+        TapeRegexCheck(f"X{{{n}}}1{{{m}}}2{{{n * m}}}", "Çıkış biçimi X^n 1^m 2^(n·m)"),
+    ])
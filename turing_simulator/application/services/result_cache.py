@@ -0,0 +1,191 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from ...domain.interfaces.itape import ITape
+
+
+@dataclass
+class CachedRun:
+    state_name: str
+    head_position: int
+    step_count: int
+    is_halted: bool
+    tape_start: int
+    tape: str
+    statistics: Dict[str, float] = field(default_factory=dict)
+    
+    def to_bytes(self) -> bytes:
+        payload = {
+            'state': self.state_name,
+            'head': self.head_position,
+            'steps': self.step_count,
+            'halted': self.is_halted,
+            'tape_start': self.tape_start,
+            'tape': self.tape,
+            'statistics': self.statistics,
+        }
+        return zlib.compress(json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CachedRun':
+        payload = json.loads(zlib.decompress(data).decode('utf-8'))
+        return cls(
+            state_name=payload['state'],
+            head_position=payload['head'],
+            step_count=payload['steps'],
+            is_halted=payload['halted'],
+            tape_start=payload['tape_start'],
+            tape=payload['tape'],
+            statistics=payload['statistics']
+        )
+
+
+class ResultCache:
+    
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        memory_entries: int = 256,
+        max_disk_bytes: int = 64 * 1024 * 1024
+    ):
+        self._memory: "OrderedDict[str, CachedRun]" = OrderedDict()
+        self._memory_entries = memory_entries
+        self._max_disk_bytes = max_disk_bytes
+        self._lock = threading.Lock()
+        self._stats = {
+            'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'disk_evictions': 0,
+        }
+        
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " machine_hash TEXT NOT NULL,"
+                " payload BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_access "
+                "ON results (last_access)"
+            )
+            self._db.commit()
+    
+    @staticmethod
+    def make_key(machine_hash: str, tape: ITape) -> str:
+        digest = hashlib.sha256(machine_hash.encode('ascii'))
+        if not tape.is_empty():
+            start, end = tape.get_visible_range()
+            digest.update(str(start).encode('ascii'))
+            digest.update(b':')
+            digest.update(tape.read_range(start, end + 1).encode('utf-8'))
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[CachedRun]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._stats['memory_hits'] += 1
+                return entry
+            
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT payload FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._db.execute(
+                        "UPDATE results SET last_access = ? WHERE key = ?",
+                        (time.time(), key)
+                    )
+                    entry = CachedRun.from_bytes(row[0])
+                    self._remember(key, entry)
+                    self._stats['disk_hits'] += 1
+                    return entry
+            
+            self._stats['misses'] += 1
+            return None
+    
+    def put(self, key: str, machine_hash: str, entry: CachedRun) -> None:
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is None:
+                return
+            
+            payload = entry.to_bytes()
+            self._db.execute(
+                "INSERT OR REPLACE INTO results "
+                "(key, machine_hash, payload, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, machine_hash, payload, len(payload), time.time())
+            )
+            self._evict_disk()
+            self._db.commit()
+    
+    def _remember(self, key: str, entry: CachedRun) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+    
+    def _evict_disk(self) -> None:
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()[0]
+        while total > self._max_disk_bytes:
+            row = self._db.execute(
+                "SELECT key, size FROM results ORDER BY last_access LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._db.execute("DELETE FROM results WHERE key = ?", (row[0],))
+            self._memory.pop(row[0], None)
+            total -= row[1]
+            self._stats['disk_evictions'] += 1
+    
+    def invalidate_machine(self, machine_hash: str) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute(
+                    "DELETE FROM results WHERE machine_hash = ?", (machine_hash,)
+                )
+                self._db.commit()
+    
+    def retain_machines(self, machine_hashes: list) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                placeholders = ", ".join("?" for _ in machine_hashes) or "''"
+                self._db.execute(
+                    f"DELETE FROM results WHERE machine_hash NOT IN ({placeholders})",
+                    tuple(machine_hashes)
+                )
+                self._db.commit()
+    
+    def get_statistics(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+            if self._db is not None:
+                count, size = self._db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+                ).fetchone()
+                stats['disk_entries'] = count
+                stats['disk_bytes'] = size
+            return stats
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.commit()
+                self._db.close()
+                self._db = None
@@ -0,0 +1,498 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import struct
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from ...domain.entities.shared_tape import SharedTape
+from ...domain.entities.tape import Tape
+from ...domain.entities.turing_machine import TuringMachine
+from ...domain.engine.compiled_table import CompiledTransitionTable
+from ...domain.engine.generated_runner import GeneratedRunner
+from ...domain.engine.macro_runner import MacroRunner
+from ...domain.interfaces.itape import ITape
+from ...domain.machines.machine_registry import create_machine
+from .machine_verifier import default_step_budget, unary_input
+
+
+TraceStep = Tuple[str, str, str, str, int, str]
+
+_HEAD = struct.Struct('<q')
+
+
+def encode_step(step: TraceStep) -> bytes:
+    previous_state, read_symbol, write_symbol, direction, head, current_state = step
+    return (
+        f"{previous_state}\x1f{read_symbol}{write_symbol}{direction or '-'}"
+        f"{current_state}\x1e"
+    ).encode('utf-8') + _HEAD.pack(head)
+
+
+def format_step(step: Optional[TraceStep]) -> str:
+    if step is None:
+        return "iz sonu"
+    previous_state, read_symbol, write_symbol, direction, head, current_state = step
+    return (f"{previous_state} '{read_symbol}' → '{write_symbol}', "
+            f"{direction or '-'}, {current_state}, kafa={head}")
+
+
+def tape_digest(tape: ITape) -> str:
+    digest = hashlib.sha256()
+    if not tape.is_empty():
+        low, high = tape.get_visible_range()
+        digest.update(_HEAD.pack(low))
+        digest.update(bytes(tape.read_range_bytes(low, high + 1)))
+    return digest.hexdigest()
+
+
+class TraceHasher:
+    
+    def __init__(self, interval: int):
+        self._interval = interval
+        self._digest = hashlib.blake2b(digest_size=16)
+        self._step_count = 0
+        self.checkpoints: List[str] = []
+    
+    def update(self, step: TraceStep) -> Optional[int]:
+        self._digest.update(encode_step(step))
+        self._step_count += 1
+        if self._step_count % self._interval == 0:
+            self.checkpoints.append(self._digest.hexdigest())
+            return len(self.checkpoints) - 1
+        return None
+    
+    def get_step_count(self) -> int:
+        return self._step_count
+    
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+@dataclass
+class GoldenTrace:
+    n: int
+    m: int
+    step_count: int
+    trace_hash: str
+    checkpoints: List[str]
+    final_state: str
+    head_position: int
+    tape_hash: str
+
+
+@dataclass
+class GoldenFile:
+    machine_id: str
+    fingerprint: str
+    interval: int
+    traces: Dict[Tuple[int, int], GoldenTrace] = field(default_factory=dict)
+    
+    def save(self, path: str) -> None:
+        data = {
+            'machine_id': self.machine_id,
+            'fingerprint': self.fingerprint,
+            'interval': self.interval,
+            'traces': [asdict(trace) for _, trace in sorted(self.traces.items())],
+        }
+        temporary = path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as handle:
+            json.dump(data, handle, indent=1)
+            handle.write("\n")
+        os.replace(temporary, path)
+    
+    @classmethod
+    def load(cls, path: str) -> 'GoldenFile':
+        with open(path, encoding='utf-8') as handle:
+            data = json.load(handle)
+        traces = [GoldenTrace(**trace) for trace in data['traces']]
+        return cls(
+            machine_id=data['machine_id'],
+            fingerprint=data['fingerprint'],
+            interval=data['interval'],
+            traces={(trace.n, trace.m): trace for trace in traces}
+        )
+
+
+def reference_trace(machine: TuringMachine, tape: ITape, budget: int) -> Iterator[TraceStep]:
+    machine.reset(tape)
+    while not machine.is_halted() and machine.get_step_count() < budget:
+        result = machine.step()
+        yield (
+            result.previous_state.name, result.read_symbol, result.write_symbol,
+            result.direction, result.head_position, result.current_state.name
+        )
+
+
+def shared_tape_trace(machine: TuringMachine, tape: ITape, budget: int) -> Iterator[TraceStep]:
+    capacity = max(1 << 16, 4 * (len(tape.get_all_symbols()) + budget // 64))
+    shared = SharedTape.create(capacity, blank_symbol=machine.get_blank_symbol())
+    try:
+        for position, symbol in tape.get_all_symbols().items():
+            shared.write(position, symbol)
+        yield from reference_trace(machine, shared, budget)
+    finally:
+        shared.close()
+
+
+def compiled_trace(machine: TuringMachine, tape: ITape, budget: int) -> Iterator[TraceStep]:
+    table = CompiledTransitionTable.from_machine(machine)
+    next_states, writes, moves = table.get_columns()
+    stride = table.get_stride()
+    transitions = machine.get_transitions()
+    cells: Dict[int, int] = {
+        position: table.encode_symbol(symbol)
+        for position, symbol in tape.get_all_symbols().items()
+    }
+    state_id = table.get_initial_state_id()
+    head = 0
+    for _ in range(budget):
+        symbol_id = cells.get(head, 0)
+        state = table.state(state_id)
+        read_symbol = table.decode_symbol(symbol_id)
+        index = state_id * stride + symbol_id
+        if symbol_id >= stride or next_states[index] == table.NO_TRANSITION:
+            yield (state.name, read_symbol, read_symbol, '', head, state.name)
+            return
+        cells[head] = writes[index]
+        head += moves[index]
+        state_id = next_states[index]
+        yield (
+            state.name, read_symbol, table.decode_symbol(writes[index]),
+            transitions[(state, read_symbol)].direction, head, table.state(state_id).name
+        )
+        if table.is_final(state_id):
+            return
+
+
+def generated_trace(machine: TuringMachine, tape: ITape, budget: int) -> Iterator[TraceStep]:
+    runner = GeneratedRunner(machine)
+    states = runner.get_states()
+    blank = machine.get_blank_symbol()
+    transitions = machine.get_transitions()
+    symbols = tape.get_all_symbols()
+    origin = min(min(symbols, default=0), 0) - GeneratedRunner.GROWTH
+    cells = bytearray(max(max(symbols, default=0), 0) - origin + GeneratedRunner.GROWTH)
+    for position, symbol in symbols.items():
+        cells[position - origin] = ord(symbol)
+    
+    state_id = runner.get_state_id(machine.get_initial_state().name)
+    head = -origin
+    for _ in range(budget):
+        previous = states[state_id]
+        read_code = cells[head]
+        state_id, new_head, _, is_halted, shift = runner.advance(cells, head, state_id, 1)
+        head += shift
+        origin -= shift
+        read_symbol = chr(read_code) if read_code else blank
+        write_code = cells[head]
+        transition = transitions.get((previous, read_symbol))
+        direction = {-1: 'L', 1: 'R'}.get(
+            new_head - head, transition.direction if transition else ''
+        )
+        head = new_head
+        yield (
+            previous.name, read_symbol, chr(write_code) if write_code else blank,
+            direction, origin + head, states[state_id].name
+        )
+        if is_halted:
+            return
+
+
+def macro_summary(machine: TuringMachine, tape: ITape, budget: int) -> Tuple[int, str, int]:
+    summary = MacroRunner(machine).run(tape, budget)
+    return summary.step_count, summary.final_state.name, summary.head_position
+
+
+def generated_summary(machine: TuringMachine, tape: ITape, budget: int) -> Tuple[int, str, int]:
+    summary = GeneratedRunner(machine).run(tape, budget)
+    return summary.step_count, summary.final_state.name, summary.head_position
+
+
+TRACE_ENGINES: Dict[str, Callable[[TuringMachine, ITape, int], Iterator[TraceStep]]] = {
+    'reference': reference_trace,
+    'shared_tape': shared_tape_trace,
+    'compiled': compiled_trace,
+    'generated': generated_trace,
+}
+
+SUMMARY_ENGINES: Dict[str, Callable[[TuringMachine, ITape, int], Tuple[int, str, int]]] = {
+    'macro': macro_summary,
+    'generated_run': generated_summary,
+}
+
+
+def get_engine_names() -> List[str]:
+    return list(TRACE_ENGINES) + list(SUMMARY_ENGINES)
+
+
+@dataclass
+class Divergence:
+    n: int
+    m: int
+    engine: str
+    step_number: Optional[int]
+    expected: str
+    actual: str
+    
+    def __str__(self) -> str:
+        location = f"{self.step_number}. adım" if self.step_number else "son durum"
+        return (f"[{self.engine}] n={self.n}, m={self.m}: {location} farklı\n"
+                f"    beklenen: {self.expected}\n"
+                f"    bulunan:  {self.actual}")
+
+
+@dataclass
+class ReplayReport:
+    machine_id: str
+    engines: List[str]
+    checked: int = 0
+    step_count: int = 0
+    elapsed_seconds: float = 0.0
+    divergences: List[Divergence] = field(default_factory=list)
+    missing: List[Tuple[int, int]] = field(default_factory=list)
+    
+    def is_clean(self) -> bool:
+        return not self.divergences and not self.missing
+    
+    def __str__(self) -> str:
+        lines = [
+            f"Makine: {self.machine_id} | Motorlar: {', '.join(self.engines)}",
+            f"Karşılaştırılan iz: {self.checked} | Toplam adım: {self.step_count:,} | "
+            f"Süre: {self.elapsed_seconds:.2f} s",
+        ]
+        if self.missing:
+            lines.append(
+                "Altın izi olmayan girişler: "
+                + ", ".join(f"({n}, {m})" for n, m in self.missing)
+            )
+        if self.divergences:
+            lines.append(f"Sapmalar ({len(self.divergences)}):")
+            lines.extend(str(divergence) for divergence in self.divergences)
+        else:
+            lines.append("Tüm izler altın izlerle eşleşiyor.")
+        return "\n".join(lines)
+
+
+def _initial_tape(machine: TuringMachine, n: int, m: int) -> Tape:
+    tape = Tape(blank_symbol=machine.get_blank_symbol())
+    tape.initialize_from_list(unary_input(n, m), start_position=0)
+    return tape
+
+
+def record_trace(machine_id: str, n: int, m: int, interval: int) -> GoldenTrace:
+    machine = create_machine(machine_id)
+    tape = _initial_tape(machine, n, m)
+    hasher = TraceHasher(interval)
+    last = None
+    for step in reference_trace(machine, tape, default_step_budget(n, m)):
+        hasher.update(step)
+        last = step
+    if not machine.is_halted():
+        raise RuntimeError(f"n={n}, m={m} için makine adım bütçesi içinde durmadı.")
+    return GoldenTrace(
+        n=n,
+        m=m,
+        step_count=hasher.get_step_count(),
+        trace_hash=hasher.hexdigest(),
+        checkpoints=hasher.checkpoints,
+        final_state=last[5] if last else machine.get_initial_state().name,
+        head_position=machine.get_head_position(),
+        tape_hash=tape_digest(tape)
+    )
+
+
+def _locate_divergence(
+    machine_id: str,
+    golden: GoldenTrace,
+    engine: str,
+    window_start: int,
+    actual_window: List[TraceStep]
+) -> Divergence:
+    machine = create_machine(machine_id)
+    tape = _initial_tape(machine, golden.n, golden.m)
+    expected_window: List[TraceStep] = []
+    for number, step in enumerate(
+        reference_trace(machine, tape, default_step_budget(golden.n, golden.m)), 1
+    ):
+        if number > window_start:
+            expected_window.append(step)
+            if len(expected_window) >= len(actual_window) + 1:
+                break
+    
+    for offset in range(max(len(expected_window), len(actual_window))):
+        expected = expected_window[offset] if offset < len(expected_window) else None
+        actual = actual_window[offset] if offset < len(actual_window) else None
+        if expected != actual:
+            return Divergence(
+                golden.n, golden.m, engine, window_start + offset + 1,
+                format_step(expected), format_step(actual)
+            )
+    return Divergence(
+        golden.n, golden.m, engine, None,
+        f"iz özeti {golden.trace_hash}", "iz özeti farklı"
+    )
+
+
+def _check_trace(
+    machine_id: str,
+    engine: str,
+    golden: GoldenTrace,
+    interval: int
+) -> Tuple[int, Optional[Divergence]]:
+    machine = create_machine(machine_id)
+    tape = _initial_tape(machine, golden.n, golden.m)
+    hasher = TraceHasher(interval)
+    window: deque = deque(maxlen=interval)
+    budget = golden.step_count + 1
+    
+    try:
+        for step in TRACE_ENGINES[engine](machine, tape, budget):
+            window.append(step)
+            checkpoint = hasher.update(step)
+            if checkpoint is None:
+                continue
+            if (checkpoint >= len(golden.checkpoints)
+                    or hasher.checkpoints[checkpoint] != golden.checkpoints[checkpoint]):
+                return hasher.get_step_count(), _locate_divergence(
+                    machine_id, golden, engine,
+                    hasher.get_step_count() - len(window), list(window)
+                )
+    except Exception as e:
+        return hasher.get_step_count(), Divergence(
+            golden.n, golden.m, engine, hasher.get_step_count() + 1,
+            "geçerli adım", f"hata: {e}"
+        )
+    
+    if hasher.get_step_count() != golden.step_count or hasher.hexdigest() != golden.trace_hash:
+        tail = hasher.get_step_count() % interval or len(window)
+        return hasher.get_step_count(), _locate_divergence(
+            machine_id, golden, engine,
+            hasher.get_step_count() - tail, list(window)[len(window) - tail:]
+        )
+    return hasher.get_step_count(), None
+
+
+def _check_summary(
+    machine_id: str,
+    engine: str,
+    golden: GoldenTrace
+) -> Tuple[int, Optional[Divergence]]:
+    machine = create_machine(machine_id)
+    tape = _initial_tape(machine, golden.n, golden.m)
+    expected = (golden.step_count, golden.final_state, golden.head_position, golden.tape_hash)
+    try:
+        step_count, final_state, head = SUMMARY_ENGINES[engine](
+            machine, tape, golden.step_count + 1
+        )
+    except Exception as e:
+        return 0, Divergence(golden.n, golden.m, engine, None, str(expected[:3]), f"hata: {e}")
+    actual = (step_count, final_state, head, tape_digest(tape))
+    if actual != expected:
+        return step_count, Divergence(
+            golden.n, golden.m, engine, None,
+            f"adım={expected[0]}, durum={expected[1]}, kafa={expected[2]}, "
+            f"şerit={expected[3][:12]}",
+            f"adım={actual[0]}, durum={actual[1]}, kafa={actual[2]}, "
+            f"şerit={actual[3][:12]}"
+        )
+    return step_count, None
+
+
+def _replay(
+    machine_id: str,
+    engine: str,
+    golden: GoldenTrace,
+    interval: int
+) -> Tuple[int, Optional[Divergence]]:
+    if engine in TRACE_ENGINES:
+        return _check_trace(machine_id, engine, golden, interval)
+    return _check_summary(machine_id, engine, golden)
+
+
+class TraceRegression:
+    
+    DEFAULT_INTERVAL = 1024
+    
+    def __init__(self, machine_id: str = 'multiply', workers: Optional[int] = None):
+        self._machine_id = machine_id
+        self._workers = workers or os.cpu_count() or 1
+    
+    def _executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._workers, mp_context=multiprocessing.get_context()
+        )
+    
+    def record(
+        self,
+        max_n: int,
+        max_m: int,
+        interval: int = DEFAULT_INTERVAL
+    ) -> GoldenFile:
+        inputs = [(n, m) for n in range(1, max_n + 1) for m in range(1, max_m + 1)]
+        golden = GoldenFile(
+            machine_id=self._machine_id,
+            fingerprint=create_machine(self._machine_id).get_fingerprint(),
+            interval=interval
+        )
+        with self._executor() as executor:
+            futures = [
+                executor.submit(record_trace, self._machine_id, n, m, interval)
+                for n, m in inputs
+            ]
+            for future in futures:
+                trace = future.result()
+                golden.traces[(trace.n, trace.m)] = trace
+        return golden
+    
+    def check(
+        self,
+        golden: GoldenFile,
+        engines: Optional[List[str]] = None,
+        max_n: Optional[int] = None,
+        max_m: Optional[int] = None
+    ) -> ReplayReport:
+        machine = create_machine(self._machine_id)
+        if golden.machine_id != self._machine_id or golden.fingerprint != machine.get_fingerprint():
+            raise ValueError(
+                "Altın iz dosyası bu makineye ait değil; geçiş tablosu değişmiş olabilir. "
+                "İzleri yeniden kaydedin."
+            )
+        
+        engines = engines or get_engine_names()
+        for engine in engines:
+            if engine not in TRACE_ENGINES and engine not in SUMMARY_ENGINES:
+                raise ValueError(f"Bilinmeyen motor: '{engine}'")
+        
+        report = ReplayReport(machine_id=self._machine_id, engines=list(engines))
+        traces = [
+            trace for (n, m), trace in sorted(golden.traces.items())
+            if (max_n is None or n <= max_n) and (max_m is None or m <= max_m)
+        ]
+        for n in range(1, (max_n or 0) + 1):
+            for m in range(1, (max_m or 0) + 1):
+                if (n, m) not in golden.traces:
+                    report.missing.append((n, m))
+        
+        started = time.perf_counter()
+        with self._executor() as executor:
+            futures = [
+                executor.submit(_replay, self._machine_id, engine, trace, golden.interval)
+                for trace in sorted(traces, key=lambda trace: -trace.step_count)
+                for engine in engines
+            ]
+            for future in futures:
+                step_count, divergence = future.result()
+                report.checked += 1
+                report.step_count += step_count
+                if divergence is not None:
+                    report.divergences.append(divergence)
+        
+        report.divergences.sort(
+            key=lambda divergence: (divergence.engine, divergence.n, divergence.m)
+        )
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
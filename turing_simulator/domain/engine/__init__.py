@@ -0,0 +1,14 @@
+from .compiled_table import CompiledTransitionTable
+from .sub_run_cache import SubRunCache, SubRunEntry
+from .macro_runner import MacroRunner
+from .multi_tape_machine import MultiTapeTuringMachine
+from .multi_tape_runner import MultiTapeRunner
+from .step_log import StepCodec, StepLog
+from .transition_analyzer import SweepTransition, TransitionAnalysis, TransitionAnalyzer
+from .generated_runner import GeneratedRunner
+from .engine_selector import Runner, create_fastest_runner
+
+__all__ = ['CompiledTransitionTable', 'SubRunCache', 'SubRunEntry', 'MacroRunner', 'Runner',
+           'create_fastest_runner', 'MultiTapeTuringMachine', 'MultiTapeRunner',
+           'StepCodec', 'StepLog', 'GeneratedRunner',
+           'SweepTransition', 'TransitionAnalysis', 'TransitionAnalyzer']
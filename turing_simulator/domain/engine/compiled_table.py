@@ -0,0 +1,221 @@
+import hashlib
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from ..entities.state import State
+from ..entities.transition import Transition
+from ..entities.multi_tape_transition import MultiTapeTransition
+from ..entities.turing_machine import TuringMachine
+
+
+class CompiledTransitionTable:
+    
+    NO_TRANSITION = -1
+    MAX_SYMBOLS = 256
+    MOVES = {'L': -1, 'R': 1, '': 0, 'S': 0, 'N': 0}
+    
+    def __init__(
+        self,
+        transitions: Dict[Tuple[State, Union[str, Tuple[str, ...]]],
+                          Union[Transition, MultiTapeTransition]],
+        initial_state: State,
+        blank_symbol: str = 'B',
+        final_states: Optional[List[State]] = None,
+        states: Optional[List[State]] = None,
+        tape_count: int = 1
+    ):
+        if tape_count < 1:
+            raise ValueError("Şerit sayısı en az 1 olmalıdır.")
+        
+        self._blank_symbol = blank_symbol
+        self._tape_count = tape_count
+        self._states: List[State] = []
+        self._state_ids: Dict[State, int] = {}
+        self._symbols: List[str] = []
+        self._symbol_ids: Dict[str, int] = {}
+        
+        rows = [
+            self._normalize(from_state, read, transition)
+            for (from_state, read), transition in transitions.items()
+        ]
+        
+        for state in [initial_state] + list(states or []):
+            self._add_state(state)
+        for from_state, _, transition, _, _ in rows:
+            self._add_state(from_state)
+            self._add_state(transition.to_state)
+        for state in final_states or []:
+            self._add_state(state)
+        
+        symbols = set()
+        for _, reads, _, writes, _ in rows:
+            symbols.update(reads)
+            symbols.update(writes)
+        symbols.discard(blank_symbol)
+        for symbol in [blank_symbol] + sorted(symbols):
+            self.encode_symbol(symbol)
+        
+        self._stride = len(self._symbols)
+        self._row_size = self._stride ** tape_count
+        size = len(self._states) * self._row_size
+        self._next_state = array('h', [self.NO_TRANSITION]) * size
+        self._write = array('B', [0]) * (size * tape_count)
+        self._move = array('b', [0]) * (size * tape_count)
+        
+        for from_state, reads, transition, writes, directions in rows:
+            for direction in directions:
+                if direction not in self.MOVES:
+                    raise ValueError(
+                        f"Geçersiz hareket yönü: '{direction}'"
+                    )
+            index = self.index(
+                self._state_ids[from_state],
+                self.combine_symbols([self._symbol_ids[symbol] for symbol in reads])
+            )
+            self._next_state[index] = self._state_ids[transition.to_state]
+            for tape, (symbol, direction) in enumerate(zip(writes, directions)):
+                self._write[index * tape_count + tape] = self._symbol_ids[symbol]
+                self._move[index * tape_count + tape] = self.MOVES[direction]
+        
+        self._initial_state_id = self._state_ids[initial_state]
+        self._final = bytearray(len(self._states))
+        for state in final_states or []:
+            self._final[self._state_ids[state]] = 1
+    
+    @classmethod
+    def from_machine(cls, machine: TuringMachine) -> 'CompiledTransitionTable':
+        return cls(
+            machine.get_transitions(),
+            machine.get_initial_state(),
+            machine.get_blank_symbol(),
+            machine.get_final_states(),
+            machine.get_states(),
+            machine.get_tape_count()
+        )
+    
+    def _normalize(
+        self,
+        from_state: State,
+        read: Union[str, Tuple[str, ...]],
+        transition: Union[Transition, MultiTapeTransition]
+    ) -> Tuple[State, Tuple[str, ...], Union[Transition, MultiTapeTransition],
+               Tuple[str, ...], Tuple[str, ...]]:
+        if isinstance(transition, MultiTapeTransition):
+            reads = tuple(read)
+            writes = transition.write_symbols
+            directions = transition.directions
+        else:
+            reads = (read,)
+            writes = (transition.write_symbol,)
+            directions = (transition.direction,)
+        
+        if not (len(reads) == len(writes) == len(directions) == self._tape_count):
+            raise ValueError(
+                f"Geçiş {self._tape_count} şerit için tanımlanmalıdır: {transition}"
+            )
+        return (from_state, reads, transition, writes, directions)
+    
+    def _add_state(self, state: State) -> None:
+        if state not in self._state_ids:
+            self._state_ids[state] = len(self._states)
+            self._states.append(state)
+    
+    def index(self, state_id: int, symbol_id: int) -> int:
+        return state_id * self._row_size + symbol_id
+    
+    def combine_symbols(self, symbol_ids: Sequence[int]) -> int:
+        combined = 0
+        for symbol_id in reversed(symbol_ids):
+            combined = combined * self._stride + symbol_id
+        return combined
+    
+    def lookup(self, state_id: int, symbol_id: int) -> Optional[Tuple[int, int, int]]:
+        if symbol_id >= self._stride:
+            return None
+        index = state_id * self._row_size + symbol_id
+        next_state = self._next_state[index]
+        if next_state == self.NO_TRANSITION:
+            return None
+        return (next_state, self._write[index], self._move[index])
+    
+    def lookup_vector(
+        self,
+        state_id: int,
+        symbol_ids: Sequence[int]
+    ) -> Optional[Tuple[int, Tuple[int, ...], Tuple[int, ...]]]:
+        if any(symbol_id >= self._stride for symbol_id in symbol_ids):
+            return None
+        index = self.index(state_id, self.combine_symbols(symbol_ids))
+        next_state = self._next_state[index]
+        if next_state == self.NO_TRANSITION:
+            return None
+        base = index * self._tape_count
+        return (
+            next_state,
+            tuple(self._write[base:base + self._tape_count]),
+            tuple(self._move[base:base + self._tape_count])
+        )
+    
+    def encode_symbol(self, symbol: str) -> int:
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self._symbols)
+            if symbol_id >= self.MAX_SYMBOLS:
+                raise ValueError(
+                    f"Derlenmiş tablo en fazla {self.MAX_SYMBOLS} sembol destekler."
+                )
+            self._symbols.append(symbol)
+            self._symbol_ids[symbol] = symbol_id
+        return symbol_id
+    
+    def decode_symbol(self, symbol_id: int) -> str:
+        return self._symbols[symbol_id]
+    
+    def state_id(self, state: State) -> int:
+        return self._state_ids[state]
+    
+    def state(self, state_id: int) -> State:
+        return self._states[state_id]
+    
+    def is_final(self, state_id: int) -> bool:
+        return bool(self._final[state_id])
+    
+    def get_initial_state_id(self) -> int:
+        return self._initial_state_id
+    
+    def get_state_count(self) -> int:
+        return len(self._states)
+    
+    def get_symbol_count(self) -> int:
+        return self._stride
+    
+    def get_stride(self) -> int:
+        return self._stride
+    
+    def get_row_size(self) -> int:
+        return self._row_size
+    
+    def get_tape_count(self) -> int:
+        return self._tape_count
+    
+    def get_blank_symbol(self) -> str:
+        return self._blank_symbol
+    
+    def get_columns(self) -> Tuple[array, array, array]:
+        return (self._next_state, self._write, self._move)
+    
+    def get_final_flags(self) -> bytearray:
+        return self._final
+    
+    def fingerprint(self) -> str:
+        digest = hashlib.sha256()
+        digest.update("\x1f".join(state.name for state in self._states).encode('utf-8'))
+        digest.update(b"\x1e")
+        digest.update("\x1f".join(self._symbols[:self._stride]).encode('utf-8'))
+        digest.update(b"\x1e")
+        digest.update(self._initial_state_id.to_bytes(2, 'little'))
+        digest.update(self._tape_count.to_bytes(1, 'little'))
+        digest.update(bytes(self._final))
+        digest.update(self._next_state.tobytes())
+        digest.update(self._write.tobytes())
+        digest.update(self._move.tobytes())
+        return digest.hexdigest()
@@ -0,0 +1,15 @@
+from typing import Protocol
+from ..entities.run_summary import RunSummary
+from ..entities.turing_machine import TuringMachine
+from ..interfaces.itape import ITape
+from .generated_runner import GeneratedRunner
+
+
+class Runner(Protocol):
+    
+    def run(self, initial_tape: ITape, max_steps: int = TuringMachine.MAX_STEPS) -> RunSummary:
+        ...
+
+
+def create_fastest_runner(machine: TuringMachine) -> Runner:
+    return GeneratedRunner(machine)
@@ -0,0 +1,208 @@
+import re
+import time
+from typing import Callable, Dict, List, Tuple
+from ..entities.run_summary import RunSummary
+from ..entities.state import State
+from ..entities.turing_machine import TuringMachine
+from ..interfaces.itape import ITape
+from .transition_analyzer import TransitionAnalyzer
+
+
+StepFunction = Callable[[bytearray, int, int, int], Tuple[int, int, int, bool, int]]
+
+
+class GeneratedRunner:
+    
+    GROWTH = 256
+    LOOKBEHIND = 1024
+    
+    _functions: Dict[Tuple[str, Tuple[str, ...]], Tuple[StepFunction, str]] = {}
+    
+    def __init__(self, machine: TuringMachine):
+        initial_name = machine.get_initial_state().name
+        self._states: List[State] = sorted(
+            machine.get_states(),
+            key=lambda state: (state.name != initial_name, state.name)
+        )
+        self._state_ids = {state.name: index for index, state in enumerate(self._states)}
+        self._blank_symbol = machine.get_blank_symbol()
+        
+        fingerprint = machine.get_fingerprint()
+        key = (fingerprint, tuple(self._state_ids))
+        cached = GeneratedRunner._functions.get(key)
+        if cached is None:
+            source, namespace = self._generate_source(machine)
+            namespace.update({
+                'PADDING': bytes(self.GROWTH),
+                'GROWTH': self.GROWTH,
+                'LOOKBEHIND': self.LOOKBEHIND
+            })
+            exec(compile(source, f"<turing:{fingerprint[:12]}>", 'exec'), namespace)
+            cached = (namespace['run'], source)
+            GeneratedRunner._functions[key] = cached
+        self._run, self._source = cached
+    
+    def get_source(self) -> str:
+        return self._source
+    
+    def get_states(self) -> List[State]:
+        return list(self._states)
+    
+    def get_state_id(self, state_name: str) -> int:
+        return self._state_ids[state_name]
+    
+    def advance(
+        self,
+        cells: bytearray,
+        head: int,
+        state_id: int,
+        budget: int
+    ) -> Tuple[int, int, int, bool, int]:
+        return self._run(cells, head, state_id, budget)
+    
+    def _encode(self, symbol: str) -> int:
+        if symbol == self._blank_symbol:
+            return 0
+        if len(symbol) != 1 or not 0 < ord(symbol) < 256:
+            raise ValueError(
+                f"Geçersiz şerit sembolü: {symbol!r}. "
+                "Semboller tek karakterlik Latin-1 karakterleri olmalıdır."
+            )
+        return ord(symbol)
+    
+    def _decode(self, code: int) -> str:
+        return chr(code) if code else self._blank_symbol
+    
+    def _generate_source(self, machine: TuringMachine) -> Tuple[str, Dict[str, object]]:
+        analysis = TransitionAnalyzer.analyze(machine)
+        final_names = {state.name for state in machine.get_final_states()}
+        rows: Dict[str, List[Tuple[int, int, int, int]]] = {}
+        for (state, read_symbol), transition in machine.get_transitions().items():
+            move = {'L': -1, 'R': 1}.get(transition.direction, 0)
+            rows.setdefault(state.name, []).append((
+                self._encode(read_symbol),
+                self._encode(transition.write_symbol),
+                move,
+                self._state_ids[transition.to_state.name]
+            ))
+        
+        namespace: Dict[str, object] = {}
+        lines = [
+            "def run(cells, head, state, budget):",
+            "    steps = 0",
+            "    shift = 0",
+            "    while steps < budget:",
+        ]
+        keyword = "if"
+        for state_id, state in enumerate(self._states):
+            lines.append(f"        {keyword} state == {state_id}:")
+            keyword = "elif"
+            lines.append("            while steps < budget:")
+            right_skip = left_skip = b''
+            for sweep in analysis.get_sweeps(state.name):
+                codes = bytes(sorted(self._encode(symbol) for symbol in sweep.symbols))
+                if sweep.direction == 'R':
+                    right_skip = codes
+                else:
+                    left_skip = codes
+            if right_skip:
+                pattern = b'[' + b''.join(re.escape(bytes([code])) for code in right_skip) + b']+'
+                namespace[f'SKIP_RIGHT_{state_id}'] = re.compile(pattern).match
+                lines.append(f"                run = SKIP_RIGHT_{state_id}(cells, head)")
+                lines.append("                if run:")
+                lines.append("                    end = min(run.end(), head + budget - steps)")
+                lines.append("                    steps += end - head")
+                lines.append("                    head = end")
+                lines.append("                    if head == len(cells):")
+                lines.append("                        cells.extend(PADDING)")
+                lines.append("                    continue")
+            if left_skip:
+                namespace[f'SKIP_LEFT_{state_id}'] = left_skip
+                lines.append("                low = head - LOOKBEHIND if head > LOOKBEHIND else 0")
+                lines.append(
+                    f"                run = head + 1 - low - len(cells[low:head + 1]"
+                    f".rstrip(SKIP_LEFT_{state_id}))"
+                )
+                lines.append("                if run:")
+                lines.append("                    run = min(run, budget - steps)")
+                lines.append("                    steps += run")
+                lines.append("                    head -= run")
+                lines.append("                    if head < 0:")
+                lines.append("                        cells[0:0] = PADDING")
+                lines.append("                        head += GROWTH")
+                lines.append("                        shift += GROWTH")
+                lines.append("                    continue")
+            lines.append("                steps += 1")
+            lines.append("                symbol = cells[head]")
+            branch = "if"
+            for read_code, write_code, move, next_id in sorted(rows.get(state.name, [])):
+                lines.append(f"                {branch} symbol == {read_code}:")
+                branch = "elif"
+                if write_code != read_code:
+                    lines.append(f"                    cells[head] = {write_code}")
+                if move < 0:
+                    lines.append("                    head -= 1")
+                    lines.append("                    if head < 0:")
+                    lines.append("                        cells[0:0] = PADDING")
+                    lines.append("                        head += GROWTH")
+                    lines.append("                        shift += GROWTH")
+                elif move > 0:
+                    lines.append("                    head += 1")
+                    lines.append("                    if head == len(cells):")
+                    lines.append("                        cells.extend(PADDING)")
+                if self._states[next_id].name in final_names:
+                    lines.append(
+                        f"                    return {next_id}, head, steps, True, shift"
+                    )
+                elif next_id == state_id:
+                    lines.append("                    continue")
+                else:
+                    lines.append(f"                    state = {next_id}")
+                    lines.append("                    break")
+            if branch == "if":
+                lines.append("                return state, head, steps, True, shift")
+            else:
+                lines.append("                else:")
+                lines.append("                    return state, head, steps, True, shift")
+        lines.append("    return state, head, steps, False, shift")
+        return "\n".join(lines) + "\n", namespace
+    
+    def run(
+        self,
+        initial_tape: ITape,
+        max_steps: int = TuringMachine.MAX_STEPS
+    ) -> RunSummary:
+        started = time.perf_counter()
+        growth = self.GROWTH
+        blank = self._blank_symbol
+        
+        symbols = initial_tape.get_all_symbols()
+        origin = min(min(symbols, default=0), 0) - growth
+        high = max(max(symbols, default=0), 0) + growth
+        cells = bytearray(high - origin + 1)
+        for position, symbol in symbols.items():
+            cells[position - origin] = self._encode(symbol)
+        
+        state_id, head, step_count, is_halted, shift = self._run(cells, -origin, 0, max_steps)
+        origin -= shift
+        
+        if step_count >= max_steps:
+            raise RuntimeError(
+                f"Makine {max_steps} adım içinde durmadı. "
+                "Sonsuz döngü olabilir."
+            )
+        
+        for index, code in enumerate(cells):
+            position = origin + index
+            if code:
+                initial_tape.write(position, self._decode(code))
+            elif initial_tape.read(position) != blank:
+                initial_tape.write(position, blank)
+        
+        return RunSummary(
+            final_state=self._states[state_id],
+            head_position=origin + head,
+            step_count=step_count,
+            is_halted=is_halted,
+            statistics={'elapsed_seconds': time.perf_counter() - started}
+        )
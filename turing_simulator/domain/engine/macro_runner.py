@@ -0,0 +1,135 @@
+import time
+from typing import Optional
+from ..entities.run_summary import RunSummary
+from ..entities.turing_machine import TuringMachine
+from ..interfaces.itape import ITape
+from .compiled_table import CompiledTransitionTable
+from .sub_run_cache import SubRunCache, SubRunEntry
+
+
+class MacroRunner:
+    
+    def __init__(
+        self,
+        machine: TuringMachine,
+        cache: Optional[SubRunCache] = None,
+        max_inner_steps: Optional[int] = None
+    ):
+        self._table = CompiledTransitionTable.from_machine(machine)
+        self._cache = cache if cache is not None else SubRunCache()
+        self._cache.bind(self._table.fingerprint())
+        
+        window_size = self._cache.get_window_size()
+        self._max_inner_steps = max_inner_steps or (
+            window_size * self._table.get_state_count() * 4
+        )
+    
+    def get_cache(self) -> SubRunCache:
+        return self._cache
+    
+    def run(
+        self,
+        initial_tape: ITape,
+        max_steps: int = TuringMachine.MAX_STEPS
+    ) -> RunSummary:
+        started = time.perf_counter()
+        table = self._table
+        cache = self._cache
+        window_size = cache.get_window_size()
+        blank = table.get_blank_symbol()
+        
+        symbols = initial_tape.get_all_symbols()
+        if symbols:
+            low, high = min(symbols), max(symbols)
+        else:
+            low, high = 0, 0
+        origin = (min(low, 0) // window_size) * window_size
+        end = (max(high, 0) // window_size + 1) * window_size
+        cells = bytearray(end - origin)
+        for position, symbol in symbols.items():
+            cells[position - origin] = table.encode_symbol(symbol)
+        
+        state_id = table.get_initial_state_id()
+        head = 0
+        step_count = 0
+        macro_steps = 0
+        is_halted = False
+        
+        while not is_halted and step_count < max_steps:
+            block_start = (head // window_size) * window_size
+            if block_start < origin:
+                grow = origin - block_start
+                cells[0:0] = bytes(grow)
+                origin = block_start
+            index = block_start - origin
+            if index + window_size > len(cells):
+                cells.extend(bytes(index + window_size - len(cells)))
+            
+            window = bytes(cells[index:index + window_size])
+            key = (state_id, head - block_start, window)
+            entry = cache.get(key)
+            if entry is None:
+                entry = self._simulate_window(
+                    window, state_id, head - block_start
+                )
+                cache.put(key, entry)
+            
+            cells[index:index + window_size] = entry.window
+            state_id = entry.exit_state_id
+            head = block_start + entry.exit_offset
+            step_count += entry.step_count
+            is_halted = entry.is_halted
+            macro_steps += 1
+        
+        if step_count >= max_steps:
+            raise RuntimeError(
+                f"Makine {max_steps} adım içinde durmadı. "
+                "Sonsuz döngü olabilir."
+            )
+        
+        for index, symbol_id in enumerate(cells):
+            position = origin + index
+            if symbol_id:
+                initial_tape.write(position, table.decode_symbol(symbol_id))
+            elif initial_tape.read(position) != blank:
+                initial_tape.write(position, blank)
+        
+        statistics = dict(cache.get_statistics())
+        statistics['macro_steps'] = macro_steps
+        statistics['elapsed_seconds'] = time.perf_counter() - started
+        
+        return RunSummary(
+            final_state=table.state(state_id),
+            head_position=head,
+            step_count=step_count,
+            is_halted=is_halted,
+            statistics=statistics
+        )
+    
+    def _simulate_window(
+        self,
+        window: bytes,
+        state_id: int,
+        offset: int
+    ) -> SubRunEntry:
+        table = self._table
+        next_states, writes, moves = table.get_columns()
+        stride = table.get_stride()
+        cells = bytearray(window)
+        size = len(cells)
+        steps = 0
+        
+        while 0 <= offset < size and steps < self._max_inner_steps:
+            symbol_id = cells[offset]
+            steps += 1
+            index = state_id * stride + symbol_id
+            if symbol_id >= stride or next_states[index] == table.NO_TRANSITION:
+                return SubRunEntry(bytes(cells), state_id, offset, steps, True)
+            
+            cells[offset] = writes[index]
+            offset += moves[index]
+            state_id = next_states[index]
+            if table.is_final(state_id):
+                return SubRunEntry(bytes(cells), state_id, offset, steps, True)
+        
+        return SubRunEntry(bytes(cells), state_id, offset, steps, False)
@@ -0,0 +1,168 @@
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from ..entities.state import State
+from ..entities.multi_tape_transition import MultiTapeTransition
+from ..entities.multi_tape_step_result import MultiTapeStepResult
+from ..entities.turing_machine import TuringMachine
+from ..interfaces.itape import ITape
+from .compiled_table import CompiledTransitionTable
+
+
+class MultiTapeTuringMachine:
+    
+    MAX_STEPS = TuringMachine.MAX_STEPS
+    
+    def __init__(
+        self,
+        states: List[State],
+        initial_state: State,
+        transitions: Dict[Tuple[State, Tuple[str, ...]], MultiTapeTransition],
+        tape_count: int,
+        blank_symbol: str = 'B',
+        final_states: Optional[List[State]] = None
+    ):
+        self._states = {state.name: state for state in states}
+        self._initial_state = initial_state
+        self._transitions = dict(transitions)
+        self._tape_count = tape_count
+        self._blank_symbol = blank_symbol
+        self._final_states = list(final_states or [])
+        self._fingerprint: Optional[str] = None
+        self._table = CompiledTransitionTable(
+            transitions, initial_state, blank_symbol,
+            self._final_states, states, tape_count
+        )
+        
+        self._state_id = self._table.get_initial_state_id()
+        self._tapes: List[ITape] = []
+        self._head_positions = [0] * tape_count
+        self._step_count = 0
+        self._is_halted = False
+    
+    def execute(
+        self,
+        initial_tapes: Sequence[ITape],
+        step_callback: Callable[[MultiTapeStepResult], None] = None
+    ) -> Optional[MultiTapeStepResult]:
+        self.reset(initial_tapes)
+        last_result = None
+        
+        while not self.is_halted() and self._step_count < self.MAX_STEPS:
+            result = self.step()
+            last_result = result
+            
+            if step_callback:
+                step_callback(result)
+            
+            if result.is_halted:
+                break
+        
+        if self._step_count >= self.MAX_STEPS:
+            raise RuntimeError(
+                f"Makine {self.MAX_STEPS} adım içinde durmadı. "
+                "Sonsuz döngü olabilir."
+            )
+        
+        return last_result
+    
+    def step(self) -> MultiTapeStepResult:
+        if self._is_halted:
+            raise RuntimeError("Makine zaten durmuş durumda.")
+        
+        if not self._tapes:
+            raise RuntimeError("Şeritler başlatılmamış. reset() çağırın.")
+        
+        table = self._table
+        previous_state = table.state(self._state_id)
+        self._step_count += 1
+        
+        read_symbols = tuple(
+            tape.read(head) for tape, head in zip(self._tapes, self._head_positions)
+        )
+        entry = table.lookup_vector(
+            self._state_id, [table.encode_symbol(symbol) for symbol in read_symbols]
+        )
+        
+        if entry is None:
+            self._is_halted = True
+            return MultiTapeStepResult(
+                step_number=self._step_count,
+                previous_state=previous_state,
+                current_state=previous_state,
+                read_symbols=read_symbols,
+                write_symbols=read_symbols,
+                directions=('',) * self._tape_count,
+                head_positions=tuple(self._head_positions),
+                is_halted=True
+            )
+        
+        next_state_id, writes, moves = entry
+        write_symbols = tuple(table.decode_symbol(symbol_id) for symbol_id in writes)
+        for index, tape in enumerate(self._tapes):
+            tape.write(self._head_positions[index], write_symbols[index])
+            self._head_positions[index] += moves[index]
+        
+        self._state_id = next_state_id
+        if table.is_final(next_state_id):
+            self._is_halted = True
+        
+        transition = self._transitions[(previous_state, read_symbols)]
+        return MultiTapeStepResult(
+            step_number=self._step_count,
+            previous_state=previous_state,
+            current_state=table.state(next_state_id),
+            read_symbols=read_symbols,
+            write_symbols=write_symbols,
+            directions=transition.directions,
+            head_positions=tuple(self._head_positions),
+            transition=transition,
+            is_halted=self._is_halted
+        )
+    
+    def reset(self, tapes: Sequence[ITape]) -> None:
+        if len(tapes) != self._tape_count:
+            raise ValueError(
+                f"Makine {self._tape_count} şerit bekliyor, {len(tapes)} verildi."
+            )
+        self._tapes = list(tapes)
+        self._state_id = self._table.get_initial_state_id()
+        self._head_positions = [0] * self._tape_count
+        self._step_count = 0
+        self._is_halted = False
+    
+    def get_compiled_table(self) -> CompiledTransitionTable:
+        return self._table
+    
+    def get_current_state(self) -> State:
+        return self._table.state(self._state_id)
+    
+    def get_initial_state(self) -> State:
+        return self._initial_state
+    
+    def get_states(self) -> List[State]:
+        return list(self._states.values())
+    
+    def get_final_states(self) -> List[State]:
+        return list(self._final_states)
+    
+    def get_blank_symbol(self) -> str:
+        return self._blank_symbol
+    
+    def get_tape_count(self) -> int:
+        return self._tape_count
+    
+    def get_fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = self._table.fingerprint()
+        return self._fingerprint
+    
+    def get_transitions(self) -> Dict[Tuple[State, Tuple[str, ...]], MultiTapeTransition]:
+        return self._transitions.copy()
+    
+    def is_halted(self) -> bool:
+        return self._is_halted
+    
+    def get_head_positions(self) -> Tuple[int, ...]:
+        return tuple(self._head_positions)
+    
+    def get_step_count(self) -> int:
+        return self._step_count
@@ -0,0 +1,118 @@
+import time
+from typing import List, Sequence
+from ..entities.run_summary import RunSummary
+from ..entities.turing_machine import TuringMachine
+from ..interfaces.itape import ITape
+from .compiled_table import CompiledTransitionTable
+from .multi_tape_machine import MultiTapeTuringMachine
+
+
+class MultiTapeRunner:
+    
+    GROWTH = 256
+    
+    def __init__(self, machine: MultiTapeTuringMachine):
+        self._table: CompiledTransitionTable = machine.get_compiled_table()
+    
+    def run(
+        self,
+        initial_tapes: Sequence[ITape],
+        max_steps: int = TuringMachine.MAX_STEPS
+    ) -> RunSummary:
+        started = time.perf_counter()
+        table = self._table
+        tape_count = table.get_tape_count()
+        if len(initial_tapes) != tape_count:
+            raise ValueError(
+                f"Makine {tape_count} şerit bekliyor, {len(initial_tapes)} verildi."
+            )
+        
+        next_states, writes, moves = table.get_columns()
+        final = table.get_final_flags()
+        stride = table.get_stride()
+        row_size = table.get_row_size()
+        no_transition = table.NO_TRANSITION
+        blank = table.get_blank_symbol()
+        growth = self.GROWTH
+        
+        cells: List[bytearray] = []
+        origins: List[int] = []
+        for tape in initial_tapes:
+            symbols = tape.get_all_symbols()
+            low = min(min(symbols, default=0), 0) - growth
+            high = max(max(symbols, default=0), 0) + growth
+            tape_cells = bytearray(high - low + 1)
+            for position, symbol in symbols.items():
+                tape_cells[position - low] = table.encode_symbol(symbol)
+            cells.append(tape_cells)
+            origins.append(low)
+        
+        offsets = [-origin for origin in origins]
+        tapes = range(tape_count)
+        state_id = table.get_initial_state_id()
+        step_count = 0
+        is_halted = False
+        
+        while step_count < max_steps:
+            combined = 0
+            for tape in reversed(tapes):
+                symbol_id = cells[tape][offsets[tape]]
+                if symbol_id >= stride:
+                    combined = -1
+                    break
+                combined = combined * stride + symbol_id
+            step_count += 1
+            if combined < 0:
+                is_halted = True
+                break
+            
+            index = state_id * row_size + combined
+            next_state = next_states[index]
+            if next_state == no_transition:
+                is_halted = True
+                break
+            
+            base = index * tape_count
+            for tape in tapes:
+                tape_cells = cells[tape]
+                offset = offsets[tape]
+                tape_cells[offset] = writes[base + tape]
+                offset += moves[base + tape]
+                if offset < 0:
+                    tape_cells[0:0] = bytes(growth)
+                    origins[tape] -= growth
+                    offset += growth
+                elif offset >= len(tape_cells):
+                    tape_cells.extend(bytes(growth))
+                offsets[tape] = offset
+            
+            state_id = next_state
+            if final[state_id]:
+                is_halted = True
+                break
+        
+        if step_count >= max_steps:
+            raise RuntimeError(
+                f"Makine {max_steps} adım içinde durmadı. "
+                "Sonsuz döngü olabilir."
+            )
+        
+        for tape, tape_cells, origin in zip(initial_tapes, cells, origins):
+            for index, symbol_id in enumerate(tape_cells):
+                position = origin + index
+                if symbol_id:
+                    tape.write(position, table.decode_symbol(symbol_id))
+                elif tape.read(position) != blank:
+                    tape.write(position, blank)
+        
+        head_positions = tuple(
+            origin + offset for origin, offset in zip(origins, offsets)
+        )
+        return RunSummary(
+            final_state=table.state(state_id),
+            head_position=head_positions[0],
+            step_count=step_count,
+            is_halted=is_halted,
+            statistics={'elapsed_seconds': time.perf_counter() - started},
+            head_positions=head_positions
+        )
@@ -0,0 +1,282 @@
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from ..entities.memory_budget import MemoryBudget
+from ..entities.state import State
+from ..entities.step_record import StepRecord
+from ..entities.step_result import StepResult
+from ..entities.transition import Transition
+from ..entities.turing_machine import TuringMachine
+from ..interfaces.istep_observer import IStepObserver
+from ..interfaces.ispillable import ISpillable
+from ..interfaces.itape import ITape
+from ..localization.message_catalog import get_catalog
+from .compiled_table import CompiledTransitionTable
+
+
+class StepCodec:
+    
+    def __init__(self, machine: TuringMachine):
+        self._table = CompiledTransitionTable.from_machine(machine)
+        self._transitions: Dict[Tuple[State, str], Transition] = machine.get_transitions()
+        self._direction_codes = {
+            direction: code for code, direction in enumerate(StepRecord.DIRECTIONS)
+        }
+    
+    def get_table(self) -> CompiledTransitionTable:
+        return self._table
+    
+    def direction_code(self, direction: str) -> int:
+        code = self._direction_codes.get(direction)
+        if code is None:
+            raise ValueError(f"Geçersiz hareket yönü: '{direction}'")
+        return code
+    
+    def encode(self, result: StepResult) -> StepRecord:
+        table = self._table
+        return StepRecord(
+            step_number=result.step_number,
+            previous_state_id=table.state_id(result.previous_state),
+            current_state_id=table.state_id(result.current_state),
+            read_symbol_id=table.encode_symbol(result.read_symbol),
+            write_symbol_id=table.encode_symbol(result.write_symbol),
+            direction_code=self.direction_code(result.direction),
+            head_position=result.head_position,
+            is_halted=result.is_halted
+        )
+    
+    def decode(
+        self,
+        record: StepRecord,
+        tape_snapshot: Optional[ITape] = None,
+        explanation: str = "",
+        locale: Optional[str] = None
+    ) -> StepResult:
+        table = self._table
+        previous_state = table.state(record.previous_state_id)
+        read_symbol = table.decode_symbol(record.read_symbol_id)
+        transition = None
+        if record.direction_code:
+            transition = self._transitions.get((previous_state, read_symbol))
+        
+        if transition is None and not explanation and record.is_halted:
+            explanation = get_catalog(locale).format(
+                'explain.invalid_transition',
+                state=previous_state.name,
+                read=read_symbol
+            )
+        
+        return StepResult(
+            step_number=record.step_number,
+            previous_state=previous_state,
+            current_state=table.state(record.current_state_id),
+            read_symbol=read_symbol,
+            write_symbol=table.decode_symbol(record.write_symbol_id),
+            direction=record.direction,
+            head_position=record.head_position,
+            tape_snapshot=tape_snapshot,
+            transition=transition,
+            is_halted=record.is_halted,
+            explanation=explanation
+        )
+
+
+class _LogChunk(ISpillable):
+    
+    __slots__ = ('data', 'size', 'count', 'typecodes', 'columns', 'referenced')
+    
+    def __init__(self, columns: Sequence[array]):
+        self.data: Optional[bytes] = b''.join(column.tobytes() for column in columns)
+        self.size = len(self.data)
+        self.count = len(columns[0])
+        self.typecodes = tuple(column.typecode for column in columns)
+        self.columns: Optional[Tuple[memoryview, ...]] = None
+        self.referenced = True
+    
+    def get_columns(self) -> Tuple[memoryview, ...]:
+        columns = self.columns
+        if columns is None:
+            view = memoryview(self.data)
+            offset = 0
+            views = []
+            for typecode in self.typecodes:
+                length = array(typecode).itemsize * self.count
+                views.append(view[offset:offset + length].cast(typecode))
+                offset += length
+            columns = self.columns = tuple(views)
+        self.referenced = True
+        return columns
+    
+    def get_spill_size(self) -> int:
+        return self.size
+    
+    def take_reference(self) -> bool:
+        referenced = self.referenced
+        self.referenced = False
+        return referenced
+    
+    def spill_out(self) -> bytes:
+        data = self.data
+        self.data = None
+        self.columns = None
+        return data
+    
+    def spill_in(self, data: bytes) -> None:
+        self.data = bytes(data)
+
+
+class StepLog(IStepObserver):
+    
+    HALTED_FLAG = 0x80
+    CHUNK_STEPS = 4096
+    
+    def __init__(self, codec: StepCodec, budget: Optional[MemoryBudget] = None):
+        self._codec = codec
+        self._budget = budget
+        self._first_step = 0
+        self._chunks: List[_LogChunk] = []
+        self._previous_states = array('H')
+        self._current_states = array('H')
+        self._reads = array('B')
+        self._writes = array('B')
+        self._flags = array('B')
+        self._heads = array('i')
+    
+    @classmethod
+    def for_machine(
+        cls,
+        machine: TuringMachine,
+        budget: Optional[MemoryBudget] = None
+    ) -> 'StepLog':
+        return cls(StepCodec(machine), budget)
+    
+    def get_memory_budget(self) -> Optional[MemoryBudget]:
+        return self._budget
+    
+    def _tail_columns(self) -> Tuple[array, ...]:
+        return (
+            self._previous_states, self._current_states, self._reads,
+            self._writes, self._flags, self._heads,
+        )
+    
+    def get_codec(self) -> StepCodec:
+        return self._codec
+    
+    def append(self, result: StepResult) -> None:
+        self.append_record(self._codec.encode(result))
+    
+    def append_record(self, record: StepRecord) -> None:
+        count = len(self)
+        if not count:
+            self._first_step = record.step_number
+        elif record.step_number != self._first_step + count:
+            raise ValueError(
+                f"Adım numarası sıralı olmalıdır: beklenen "
+                f"{self._first_step + count}, gelen {record.step_number}"
+            )
+        if len(self._heads) >= self.CHUNK_STEPS:
+            self._seal()
+        
+        flags = record.direction_code
+        if record.is_halted:
+            flags |= self.HALTED_FLAG
+        
+        self._previous_states.append(record.previous_state_id)
+        self._current_states.append(record.current_state_id)
+        self._reads.append(record.read_symbol_id)
+        self._writes.append(record.write_symbol_id)
+        self._flags.append(flags)
+        self._heads.append(record.head_position)
+    
+    def _seal(self) -> None:
+        chunk = _LogChunk(self._tail_columns())
+        if self._budget is not None:
+            self._budget.admit(chunk)
+        self._chunks.append(chunk)
+        for column in self._tail_columns():
+            del column[:]
+    
+    def _chunk_columns(self, chunk: _LogChunk) -> Tuple[memoryview, ...]:
+        if chunk.data is None:
+            self._budget.load(chunk)
+        return chunk.get_columns()
+    
+    def get_record(self, index: int) -> StepRecord:
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("Adım kaydı aralık dışında.")
+        
+        chunk_index, offset = divmod(index, self.CHUNK_STEPS)
+        if chunk_index < len(self._chunks):
+            columns = self._chunk_columns(self._chunks[chunk_index])
+        else:
+            columns = self._tail_columns()
+        previous_states, current_states, reads, writes, flag_column, heads = columns
+        
+        flags = flag_column[offset]
+        return StepRecord(
+            step_number=self._first_step + index,
+            previous_state_id=previous_states[offset],
+            current_state_id=current_states[offset],
+            read_symbol_id=reads[offset],
+            write_symbol_id=writes[offset],
+            direction_code=flags & ~self.HALTED_FLAG,
+            head_position=heads[offset],
+            is_halted=bool(flags & self.HALTED_FLAG)
+        )
+    
+    def get_step_result(
+        self,
+        index: int,
+        tape_snapshot: Optional[ITape] = None,
+        locale: Optional[str] = None
+    ) -> StepResult:
+        return self._codec.decode(self.get_record(index), tape_snapshot, locale=locale)
+    
+    def find_step(self, step_number: int) -> Optional[StepRecord]:
+        index = step_number - self._first_step
+        if not 0 <= index < len(self):
+            return None
+        return self.get_record(index)
+    
+    def get_memory_usage(self) -> int:
+        return sum(
+            chunk.size for chunk in self._chunks if chunk.data is not None
+        ) + sum(
+            column.itemsize * len(column) for column in self._tail_columns()
+        )
+    
+    def get_spilled_chunk_count(self) -> int:
+        return sum(1 for chunk in self._chunks if chunk.data is None)
+    
+    def clear(self) -> None:
+        if self._budget is not None:
+            for chunk in self._chunks:
+                self._budget.forget(chunk)
+        self._chunks.clear()
+        for column in self._tail_columns():
+            del column[:]
+        self._first_step = 0
+    
+    def __len__(self) -> int:
+        return len(self._chunks) * self.CHUNK_STEPS + len(self._heads)
+    
+    def __getitem__(self, index: int) -> StepRecord:
+        return self.get_record(index)
+    
+    def __iter__(self) -> Iterator[StepRecord]:
+        for index in range(len(self)):
+            yield self.get_record(index)
+    
+    def on_pre_step(self, step_number: int, state: State, head_position: int) -> None:
+        pass
+    
+    def on_post_step(self, result: StepResult) -> None:
+        self.append(result)
+    
+    def on_halt(self, result: StepResult) -> None:
+        pass
+    
+    def on_budget(self, step_count: int, max_steps: int) -> None:
+        pass
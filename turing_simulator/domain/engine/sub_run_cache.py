@@ -0,0 +1,79 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional
+
+
+@dataclass(frozen=True)
+class SubRunEntry:
+    window: bytes
+    exit_state_id: int
+    exit_offset: int
+    step_count: int
+    is_halted: bool
+
+
+class SubRunCache:
+    
+    def __init__(self, window_size: int = 16, max_entries: int = 4096):
+        if window_size <= 0:
+            raise ValueError("Pencere boyutu pozitif olmalıdır.")
+        if max_entries <= 0:
+            raise ValueError("Önbellek kapasitesi pozitif olmalıdır.")
+        
+        self._window_size = window_size
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, SubRunEntry]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._owner: Optional[Hashable] = None
+    
+    def bind(self, owner: Hashable) -> None:
+        if self._owner != owner:
+            self.clear()
+            self._owner = owner
+    
+    def get(self, key: Hashable) -> Optional[SubRunEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry
+    
+    def put(self, key: Hashable, entry: SubRunEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+    
+    def get_window_size(self) -> int:
+        return self._window_size
+    
+    def get_hit_rate(self) -> float:
+        lookups = self._hits + self._misses
+        if lookups == 0:
+            return 0.0
+        return self._hits / lookups
+    
+    def get_statistics(self) -> Dict[str, float]:
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'entries': len(self._entries),
+            'hit_rate': self.get_hit_rate(),
+        }
+    
+    def clear(self) -> None:
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,152 @@
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from ..entities.transition import Transition
+from ..entities.turing_machine import TuringMachine
+
+
+@dataclass(frozen=True)
+class SweepTransition:
+    state_name: str
+    direction: str
+    symbols: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class TransitionAnalysis:
+    fingerprint: str
+    input_symbols: FrozenSet[str]
+    reachable_states: FrozenSet[str]
+    unreachable_states: FrozenSet[str]
+    tape_symbols: FrozenSet[str]
+    dead_transitions: Tuple[Transition, ...]
+    halting_pairs: Tuple[Tuple[str, str], ...]
+    sweeps: Tuple[SweepTransition, ...]
+    
+    def is_dead(self, state_name: str, symbol: str) -> bool:
+        return any(
+            transition.from_state.name == state_name and transition.read_symbol == symbol
+            for transition in self.dead_transitions
+        )
+    
+    def is_halting(self, state_name: str, symbol: str) -> bool:
+        return (state_name, symbol) in self.halting_pairs
+    
+    def get_sweeps(self, state_name: str) -> List[SweepTransition]:
+        return [sweep for sweep in self.sweeps if sweep.state_name == state_name]
+    
+    def find_sweep(self, state_name: str, symbol: str) -> Optional[SweepTransition]:
+        for sweep in self.sweeps:
+            if sweep.state_name == state_name and symbol in sweep.symbols:
+                return sweep
+        return None
+    
+    def __str__(self) -> str:
+        return (f"Erişilebilir durum: {len(self.reachable_states)} | "
+                f"Ölü geçiş: {len(self.dead_transitions)} | "
+                f"Örtük durma: {len(self.halting_pairs)} | "
+                f"Tarama: {len(self.sweeps)}")
+
+
+class TransitionAnalyzer:
+    
+    _cache: Dict[Tuple[str, Optional[FrozenSet[str]]], TransitionAnalysis] = {}
+    
+    @classmethod
+    def analyze(
+        cls,
+        machine: TuringMachine,
+        input_symbols: Optional[Iterable[str]] = None
+    ) -> TransitionAnalysis:
+        inputs = frozenset(input_symbols) if input_symbols is not None else None
+        key = (machine.get_fingerprint(), inputs)
+        analysis = cls._cache.get(key)
+        if analysis is None:
+            analysis = cls._analyze(machine, inputs)
+            cls._cache[key] = analysis
+        return analysis
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._cache.clear()
+    
+    @staticmethod
+    def _analyze(
+        machine: TuringMachine,
+        inputs: Optional[FrozenSet[str]]
+    ) -> TransitionAnalysis:
+        transitions = machine.get_transitions()
+        blank = machine.get_blank_symbol()
+        initial_name = machine.get_initial_state().name
+        final_names = {state.name for state in machine.get_final_states()}
+        if inputs is None:
+            inputs = frozenset(symbol for _, symbol in transitions)
+        
+        rows: Dict[str, List[Transition]] = {}
+        for (state, _), transition in transitions.items():
+            rows.setdefault(state.name, []).append(transition)
+        
+        reachable = {initial_name}
+        symbols = set(inputs) | {blank}
+        changed = True
+        while changed:
+            changed = False
+            for state_name in list(reachable):
+                if state_name in final_names and state_name != initial_name:
+                    continue
+                for transition in rows.get(state_name, []):
+                    if transition.read_symbol not in symbols:
+                        continue
+                    if transition.to_state.name not in reachable:
+                        reachable.add(transition.to_state.name)
+                        changed = True
+                    if transition.write_symbol not in symbols:
+                        symbols.add(transition.write_symbol)
+                        changed = True
+        
+        def is_live(transition: Transition) -> bool:
+            state_name = transition.from_state.name
+            return (
+                state_name in reachable
+                and transition.read_symbol in symbols
+                and (state_name not in final_names or state_name == initial_name)
+            )
+        
+        dead = tuple(sorted(
+            (transition for transition in transitions.values() if not is_live(transition)),
+            key=lambda transition: (transition.from_state.name, transition.read_symbol)
+        ))
+        
+        halting = tuple(sorted(
+            (state_name, symbol)
+            for state_name in reachable
+            if state_name not in final_names
+            for symbol in symbols
+            if not any(
+                transition.read_symbol == symbol for transition in rows.get(state_name, [])
+            )
+        ))
+        
+        sweeps = []
+        for state_name in sorted(reachable - final_names):
+            for direction in ('L', 'R'):
+                swept = tuple(sorted(
+                    transition.read_symbol for transition in rows.get(state_name, [])
+                    if transition.to_state.name == state_name
+                    and transition.write_symbol == transition.read_symbol
+                    and transition.direction == direction
+                    and is_live(transition)
+                ))
+                if swept:
+                    sweeps.append(SweepTransition(state_name, direction, swept))
+        
+        all_states = {state.name for state in machine.get_states()}
+        return TransitionAnalysis(
+            fingerprint=machine.get_fingerprint(),
+            input_symbols=inputs,
+            reachable_states=frozenset(reachable),
+            unreachable_states=frozenset(all_states - reachable),
+            tape_symbols=frozenset(symbols),
+            dead_transitions=dead,
+            halting_pairs=halting,
+            sweeps=tuple(sweeps)
+        )
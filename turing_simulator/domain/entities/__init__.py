@@ -3,6 +3,16 @@ from .transition import Transition
 from .tape import Tape
 from .turing_machine import TuringMachine
 from .step_result import StepResult
+from .tape_heatmap import TapeHeatmap
+from .run_summary import RunSummary
+from .multi_tape_transition import MultiTapeTransition
+from .multi_tape_step_result import MultiTapeStepResult
+from .step_record import StepRecord
+from .shared_tape import SharedTape, SharedConfiguration
+from .memory_budget import MemoryBudget, MemoryReport, MemoryLimitExceeded, SpillFile
 
-__all__ = ['State', 'Transition', 'Tape', 'TuringMachine', 'StepResult']
+__all__ = ['State', 'Transition', 'Tape', 'TuringMachine', 'StepResult', 'TapeHeatmap',
+           'RunSummary', 'MultiTapeTransition', 'MultiTapeStepResult', 'StepRecord',
+           'SharedTape', 'SharedConfiguration', 'MemoryBudget', 'MemoryReport',
+           'MemoryLimitExceeded', 'SpillFile']
 
@@ -0,0 +1,216 @@
+import mmap
+import tempfile
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+from ..interfaces.ispillable import ISpillable
+
+
+@dataclass
+class MemoryReport:
+    resident_bytes: int
+    resident_limit: int
+    spilled_bytes: int
+    spill_limit: int
+    peak_resident_bytes: int = 0
+    spill_count: int = 0
+    load_count: int = 0
+    requested_bytes: int = 0
+    
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+    
+    def __str__(self) -> str:
+        return (f"Bellek: {self.resident_bytes:,}/{self.resident_limit:,} bayt | "
+                f"Disk: {self.spilled_bytes:,}/{self.spill_limit:,} bayt | "
+                f"Taşıma: {self.spill_count} | Geri yükleme: {self.load_count}")
+
+
+class MemoryLimitExceeded(RuntimeError):
+    
+    def __init__(self, report: MemoryReport):
+        super().__init__(
+            f"Bellek sınırı aşıldı: {report.requested_bytes:,} bayt istendi. {report}"
+        )
+        self.report = report
+
+
+class SpillFile:
+    
+    INITIAL_SIZE = 1 << 20
+    
+    def __init__(self, limit: int, directory: Optional[str] = None):
+        self._limit = limit
+        self._directory = directory
+        self._handle = None
+        self._map: Optional[mmap.mmap] = None
+        self._size = 0
+        self._end = 0
+        self._used = 0
+        self._free: Dict[int, List[int]] = {}
+    
+    def get_used(self) -> int:
+        return self._used
+    
+    def get_size(self) -> int:
+        return self._size
+    
+    def allocate(self, size: int) -> Optional[int]:
+        free = self._free.get(size)
+        if free:
+            self._used += size
+            return free.pop()
+        if self._end + size > self._limit:
+            return None
+        if self._end + size > self._size:
+            self._grow(self._end + size)
+        offset = self._end
+        self._end += size
+        self._used += size
+        return offset
+    
+    def _grow(self, needed: int) -> None:
+        size = min(max(needed, self._size * 2, self.INITIAL_SIZE), self._limit)
+        if self._handle is None:
+            self._handle = tempfile.TemporaryFile(prefix='turing-spill-', dir=self._directory)
+        if self._map is not None:
+            self._map.close()
+        self._handle.truncate(size)
+        self._map = mmap.mmap(self._handle.fileno(), size)
+        self._size = size
+    
+    def write(self, offset: int, data: bytes) -> None:
+        self._map[offset:offset + len(data)] = data
+    
+    def read(self, offset: int, size: int) -> bytes:
+        return self._map[offset:offset + size]
+    
+    def free(self, offset: int, size: int) -> None:
+        self._free.setdefault(size, []).append(offset)
+        self._used -= size
+    
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._size = self._end = self._used = 0
+        self._free.clear()
+
+
+class MemoryBudget:
+    
+    def __init__(
+        self,
+        resident_limit: int,
+        spill_limit: int = 0,
+        spill_directory: Optional[str] = None
+    ):
+        if resident_limit <= 0 or spill_limit < 0:
+            raise ValueError("Bellek sınırları pozitif olmalıdır.")
+        self._resident_limit = resident_limit
+        self._spill_limit = spill_limit
+        self._spill_file = SpillFile(spill_limit, spill_directory) if spill_limit else None
+        self._resident: "OrderedDict[ISpillable, None]" = OrderedDict()
+        self._spilled: Dict[ISpillable, int] = {}
+        self._resident_bytes = 0
+        self._peak_resident_bytes = 0
+        self._spill_count = 0
+        self._load_count = 0
+    
+    def get_resident_bytes(self) -> int:
+        return self._resident_bytes
+    
+    def get_spilled_bytes(self) -> int:
+        return self._spill_file.get_used() if self._spill_file else 0
+    
+    def tracks(self, block: ISpillable) -> bool:
+        return block in self._resident or block in self._spilled
+    
+    def is_spilled(self, block: ISpillable) -> bool:
+        return block in self._spilled
+    
+    def get_report(self, requested_bytes: int = 0) -> MemoryReport:
+        return MemoryReport(
+            resident_bytes=self._resident_bytes,
+            resident_limit=self._resident_limit,
+            spilled_bytes=self.get_spilled_bytes(),
+            spill_limit=self._spill_limit,
+            peak_resident_bytes=self._peak_resident_bytes,
+            spill_count=self._spill_count,
+            load_count=self._load_count,
+            requested_bytes=requested_bytes
+        )
+    
+    def admit(self, block: ISpillable) -> None:
+        size = block.get_spill_size()
+        self._make_room(size)
+        self._resident[block] = None
+        self._resident_bytes += size
+        if self._resident_bytes > self._peak_resident_bytes:
+            self._peak_resident_bytes = self._resident_bytes
+    
+    def forget(self, block: ISpillable) -> None:
+        if block in self._resident:
+            del self._resident[block]
+            self._resident_bytes -= block.get_spill_size()
+        else:
+            offset = self._spilled.pop(block, None)
+            if offset is not None:
+                self._spill_file.free(offset, block.get_spill_size())
+    
+    def load(self, block: ISpillable) -> None:
+        offset = self._spilled.pop(block)
+        size = block.get_spill_size()
+        data = self._spill_file.read(offset, size)
+        self._spill_file.free(offset, size)
+        try:
+            self._make_room(size)
+        except MemoryLimitExceeded:
+            offset = self._spill_file.allocate(size)
+            self._spill_file.write(offset, data)
+            self._spilled[block] = offset
+            raise
+        block.spill_in(data)
+        self._load_count += 1
+        self._resident[block] = None
+        self._resident_bytes += size
+        if self._resident_bytes > self._peak_resident_bytes:
+            self._peak_resident_bytes = self._resident_bytes
+    
+    def _make_room(self, size: int) -> None:
+        while self._resident_bytes + size > self._resident_limit:
+            victim = self._next_victim()
+            if victim is None:
+                raise MemoryLimitExceeded(self.get_report(size))
+            self._spill(victim, size)
+    
+    def _next_victim(self) -> Optional[ISpillable]:
+        resident = self._resident
+        for _ in range(2 * len(resident)):
+            block, _ = resident.popitem(last=False)
+            if not block.take_reference():
+                return block
+            resident[block] = None
+        return None
+    
+    def _spill(self, block: ISpillable, requested: int) -> None:
+        size = block.get_spill_size()
+        offset = self._spill_file.allocate(size) if self._spill_file else None
+        if offset is None:
+            self._resident[block] = None
+            self._resident.move_to_end(block, last=False)
+            raise MemoryLimitExceeded(self.get_report(requested))
+        self._spill_file.write(offset, block.spill_out())
+        self._spilled[block] = offset
+        self._resident_bytes -= size
+        self._spill_count += 1
+    
+    def close(self) -> None:
+        if self._spill_file is not None:
+            self._spill_file.close()
+        self._resident.clear()
+        self._spilled.clear()
+        self._resident_bytes = 0
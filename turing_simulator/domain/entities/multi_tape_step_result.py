@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from .state import State
+from .multi_tape_transition import MultiTapeTransition
+
+
+@dataclass
+class MultiTapeStepResult:
+    step_number: int
+    previous_state: State
+    current_state: State
+    read_symbols: Tuple[str, ...]
+    write_symbols: Tuple[str, ...]
+    directions: Tuple[str, ...]
+    head_positions: Tuple[int, ...]
+    transition: Optional[MultiTapeTransition] = None
+    is_halted: bool = False
+    
+    def __str__(self) -> str:
+        return (f"Adım {self.step_number}: {self.previous_state.name} → "
+                f"{self.current_state.name} | Okunan: {','.join(self.read_symbols)}, "
+                f"Yazılan: {','.join(self.write_symbols)}, "
+                f"Yön: {','.join(self.directions)}")
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Tuple
+from .state import State
+
+
+@dataclass(frozen=True)
+class MultiTapeTransition:
+    from_state: State
+    to_state: State
+    read_symbols: Tuple[str, ...]
+    write_symbols: Tuple[str, ...]
+    directions: Tuple[str, ...]
+    
+    def get_tape_count(self) -> int:
+        return len(self.read_symbols)
+    
+    def __str__(self) -> str:
+        reads = ",".join(self.read_symbols)
+        writes = ",".join(self.write_symbols)
+        moves = ",".join(self.directions)
+        return (f"{self.from_state.name} --[({reads})/({writes}), "
+                f"({moves})]--> {self.to_state.name}")
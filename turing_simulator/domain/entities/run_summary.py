@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+from .state import State
+
+
+@dataclass
+class RunSummary:
+    final_state: State
+    head_position: int
+    step_count: int
+    is_halted: bool = True
+    statistics: Dict[str, float] = field(default_factory=dict)
+    head_positions: Tuple[int, ...] = ()
+    
+    def __str__(self) -> str:
+        return (f"Son durum: {self.final_state.name} | "
+                f"Kafa: {self.head_position} | Adım: {self.step_count}")
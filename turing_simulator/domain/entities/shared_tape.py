@@ -0,0 +1,305 @@
+import re
+from array import array
+import struct
+import time
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+from ..interfaces.itape import ITape
+from .tape import Tape
+
+
+@dataclass(frozen=True)
+class SharedConfiguration:
+    sequence: int
+    head_position: int
+    step_count: int
+    state_name: str
+    is_halted: bool
+
+
+class SharedTape(ITape):
+    
+    MAGIC = b'TMST'
+    STATIC = struct.Struct('<4sqQc7x')
+    DYNAMIC = struct.Struct('<QqQ32sBBxxxxxxqq')
+    HISTOGRAM = struct.Struct('<256Q')
+    HISTOGRAM_OFFSET = (STATIC.size + DYNAMIC.size + 7) & ~7
+    HEADER_SIZE = HISTOGRAM_OFFSET + HISTOGRAM.size
+    READ_ATTEMPTS = 10000
+    
+    _NONBLANK = re.compile(rb'[^\x00]')
+    
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool, read_only: bool):
+        self._memory = memory
+        self._owner = owner
+        self._read_only = read_only
+        self._buffer = memory.buf
+        magic, self._origin, self._capacity, blank = self.STATIC.unpack_from(self._buffer, 0)
+        if magic != self.MAGIC:
+            raise ValueError("Paylaşılan bellek bir şerit içermiyor.")
+        self._blank_symbol = blank.decode('latin-1')
+        self._cells = self._buffer[self.HEADER_SIZE:self.HEADER_SIZE + self._capacity]
+        self._histogram = self._buffer[
+            self.HISTOGRAM_OFFSET:self.HEADER_SIZE
+        ].cast('Q')
+    
+    @classmethod
+    def create(
+        cls,
+        capacity: int,
+        origin: Optional[int] = None,
+        blank_symbol: str = 'B'
+    ) -> 'SharedTape':
+        if len(blank_symbol) != 1:
+            raise ValueError("Boş sembol tek karakter olmalıdır.")
+        memory = shared_memory.SharedMemory(create=True, size=cls.HEADER_SIZE + capacity)
+        if origin is None:
+            origin = -(capacity // 4)
+        cls.STATIC.pack_into(
+            memory.buf, 0, cls.MAGIC, origin, capacity, blank_symbol.encode('latin-1')
+        )
+        cls.DYNAMIC.pack_into(memory.buf, cls.STATIC.size, 0, 0, 0, b'', 0, 1, 0, 0)
+        return cls(memory, owner=True, read_only=False)
+    
+    @classmethod
+    def attach(cls, name: str, read_only: bool = True) -> 'SharedTape':
+        try:
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            memory = shared_memory.SharedMemory(name=name)
+        return cls(memory, owner=False, read_only=read_only)
+    
+    def get_name(self) -> str:
+        return self._memory.name
+    
+    def get_origin(self) -> int:
+        return self._origin
+    
+    def get_capacity(self) -> int:
+        return self._capacity
+    
+    def close(self) -> None:
+        if self._cells is None:
+            return
+        self._cells.release()
+        self._cells = None
+        self._histogram.release()
+        self._histogram = None
+        self._buffer = None
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+    
+    def _check_writable(self) -> None:
+        if self._read_only:
+            raise RuntimeError("Salt okunur paylaşılan şeride yazılamaz.")
+    
+    def _index(self, position: int) -> int:
+        index = position - self._origin
+        if not 0 <= index < self._capacity:
+            raise IndexError(
+                f"Paylaşılan şerit kapasitesi aşıldı: {position} konumu "
+                f"[{self._origin}, {self._origin + self._capacity}) dışında."
+            )
+        return index
+    
+    def _sequence(self) -> int:
+        return struct.unpack_from('<Q', self._buffer, self.STATIC.size)[0]
+    
+    def _set_sequence(self, sequence: int) -> None:
+        struct.pack_into('<Q', self._buffer, self.STATIC.size, sequence)
+    
+    def _read_consistent(self, reader):
+        for attempt in range(self.READ_ATTEMPTS):
+            before = self._sequence()
+            if before & 1:
+                if attempt > 100:
+                    time.sleep(0.0001)
+                continue
+            value = reader()
+            if self._sequence() == before:
+                return value
+        raise RuntimeError("Paylaşılan şerit tutarlı biçimde okunamadı.")
+    
+    def _dynamic(self) -> Tuple:
+        return self.DYNAMIC.unpack_from(self._buffer, self.STATIC.size)
+    
+    def read_configuration(self) -> SharedConfiguration:
+        sequence, head, steps, state, halted, _, _, _ = self._read_consistent(self._dynamic)
+        return SharedConfiguration(
+            sequence=sequence,
+            head_position=head,
+            step_count=steps,
+            state_name=state.rstrip(b'\x00').decode('utf-8'),
+            is_halted=bool(halted)
+        )
+    
+    def publish(
+        self,
+        cells: bytes,
+        head_position: int,
+        step_count: int,
+        state_name: str,
+        is_halted: bool = False
+    ) -> None:
+        self._check_writable()
+        if len(cells) != self._capacity:
+            raise ValueError("Yayınlanan hücre sayısı şerit kapasitesiyle eşleşmiyor.")
+        
+        is_empty, low, high = self._used_range(cells)
+        histogram = [0] * 256
+        if not is_empty:
+            used = bytes(cells[low - self._origin:high - self._origin + 1])
+            for code in set(used):
+                histogram[code] = used.count(code)
+            histogram[0] = 0
+        
+        sequence = self._sequence()
+        self._set_sequence(sequence + 1)
+        self._cells[:] = cells
+        self._histogram[:] = array('Q', histogram)
+        self.DYNAMIC.pack_into(
+            self._buffer, self.STATIC.size, sequence + 1, head_position, step_count,
+            state_name.encode('utf-8')[:32], int(is_halted), is_empty, low, high
+        )
+        self._set_sequence(sequence + 2)
+    
+    def _used_range(self, cells: bytes) -> Tuple[int, int, int]:
+        first = self._NONBLANK.search(cells)
+        if first is None:
+            return 1, 0, 0
+        last = len(bytes(cells).rstrip(b'\x00')) - 1
+        return 0, self._origin + first.start(), self._origin + last
+    
+    def read_cells(self) -> bytes:
+        return self._read_consistent(lambda: bytes(self._cells))
+    
+    def read(self, position: int) -> str:
+        index = position - self._origin
+        if not 0 <= index < self._capacity:
+            return self._blank_symbol
+        code = self._cells[index]
+        return chr(code) if code else self._blank_symbol
+    
+    def write(self, position: int, symbol: str) -> None:
+        self._check_writable()
+        index = self._index(position)
+        if symbol == self._blank_symbol:
+            code = 0
+        elif len(symbol) == 1 and 0 < ord(symbol) < 256:
+            code = ord(symbol)
+        else:
+            raise ValueError(
+                f"Geçersiz şerit sembolü: {symbol!r}. "
+                "Semboller tek karakterlik Latin-1 karakterleri olmalıdır."
+            )
+        
+        sequence = self._sequence()
+        self._set_sequence(sequence + 1)
+        previous = self._cells[index]
+        self._cells[index] = code
+        if previous:
+            self._histogram[previous] -= 1
+        if code:
+            self._histogram[code] += 1
+        values = list(self._dynamic())
+        if code:
+            if values[5]:
+                values[5], values[6], values[7] = 0, position, position
+            else:
+                values[6] = min(values[6], position)
+                values[7] = max(values[7], position)
+        elif not values[5] and position in (values[6], values[7]):
+            values[5], values[6], values[7] = self._used_range(bytes(self._cells))
+        values[0] = sequence + 1
+        self.DYNAMIC.pack_into(self._buffer, self.STATIC.size, *values)
+        self._set_sequence(sequence + 2)
+    
+    def get_visible_range(self) -> Tuple[int, int]:
+        _, _, _, _, _, is_empty, low, high = self._read_consistent(self._dynamic)
+        if is_empty:
+            return (0, 0)
+        return (low, high)
+    
+    def read_range(self, start: int, stop: int) -> str:
+        if stop <= start:
+            return ""
+        low = max(start - self._origin, 0)
+        high = min(stop - self._origin, self._capacity)
+        if high <= low:
+            return self._blank_symbol * (stop - start)
+        
+        data = self._read_consistent(lambda: bytes(self._cells[low:high]))
+        text = data.decode('latin-1').replace('\x00', self._blank_symbol)
+        return (
+            self._blank_symbol * (low - (start - self._origin))
+            + text
+            + self._blank_symbol * ((stop - self._origin) - high)
+        )
+    
+    def get_all_symbols(self) -> Dict[int, str]:
+        if self.is_empty():
+            return {}
+        low, high = self.get_visible_range()
+        return self.get_symbol_at_range(low, high)
+    
+    def get_symbol_at_range(self, min_pos: int, max_pos: int) -> Dict[int, str]:
+        window = self.read_range(min_pos, max_pos + 1)
+        return {
+            min_pos + offset: symbol
+            for offset, symbol in enumerate(window)
+            if symbol != self._blank_symbol
+        }
+    
+    def read_range_bytes(self, start: int, stop: int) -> memoryview:
+        if stop <= start:
+            return memoryview(b"")
+        low = max(start - self._origin, 0)
+        high = min(stop - self._origin, self._capacity)
+        if high <= low:
+            return memoryview(bytes(stop - start))
+        
+        data = self._read_consistent(lambda: bytes(self._cells[low:high]))
+        return memoryview(
+            bytes(low - (start - self._origin)) + data
+            + bytes((stop - self._origin) - high)
+        )
+    
+    def count_symbol(self, symbol: str) -> int:
+        if symbol == self._blank_symbol:
+            def reader():
+                _, _, _, _, _, is_empty, low, high = self._dynamic()
+                if is_empty:
+                    return 0
+                return high - low + 1 - sum(self._histogram)
+            return self._read_consistent(reader)
+        if len(symbol) != 1 or not 0 < ord(symbol) < 256:
+            return 0
+        return self._read_consistent(lambda: self._histogram[ord(symbol)])
+    
+    def get_symbol_counts(self) -> Dict[str, int]:
+        counts = self._read_consistent(lambda: self._histogram.tolist())
+        return {chr(code): count for code, count in enumerate(counts) if code and count}
+    
+    def is_empty(self) -> bool:
+        return bool(self._read_consistent(self._dynamic)[5])
+    
+    def get_blank_symbol(self) -> str:
+        return self._blank_symbol
+    
+    def snapshot(self) -> ITape:
+        def reader():
+            _, _, _, _, _, is_empty, low, high = self._dynamic()
+            if is_empty:
+                return low, b""
+            return low, bytes(self._cells[low - self._origin:high - self._origin + 1])
+        
+        low, data = self._read_consistent(reader)
+        return Tape.from_bytes(data, low, self._blank_symbol).snapshot()
+    
+    def fork(self) -> ITape:
+        return self.snapshot().fork()
+    
+    def is_read_only(self) -> bool:
+        return False
@@ -0,0 +1,47 @@
+class StepRecord:
+    
+    __slots__ = (
+        'step_number', 'previous_state_id', 'current_state_id',
+        'read_symbol_id', 'write_symbol_id', 'direction_code',
+        'head_position', 'is_halted',
+    )
+    
+    DIRECTIONS = ('', 'L', 'R', 'S', 'N')
+    
+    def __init__(
+        self,
+        step_number: int,
+        previous_state_id: int,
+        current_state_id: int,
+        read_symbol_id: int,
+        write_symbol_id: int,
+        direction_code: int,
+        head_position: int,
+        is_halted: bool = False
+    ):
+        self.step_number = step_number
+        self.previous_state_id = previous_state_id
+        self.current_state_id = current_state_id
+        self.read_symbol_id = read_symbol_id
+        self.write_symbol_id = write_symbol_id
+        self.direction_code = direction_code
+        self.head_position = head_position
+        self.is_halted = is_halted
+    
+    @property
+    def direction(self) -> str:
+        return self.DIRECTIONS[self.direction_code]
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StepRecord):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+    
+    def __repr__(self) -> str:
+        return (f"StepRecord(step={self.step_number}, "
+                f"state={self.previous_state_id}->{self.current_state_id}, "
+                f"read={self.read_symbol_id}, write={self.write_symbol_id}, "
+                f"dir='{self.direction}', head={self.head_position}, "
+                f"halted={self.is_halted})")
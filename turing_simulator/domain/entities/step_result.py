@@ -1,6 +1,9 @@
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Optional
+from ..interfaces.itape import ITape
+from ..localization.message_catalog import get_catalog
 from .state import State
+from .tape_text_window import TapeTextWindow
 from .transition import Transition
 
 
@@ -13,38 +16,48 @@ class StepResult:
     write_symbol: str
     direction: str
     head_position: int
-    tape_snapshot: Dict[int, str]
+    tape_snapshot: ITape
     transition: Optional[Transition] = None
     is_halted: bool = False
     explanation: str = ""
+    tape_window: Optional[TapeTextWindow] = None
     
     def __str__(self) -> str:
-        return (f"Adım {self.step_number}: {self.previous_state.name} → "
-                f"{self.current_state.name} | Okunan: {self.read_symbol}, "
-                f"Yazılan: {self.write_symbol}, Yön: {self.direction}")
+        return self.format_summary()
     
-    def get_tape_visualization(self, context_size: int = 5) -> str:
-        if not self.tape_snapshot:
-            return "(Boş şerit)"
-        
-        min_pos = min(self.tape_snapshot.keys())
-        max_pos = max(self.tape_snapshot.keys())
-        
-        display_min = max(min_pos, self.head_position - context_size)
-        display_max = min(max_pos, self.head_position + context_size)
+    def format_summary(self, locale: Optional[str] = None) -> str:
+        return get_catalog(locale).formatter('step.summary')(
+            step=self.step_number,
+            previous=self.previous_state.name,
+            current=self.current_state.name,
+            read=self.read_symbol,
+            write=self.write_symbol,
+            direction=self.direction
+        )
+    
+    def get_tape_window(self, radius: int) -> Optional[TapeTextWindow]:
+        window = self.tape_window
+        if window is not None and window.radius >= radius:
+            return window
+        if self.tape_snapshot is None:
+            return None
+        return TapeTextWindow.from_tape(self.tape_snapshot, self.head_position, radius)
+    
+    def get_tape_visualization(self, context_size: int = 5, locale: Optional[str] = None) -> str:
+        catalog = get_catalog(locale)
+        window = self.get_tape_window(context_size)
+        if window is None or window.is_empty:
+            return catalog.format('tape.empty')
         
-        symbols = []
-        positions = []
-        for pos in range(display_min, display_max + 1):
-            symbol = self.tape_snapshot.get(pos, 'B')
-            symbols.append(symbol if symbol != 'B' else '□')
-            positions.append(pos)
+        display_min, display_max = window.get_bounds(context_size)
         
-        tape_str = " ".join(symbols)
+        tape_str = " ".join(window.get_cells(display_min, display_max + 1))
         head_marker_pos = self.head_position - display_min
         
         marker_line = " " * (head_marker_pos * 2) + "↑"
         
-        return (f"{tape_str}\n{marker_line} "
-                f"(Pozisyon: {self.head_position}, Durum: {self.current_state.name})")
+        position = catalog.format(
+            'tape.position', head=self.head_position, state=self.current_state.name
+        )
+        return f"{tape_str}\n{marker_line} {position}"
 
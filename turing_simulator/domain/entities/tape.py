@@ -1,58 +1,427 @@
-from typing import Dict, Tuple
+import re
+from typing import Dict, Optional, Tuple
 from ..interfaces.itape import ITape
+from ..interfaces.ispillable import ISpillable
+from .memory_budget import MemoryBudget
+
+
+class _Page(ISpillable):
+    
+    __slots__ = ('cells', 'count', 'refs', 'referenced')
+    
+    SIZE = 1 << 12
+    
+    def __init__(self, cells: bytearray, count: int = 0):
+        self.cells: Optional[bytearray] = cells
+        self.count = count
+        self.refs = 1
+        self.referenced = True
+    
+    def get_spill_size(self) -> int:
+        return self.SIZE
+    
+    def take_reference(self) -> bool:
+        referenced = self.referenced
+        self.referenced = False
+        return referenced
+    
+    def spill_out(self) -> bytes:
+        cells = self.cells
+        self.cells = None
+        return cells
+    
+    def spill_in(self, data: bytes) -> None:
+        self.cells = bytearray(data)
+
+
+class _PageTable:
+    
+    __slots__ = ('pages', 'refs')
+    
+    def __init__(self, pages: Optional[Dict[int, _Page]] = None):
+        self.pages: Dict[int, _Page] = pages if pages is not None else {}
+        self.refs = 1
 
 
 class Tape(ITape):
     
+    PAGE_SHIFT = 12
+    PAGE_SIZE = 1 << PAGE_SHIFT
+    PAGE_MASK = PAGE_SIZE - 1
+    
+    _NONBLANK_RUN = re.compile(rb'[^\x00]+')
+    
     def __init__(self, blank_symbol: str = 'B'):
-        self._cells: Dict[int, str] = {}
+        if len(blank_symbol) != 1:
+            raise ValueError("Boş sembol tek karakter olmalıdır.")
         self._blank_symbol = blank_symbol
+        self._table = _PageTable()
+        self._read_only = False
         self._min_position = 0
         self._max_position = 0
+        self._is_empty = True
+        self._range_dirty = False
+        self._histogram = [0] * 256
+        self._budget: Optional[MemoryBudget] = None
+    
+    def __del__(self):
+        table = getattr(self, '_table', None)
+        if table is not None:
+            self._release_table(table)
+    
+    def _release_table(self, table: _PageTable) -> None:
+        table.refs -= 1
+        if table.refs == 0:
+            for page in table.pages.values():
+                self._drop_page(page)
+    
+    def _drop_page(self, page: _Page) -> None:
+        page.refs -= 1
+        if not page.refs:
+            budget = getattr(self, '_budget', None)
+            if budget is not None:
+                budget.forget(page)
+    
+    def _load(self, page: _Page) -> bytearray:
+        self._budget.load(page)
+        return page.cells
+    
+    def set_memory_budget(self, budget: Optional[MemoryBudget]) -> None:
+        if budget is self._budget:
+            return
+        if self._budget is not None:
+            raise ValueError("Şeride zaten bir bellek bütçesi bağlı.")
+        pages = self._table.pages
+        if self._table.refs > 1 or any(page.refs > 1 for page in pages.values()):
+            raise ValueError(
+                "Bellek bütçesi yalnızca paylaşılmayan bir şeride bağlanabilir."
+            )
+        for page in pages.values():
+            budget.admit(page)
+        self._budget = budget
+    
+    def get_memory_budget(self) -> Optional[MemoryBudget]:
+        return self._budget
+    
+    def _encode(self, symbol: str) -> int:
+        if symbol == self._blank_symbol:
+            return 0
+        if len(symbol) != 1 or not 0 < ord(symbol) < 256:
+            raise ValueError(
+                f"Geçersiz şerit sembolü: {symbol!r}. "
+                "Semboller tek karakterlik Latin-1 karakterleri olmalıdır."
+            )
+        return ord(symbol)
     
     def read(self, position: int) -> str:
-        return self._cells.get(position, self._blank_symbol)
+        page = self._table.pages.get(position >> self.PAGE_SHIFT)
+        if page is None:
+            return self._blank_symbol
+        cells = page.cells
+        if cells is None:
+            cells = self._load(page)
+        page.referenced = True
+        code = cells[position & self.PAGE_MASK]
+        return chr(code) if code else self._blank_symbol
     
     def write(self, position: int, symbol: str) -> None:
-        if symbol == self._blank_symbol:
-            if position in self._cells:
-                del self._cells[position]
+        if self._read_only:
+            raise RuntimeError("Anlık görüntü şeridine yazılamaz. fork() kullanın.")
+        
+        code = self._encode(symbol)
+        page_index = position >> self.PAGE_SHIFT
+        offset = position & self.PAGE_MASK
+        page = self._table.pages.get(page_index)
+        
+        if page is None:
+            if not code:
+                return
+            page = self._writable_page(page_index)
+            previous = 0
         else:
-            self._cells[position] = symbol
+            cells = page.cells
+            if cells is None:
+                cells = self._load(page)
+            page.referenced = True
+            previous = cells[offset]
+            if previous == code:
+                return
+            if page.refs > 1 or self._table.refs > 1:
+                page = self._writable_page(page_index)
+        
+        page.cells[offset] = code
+        histogram = self._histogram
+        histogram[previous] -= 1
+        histogram[code] += 1
+        if not previous:
+            page.count += 1
+        elif not code:
+            page.count -= 1
+            if not page.count:
+                del self._table.pages[page_index]
+                self._drop_page(page)
+        
+        self._update_range(position, code)
+    
+    def fill(self, start: int, stop: int, symbol: str) -> None:
+        if self._read_only:
+            raise RuntimeError("Anlık görüntü şeridine yazılamaz. fork() kullanın.")
+        if stop <= start:
+            return
         
-        self._update_range()
+        code = self._encode(symbol)
+        run = bytes([code]) * self.PAGE_SIZE
+        position = start
+        while position < stop:
+            page_index = position >> self.PAGE_SHIFT
+            base = page_index << self.PAGE_SHIFT
+            low = position - base
+            high = min(stop - base, self.PAGE_SIZE)
+            position = base + high
+            
+            if page_index not in self._table.pages:
+                if not code:
+                    continue
+            page = self._writable_page(page_index)
+            cells = page.cells
+            previous = (high - low) - cells.count(0, low, high)
+            for previous_code in set(cells[low:high]):
+                self._histogram[previous_code] -= cells.count(previous_code, low, high)
+            self._histogram[code] += high - low
+            cells[low:high] = run[:high - low]
+            page.count += (high - low if code else 0) - previous
+            if not page.count:
+                del self._table.pages[page_index]
+                self._drop_page(page)
+        
+        if code:
+            self._update_range(start, code)
+            self._update_range(stop - 1, code)
+        elif not self._is_empty and start <= self._max_position and stop > self._min_position:
+            self._range_dirty = True
+    
+    def _writable_page(self, page_index: int) -> _Page:
+        table = self._table
+        if table.refs > 1:
+            for shared_page in table.pages.values():
+                shared_page.refs += 1
+            self._release_table(table)
+            table = _PageTable(dict(table.pages))
+            self._table = table
+        
+        page = table.pages.get(page_index)
+        if page is None:
+            page = _Page(bytearray(self.PAGE_SIZE))
+            if self._budget is not None:
+                self._budget.admit(page)
+            table.pages[page_index] = page
+        elif page.refs > 1:
+            shared = page
+            cells = shared.cells
+            if cells is None:
+                cells = self._load(shared)
+            page = _Page(bytearray(cells), shared.count)
+            if self._budget is not None:
+                self._budget.admit(page)
+            shared.refs -= 1
+            table.pages[page_index] = page
+        elif page.cells is None:
+            self._load(page)
+        return page
+    
+    def _update_range(self, position: int, code: int) -> None:
+        if code:
+            if self._is_empty:
+                self._min_position = position
+                self._max_position = position
+                self._is_empty = False
+            elif position < self._min_position:
+                self._min_position = position
+            elif position > self._max_position:
+                self._max_position = position
+        elif position == self._min_position or position == self._max_position:
+            self._range_dirty = True
     
-    def _update_range(self) -> None:
-        if self._cells:
-            self._min_position = min(self._cells.keys())
-            self._max_position = max(self._cells.keys())
+    def _recompute_range(self) -> None:
+        pages = self._table.pages
+        if pages:
+            first_index = min(pages)
+            last_index = max(pages)
+            first_cells = self._cells_of(pages[first_index])
+            last_cells = self._cells_of(pages[last_index])
+            self._min_position = (
+                (first_index << self.PAGE_SHIFT)
+                + len(first_cells) - len(first_cells.lstrip(b'\x00'))
+            )
+            self._max_position = (
+                (last_index << self.PAGE_SHIFT)
+                + len(last_cells.rstrip(b'\x00')) - 1
+            )
+            self._is_empty = False
         else:
             self._min_position = 0
             self._max_position = 0
+            self._is_empty = True
+        self._range_dirty = False
+    
+    def _cells_of(self, page: _Page) -> bytearray:
+        cells = page.cells
+        if cells is None:
+            cells = self._load(page)
+        return cells
     
     def get_visible_range(self) -> Tuple[int, int]:
-        if not self._cells:
+        if self._range_dirty:
+            self._recompute_range()
+        if self._is_empty:
             return (0, 0)
         return (self._min_position, self._max_position)
     
+    def read_range(self, start: int, stop: int) -> str:
+        if stop <= start:
+            return ""
+        return bytes(self.read_range_bytes(start, stop)).decode('latin-1').replace(
+            '\x00', self._blank_symbol
+        )
+    
+    def read_range_bytes(self, start: int, stop: int) -> memoryview:
+        if stop <= start:
+            return memoryview(b"")
+        
+        pages = self._table.pages
+        first_page = start >> self.PAGE_SHIFT
+        last_page = (stop - 1) >> self.PAGE_SHIFT
+        
+        if first_page == last_page:
+            page = pages.get(first_page)
+            if page is None:
+                return memoryview(bytes(stop - start))
+            base = first_page << self.PAGE_SHIFT
+            return memoryview(self._cells_of(page))[start - base:stop - base]
+        
+        buffer = bytearray(stop - start)
+        for page_index in range(first_page, last_page + 1):
+            page = pages.get(page_index)
+            if page is None:
+                continue
+            base = page_index << self.PAGE_SHIFT
+            low = max(start, base)
+            high = min(stop, base + self.PAGE_SIZE)
+            buffer[low - start:high - start] = self._cells_of(page)[low - base:high - base]
+        return memoryview(buffer)
+    
+    def count_symbol(self, symbol: str) -> int:
+        code = self._encode(symbol)
+        if code:
+            return self._histogram[code]
+        if self.is_empty():
+            return 0
+        low, high = self.get_visible_range()
+        return high - low + 1 - (sum(self._histogram) - self._histogram[0])
+    
+    def get_symbol_counts(self) -> Dict[str, int]:
+        return {
+            chr(code): count
+            for code, count in enumerate(self._histogram)
+            if code and count
+        }
+    
+    def is_empty(self) -> bool:
+        return not self._table.pages
+    
     def get_all_symbols(self) -> Dict[int, str]:
-        return self._cells.copy()
+        result = {}
+        for page_index in sorted(self._table.pages):
+            self._collect(page_index, 0, self.PAGE_SIZE, result)
+        return result
     
     def get_symbol_at_range(self, min_pos: int, max_pos: int) -> Dict[int, str]:
         result = {}
-        for pos in range(min_pos, max_pos + 1):
-            symbol = self.read(pos)
-            if symbol != self._blank_symbol:
-                result[pos] = symbol
+        pages = self._table.pages
+        if not pages or max_pos < min_pos:
+            return result
+        
+        first_page = max(min_pos >> self.PAGE_SHIFT, min(pages))
+        last_page = min(max_pos >> self.PAGE_SHIFT, max(pages))
+        if last_page - first_page + 1 > len(pages):
+            page_indices = sorted(
+                index for index in pages if first_page <= index <= last_page
+            )
+        else:
+            page_indices = [
+                index for index in range(first_page, last_page + 1) if index in pages
+            ]
+        
+        for page_index in page_indices:
+            base = page_index << self.PAGE_SHIFT
+            start = max(min_pos - base, 0)
+            stop = min(max_pos - base + 1, self.PAGE_SIZE)
+            self._collect(page_index, start, stop, result)
         return result
     
+    def _collect(self, page_index: int, start: int, stop: int, result: Dict[int, str]) -> None:
+        base = page_index << self.PAGE_SHIFT
+        cells = self._cells_of(self._table.pages[page_index])
+        for run in self._NONBLANK_RUN.finditer(cells, start, stop):
+            position = base + run.start()
+            for symbol in run.group().decode('latin-1'):
+                result[position] = symbol
+                position += 1
+    
+    @classmethod
+    def from_bytes(cls, data: bytes, origin: int = 0, blank_symbol: str = 'B') -> 'Tape':
+        tape = cls(blank_symbol=blank_symbol)
+        for run in re.finditer(rb'([^\x00])\1*', data):
+            tape.fill(origin + run.start(), origin + run.end(), run.group(1).decode('latin-1'))
+        return tape
+    
     def initialize_from_list(self, symbols: list, start_position: int = 0) -> None:
-        self._cells.clear()
+        if self._read_only:
+            raise RuntimeError("Anlık görüntü şeridine yazılamaz. fork() kullanın.")
+        
+        self._release_table(self._table)
+        self._table = _PageTable()
+        self._is_empty = True
+        self._range_dirty = False
+        self._min_position = 0
+        self._max_position = 0
+        self._histogram = [0] * 256
         for i, symbol in enumerate(symbols):
-            if symbol != self._blank_symbol:
-                self._cells[start_position + i] = symbol
-        self._update_range()
+            self.write(start_position + i, symbol)
     
     def get_blank_symbol(self) -> str:
         return self._blank_symbol
+    
+    def fork(self) -> 'Tape':
+        return self._share(read_only=False)
+    
+    def snapshot(self) -> 'Tape':
+        if self._read_only:
+            return self
+        return self._share(read_only=True)
+    
+    def is_read_only(self) -> bool:
+        return self._read_only
+    
+    def _share(self, read_only: bool) -> 'Tape':
+        clone = Tape.__new__(Tape)
+        clone._blank_symbol = self._blank_symbol
+        clone._table = self._table
+        clone._read_only = read_only
+        clone._min_position = self._min_position
+        clone._max_position = self._max_position
+        clone._is_empty = self._is_empty
+        clone._range_dirty = self._range_dirty
+        clone._histogram = list(self._histogram)
+        clone._budget = self._budget
+        self._table.refs += 1
+        return clone
+    
+    def get_page_count(self) -> int:
+        return len(self._table.pages)
+    
+    def get_memory_usage(self) -> int:
+        return sum(
+            self.PAGE_SIZE for page in self._table.pages.values() if page.cells is not None
+        )
 
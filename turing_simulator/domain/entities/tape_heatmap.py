@@ -0,0 +1,122 @@
+import csv
+from array import array
+from typing import List, Tuple
+from .step_result import StepResult
+
+
+class TapeHeatmap:
+    
+    _INITIAL_CAPACITY = 64
+    
+    def __init__(self):
+        self._reset()
+    
+    def _reset(self) -> None:
+        self._origin = -(self._INITIAL_CAPACITY // 2)
+        self._visits = array('L', [0]) * self._INITIAL_CAPACITY
+        self._writes = array('L', [0]) * self._INITIAL_CAPACITY
+        self._min_position = 0
+        self._max_position = -1
+        self._max_visits = 0
+        self._max_writes = 0
+        self._step_count = 0
+    
+    def record_step(self, step_result: StepResult) -> None:
+        position = step_result.head_position
+        if step_result.direction == 'R':
+            position -= 1
+        elif step_result.direction == 'L':
+            position += 1
+        
+        self.record(position, wrote=step_result.transition is not None)
+    
+    def record(self, position: int, wrote: bool = True) -> None:
+        index = self._ensure_index(position)
+        
+        visits = self._visits[index] + 1
+        self._visits[index] = visits
+        if visits > self._max_visits:
+            self._max_visits = visits
+        
+        if wrote:
+            writes = self._writes[index] + 1
+            self._writes[index] = writes
+            if writes > self._max_writes:
+                self._max_writes = writes
+        
+        if position < self._min_position or self._max_position < self._min_position:
+            self._min_position = position
+        if position > self._max_position:
+            self._max_position = position
+        
+        self._step_count += 1
+    
+    def _ensure_index(self, position: int) -> int:
+        index = position - self._origin
+        capacity = len(self._visits)
+        
+        if 0 <= index < capacity:
+            return index
+        
+        if index < 0:
+            grow = max(capacity, -index)
+            padding = array('L', [0]) * grow
+            self._visits = padding + self._visits
+            self._writes = padding + self._writes
+            self._origin -= grow
+            return index + grow
+        
+        grow = max(capacity, index - capacity + 1)
+        padding = array('L', [0]) * grow
+        self._visits.extend(padding)
+        self._writes.extend(padding)
+        return index
+    
+    def get_visits(self, position: int) -> int:
+        index = position - self._origin
+        if 0 <= index < len(self._visits):
+            return self._visits[index]
+        return 0
+    
+    def get_writes(self, position: int) -> int:
+        index = position - self._origin
+        if 0 <= index < len(self._writes):
+            return self._writes[index]
+        return 0
+    
+    def get_range(self) -> Tuple[int, int]:
+        if self._max_position < self._min_position:
+            return (0, 0)
+        return (self._min_position, self._max_position)
+    
+    def get_max_visits(self) -> int:
+        return self._max_visits
+    
+    def get_max_writes(self) -> int:
+        return self._max_writes
+    
+    def get_step_count(self) -> int:
+        return self._step_count
+    
+    def is_empty(self) -> bool:
+        return self._step_count == 0
+    
+    def to_rows(self) -> List[Tuple[int, int, int]]:
+        if self.is_empty():
+            return []
+        
+        start = self._min_position - self._origin
+        stop = self._max_position - self._origin + 1
+        return [
+            (self._origin + index, self._visits[index], self._writes[index])
+            for index in range(start, stop)
+        ]
+    
+    def export_csv(self, file_path: str) -> None:
+        with open(file_path, 'w', newline='', encoding='utf-8') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(['position', 'visits', 'writes'])
+            writer.writerows(self.to_rows())
+    
+    def clear(self) -> None:
+        self._reset()
@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from typing import List, Tuple
+from ..interfaces.itape import ITape
+
+
+@dataclass
+class TapeTextWindow:
+    head: int
+    radius: int
+    text: str
+    low: int
+    high: int
+    is_empty: bool = False
+    
+    @classmethod
+    def from_tape(cls, tape: ITape, head: int, radius: int) -> 'TapeTextWindow':
+        origin = head - radius
+        text = tape.read_range(origin, head + radius + 1)
+        if tape.is_empty():
+            return cls(head, radius, text, origin, origin - 1, True)
+        min_pos, max_pos = tape.get_visible_range()
+        return cls(
+            head,
+            radius,
+            text,
+            min(max(min_pos, origin), head + radius + 1),
+            max(min(max_pos, head + radius), origin - 1)
+        )
+    
+    def get_bounds(self, context_size: int) -> Tuple[int, int]:
+        return (
+            max(self.low, self.head - context_size),
+            min(self.high, self.head + context_size)
+        )
+    
+    def get_cells(self, start: int, stop: int) -> str:
+        origin = self.head - self.radius
+        return self.text[start - origin:stop - origin].replace('B', '□')
+
+
+class TapeTextTracker:
+    
+    RADIUS = 7
+    
+    def __init__(self, tape: ITape, head: int, radius: int = RADIUS):
+        self._tape = tape
+        self._blank_symbol = tape.get_blank_symbol()
+        self._radius = radius
+        self._origin = head - radius
+        self._cells: List[str] = list(tape.read_range(self._origin, head + radius + 1))
+        self._left_count = 0
+        self._right_count = 0
+        if not tape.is_empty():
+            min_pos, max_pos = tape.get_visible_range()
+            self._left_count = self._count(min_pos, self._origin)
+            self._right_count = self._count(head + radius + 1, max_pos + 1)
+    
+    def get_radius(self) -> int:
+        return self._radius
+    
+    def _count(self, start: int, stop: int) -> int:
+        if stop <= start:
+            return 0
+        data = self._tape.read_range_bytes(start, stop)
+        return len(data) - bytes(data).count(0)
+    
+    def advance(self, position: int, symbol: str, head: int) -> TapeTextWindow:
+        cells = self._cells
+        blank = self._blank_symbol
+        cells[position - self._origin] = symbol
+        
+        shift = head - self._radius - self._origin
+        while shift > 0:
+            if cells.pop(0) != blank:
+                self._left_count += 1
+            self._origin += 1
+            entering = self._tape.read(self._origin + len(cells))
+            if entering != blank:
+                self._right_count -= 1
+            cells.append(entering)
+            shift -= 1
+        while shift < 0:
+            if cells.pop() != blank:
+                self._right_count += 1
+            self._origin -= 1
+            entering = self._tape.read(self._origin)
+            if entering != blank:
+                self._left_count -= 1
+            cells.insert(0, entering)
+            shift += 1
+        return self.get_window()
+    
+    def get_window(self) -> TapeTextWindow:
+        text = "".join(self._cells)
+        origin = self._origin
+        end = origin + len(text)
+        blank = self._blank_symbol
+        
+        if self._left_count:
+            low = origin
+        else:
+            low = end - len(text.lstrip(blank))
+        if self._right_count:
+            high = end - 1
+        else:
+            high = origin + len(text.rstrip(blank)) - 1
+        
+        return TapeTextWindow(
+            origin + self._radius,
+            self._radius,
+            text,
+            low,
+            high,
+            low == end and not self._right_count
+        )
@@ -1,9 +1,11 @@
 from typing import Callable, Dict, Optional, Tuple
 from ..interfaces.ituring_machine import ITuringMachine
 from ..interfaces.itape import ITape
+from ..interfaces.istep_observer import IStepObserver
 from .state import State
 from .transition import Transition
 from .step_result import StepResult
+from .tape_text_window import TapeTextTracker
 
 
 class TuringMachine(ITuringMachine):
@@ -20,9 +22,13 @@ class TuringMachine(ITuringMachine):
     ):
         self._states = {state.name: state for state in states}
         self._initial_state = initial_state
-        self._transitions = transitions
+        self._transitions = dict(transitions)
         self._blank_symbol = blank_symbol
-        self._final_states = final_states or []
+        self._final_states = list(final_states or [])
+        self._fingerprint: Optional[str] = None
+        self._observers: Tuple[IStepObserver, ...] = ()
+        self._tape_window_radius = 0
+        self._text_tracker: Optional[TapeTextTracker] = None
         
         self._current_state = initial_state
         self._tape: Optional[ITape] = None
@@ -49,6 +55,9 @@ class TuringMachine(ITuringMachine):
                 break
         
         if self._step_count >= self.MAX_STEPS:
+            if self._observers:
+                for observer in self._observers:
+                    observer.on_budget(self._step_count, self.MAX_STEPS)
             raise RuntimeError(
                 f"Makine {self.MAX_STEPS} adım içinde durmadı. "
                 "Sonsuz döngü olabilir."
@@ -63,6 +72,17 @@ class TuringMachine(ITuringMachine):
         if self._tape is None:
             raise RuntimeError("Şerit başlatılmamış. reset() çağırın.")
         
+        if self._observers:
+            for observer in self._observers:
+                observer.on_pre_step(
+                    self._step_count + 1, self._current_state, self._head_position
+                )
+        
+        tracker = self._text_tracker
+        if tracker is None and self._tape_window_radius:
+            tracker = TapeTextTracker(self._tape, self._head_position, self._tape_window_radius)
+            self._text_tracker = tracker
+        
         previous_state = self._current_state
         self._step_count += 1
         
@@ -73,7 +93,7 @@ class TuringMachine(ITuringMachine):
         
         if transition is None:
             self._is_halted = True
-            return StepResult(
+            result = StepResult(
                 step_number=self._step_count,
                 previous_state=previous_state,
                 current_state=self._current_state,
@@ -81,32 +101,37 @@ class TuringMachine(ITuringMachine):
                 write_symbol=read_symbol,
                 direction='',
                 head_position=self._head_position,
-                tape_snapshot=self._tape.get_all_symbols(),
+                tape_snapshot=self._tape.snapshot(),
                 is_halted=True,
-                explanation=(
-                    f"Geçersiz geçiş: {self._current_state.name} durumunda "
-                    f"'{read_symbol}' sembolü için geçiş tanımlı değil."
-                )
+                tape_window=tracker.get_window() if tracker else None
             )
+            if self._observers:
+                self._notify_post_step(result)
+            return result
         
         write_symbol = transition.write_symbol
         direction = transition.direction
         
-        self._tape.write(self._head_position, write_symbol)
+        written_position = self._head_position
+        self._tape.write(written_position, write_symbol)
         
         if direction == 'L':
             self._head_position -= 1
         elif direction == 'R':
             self._head_position += 1
         
+        tape_window = None
+        if tracker is not None:
+            tape_window = tracker.advance(written_position, write_symbol, self._head_position)
+        
         self._current_state = transition.to_state
         
         if self._current_state in self._final_states:
             self._is_halted = True
         
-        tape_snapshot = self._tape.get_all_symbols()
+        tape_snapshot = self._tape.snapshot()
         
-        return StepResult(
+        result = StepResult(
             step_number=self._step_count,
             previous_state=previous_state,
             current_state=self._current_state,
@@ -116,7 +141,31 @@ class TuringMachine(ITuringMachine):
             head_position=self._head_position,
             tape_snapshot=tape_snapshot,
             transition=transition,
-            is_halted=self._is_halted
+            is_halted=self._is_halted,
+            tape_window=tape_window
+        )
+        if self._observers:
+            self._notify_post_step(result)
+        return result
+    
+    def _notify_post_step(self, result: StepResult) -> None:
+        for observer in self._observers:
+            observer.on_post_step(result)
+            if result.is_halted:
+                observer.on_halt(result)
+    
+    def set_tape_window_radius(self, radius: int) -> None:
+        if radius != self._tape_window_radius:
+            self._tape_window_radius = max(radius, 0)
+            self._text_tracker = None
+    
+    def add_observer(self, observer: IStepObserver) -> None:
+        if observer not in self._observers:
+            self._observers = self._observers + (observer,)
+    
+    def remove_observer(self, observer: IStepObserver) -> None:
+        self._observers = tuple(
+            registered for registered in self._observers if registered is not observer
         )
     
     def reset(self, tape: ITape) -> None:
@@ -125,10 +174,51 @@ class TuringMachine(ITuringMachine):
         self._head_position = 0
         self._step_count = 0
         self._is_halted = False
+        self._text_tracker = None
+    
+    def restore(
+        self,
+        tape: ITape,
+        state: State,
+        head_position: int,
+        step_count: int,
+        is_halted: bool = False
+    ) -> None:
+        if state.name not in self._states:
+            raise ValueError(f"Makinede '{state.name}' durumu tanımlı değil.")
+        if tape.is_read_only():
+            tape = tape.fork()
+        self._tape = tape
+        self._current_state = self._states[state.name]
+        self._head_position = head_position
+        self._step_count = step_count
+        self._is_halted = is_halted
+        self._text_tracker = None
     
     def get_current_state(self) -> State:
         return self._current_state
     
+    def get_initial_state(self) -> State:
+        return self._initial_state
+    
+    def get_states(self) -> list[State]:
+        return list(self._states.values())
+    
+    def get_final_states(self) -> list[State]:
+        return list(self._final_states)
+    
+    def get_blank_symbol(self) -> str:
+        return self._blank_symbol
+    
+    def get_tape_count(self) -> int:
+        return 1
+    
+    def get_fingerprint(self) -> str:
+        if self._fingerprint is None:
+            from ..engine.compiled_table import CompiledTransitionTable
+            self._fingerprint = CompiledTransitionTable.from_machine(self).fingerprint()
+        return self._fingerprint
+    
     def get_transitions(self) -> Dict[Tuple[State, str], Transition]:
         return self._transitions.copy()
     
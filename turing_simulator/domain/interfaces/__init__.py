@@ -1,6 +1,9 @@
+from .. import entities
 from .itape import ITape
 from .ituring_machine import ITuringMachine
 from .istep_explainer import IStepExplainer
+from .istep_observer import IStepObserver
+from .ispillable import ISpillable
 
-__all__ = ['ITape', 'ITuringMachine', 'IStepExplainer']
+__all__ = ['ITape', 'ITuringMachine', 'IStepExplainer', 'IStepObserver', 'ISpillable']
 
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class ISpillable(ABC):
+    
+    @abstractmethod
+    def get_spill_size(self) -> int:
+        pass
+    
+    @abstractmethod
+    def take_reference(self) -> bool:
+        pass
+    
+    @abstractmethod
+    def spill_out(self) -> bytes:
+        pass
+    
+    @abstractmethod
+    def spill_in(self, data: bytes) -> None:
+        pass
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from ..entities.state import State
+from ..entities.step_result import StepResult
+
+
+class IStepObserver(ABC):
+    
+    @abstractmethod
+    def on_pre_step(self, step_number: int, state: State, head_position: int) -> None:
+        pass
+    
+    @abstractmethod
+    def on_post_step(self, result: StepResult) -> None:
+        pass
+    
+    @abstractmethod
+    def on_halt(self, result: StepResult) -> None:
+        pass
+    
+    @abstractmethod
+    def on_budget(self, step_count: int, max_steps: int) -> None:
+        pass
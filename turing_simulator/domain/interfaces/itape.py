@@ -23,4 +23,40 @@ class ITape(ABC):
     @abstractmethod
     def get_symbol_at_range(self, min_pos: int, max_pos: int) -> Dict[int, str]:
         pass
+    
+    @abstractmethod
+    def read_range(self, start: int, stop: int) -> str:
+        pass
+    
+    @abstractmethod
+    def read_range_bytes(self, start: int, stop: int) -> memoryview:
+        pass
+    
+    @abstractmethod
+    def count_symbol(self, symbol: str) -> int:
+        pass
+    
+    @abstractmethod
+    def get_symbol_counts(self) -> Dict[str, int]:
+        pass
+    
+    @abstractmethod
+    def is_empty(self) -> bool:
+        pass
+    
+    @abstractmethod
+    def get_blank_symbol(self) -> str:
+        pass
+    
+    @abstractmethod
+    def snapshot(self) -> 'ITape':
+        pass
+    
+    @abstractmethod
+    def fork(self) -> 'ITape':
+        pass
+    
+    @abstractmethod
+    def is_read_only(self) -> bool:
+        pass
 
@@ -4,6 +4,7 @@ from ..entities.state import State
 from ..entities.transition import Transition
 from ..entities.step_result import StepResult
 from .itape import ITape
+from .istep_observer import IStepObserver
 
 
 class ITuringMachine(ABC):
@@ -24,6 +25,17 @@ class ITuringMachine(ABC):
     def reset(self, tape: ITape) -> None:
         pass
     
+    @abstractmethod
+    def restore(
+        self,
+        tape: ITape,
+        state: State,
+        head_position: int,
+        step_count: int,
+        is_halted: bool = False
+    ) -> None:
+        pass
+    
     @abstractmethod
     def get_current_state(self) -> State:
         pass
@@ -35,4 +47,32 @@ class ITuringMachine(ABC):
     @abstractmethod
     def is_halted(self) -> bool:
         pass
+    
+    @abstractmethod
+    def get_head_position(self) -> int:
+        pass
+    
+    @abstractmethod
+    def get_step_count(self) -> int:
+        pass
+    
+    @abstractmethod
+    def get_states(self) -> list[State]:
+        pass
+    
+    @abstractmethod
+    def get_fingerprint(self) -> str:
+        pass
+    
+    @abstractmethod
+    def set_tape_window_radius(self, radius: int) -> None:
+        pass
+    
+    @abstractmethod
+    def add_observer(self, observer: IStepObserver) -> None:
+        pass
+    
+    @abstractmethod
+    def remove_observer(self, observer: IStepObserver) -> None:
+        pass
 
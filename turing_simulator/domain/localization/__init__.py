@@ -0,0 +1,7 @@
+from .message_catalog import (
+    MessageCatalog, compile_template, escape_template, get_catalog, get_default_locale,
+    get_locales, set_default_locale
+)
+
+__all__ = ['MessageCatalog', 'compile_template', 'escape_template', 'get_catalog',
+           'get_default_locale', 'get_locales', 'set_default_locale']
@@ -0,0 +1,164 @@
+from string import Formatter
+from types import ModuleType
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+from . import messages_en, messages_tr
+
+
+AlgorithmRule = Tuple[str, str, Tuple[str, ...], Optional[str], str]
+
+ALGORITHM_RULES: Tuple[AlgorithmRule, ...] = (
+    ('previous', 'q0', ('0',), 'X', 'outer_start'),
+    ('current', 'q1', ('0',), '0', 'outer_skip_zeros'),
+    ('previous', 'q1', ('1',), 'Y', 'inner_start'),
+    ('current', 'q2', ('1', '2'), None, 'inner_seek_blank'),
+    ('previous', 'q2', ('B',), '2', 'inner_write_two'),
+    ('current', 'q3', ('1', '2'), None, 'inner_return'),
+    ('previous', 'q3', ('Y',), 'Y', 'inner_marker_reached'),
+    ('previous', 'q4', ('1',), 'Y', 'inner_next'),
+    ('previous', 'q4', ('2',), '2', 'inner_done'),
+    ('current', 'q5', ('0',), '0', 'outer_return'),
+    ('previous', 'q5', ('Y',), '1', 'restore_ones'),
+    ('previous', 'q5', ('X',), 'X', 'outer_marker_reached'),
+    ('previous', 'q6', ('0',), 'X', 'outer_next'),
+    ('previous', 'q6', ('1',), '1', 'outer_done'),
+    ('current', 'q7', ('1',), '1', 'final_seek'),
+    ('previous', 'q7', ('2',), '2', 'final_reached'),
+    ('current', 'q8', ('1',), '1', 'final_halt'),
+)
+
+LOCALES: Dict[str, ModuleType] = {
+    'tr': messages_tr,
+    'en': messages_en,
+}
+
+
+def escape_template(text: str) -> str:
+    return text.replace('{', '{{').replace('}', '}}')
+
+
+def compile_template(template: str) -> Callable[..., str]:
+    fields: List[str] = []
+    parts: List[str] = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if literal:
+            parts.append('f' + repr(escape_template(literal)))
+        if field is None:
+            continue
+        if not field.isidentifier():
+            raise ValueError(f"Geçersiz şablon alanı: {field!r}")
+        if field not in fields:
+            fields.append(field)
+        expression = field
+        if conversion:
+            expression += '!' + conversion
+        if spec:
+            expression += ':' + spec
+        parts.append('f' + repr('{' + expression + '}'))
+    
+    parameters = ''.join(f"{field}, " for field in fields)
+    source = (
+        f"def fill({'*, ' if fields else ''}{parameters}**_):\n"
+        f"    return {' '.join(parts) or repr('')}\n"
+    )
+    namespace: Dict[str, object] = {}
+    exec(compile(source, '<message>', 'exec'), namespace)
+    return namespace['fill']
+
+
+class MessageCatalog:
+    
+    def __init__(
+        self,
+        locale: str,
+        messages: Dict[str, str],
+        state_descriptions: Dict[str, str],
+        algorithm_notes: Dict[str, str]
+    ):
+        self._locale = locale
+        self._templates = dict(messages)
+        self._formatters: Dict[str, Callable[..., str]] = {
+            key: compile_template(template) for key, template in messages.items()
+        }
+        self._directions = {
+            ('L', False): messages['direction.left'],
+            ('R', False): messages['direction.right'],
+            ('L', True): messages['direction.left_article'],
+            ('R', True): messages['direction.right_article'],
+        }
+        self._no_direction = messages['direction.none']
+        self._state_descriptions = dict(state_descriptions)
+        self._no_state_description = messages['explain.no_state_description']
+        self._rules: List[Tuple[bool, str, FrozenSet[str], Optional[str], str]] = [
+            (field == 'previous', state, frozenset(reads), write, algorithm_notes[note])
+            for field, state, reads, write, note in ALGORITHM_RULES
+        ]
+        self._algorithm_notes: Dict[Tuple[str, str, str, str], str] = {}
+    
+    def get_locale(self) -> str:
+        return self._locale
+    
+    def get_template(self, key: str) -> str:
+        return self._templates[key]
+    
+    def formatter(self, key: str) -> Callable[..., str]:
+        return self._formatters[key]
+    
+    def format(self, key: str, **fields: object) -> str:
+        return self._formatters[key](**fields)
+    
+    def direction(self, direction: str, with_article: bool = False) -> str:
+        return self._directions.get((direction, with_article), self._no_direction)
+    
+    def state_description(self, state_name: str) -> str:
+        return self._state_descriptions.get(state_name, self._no_state_description)
+    
+    def algorithm_note(self, previous: str, current: str, read: str, write: str) -> str:
+        key = (previous, current, read, write)
+        note = self._algorithm_notes.get(key)
+        if note is None:
+            note = ""
+            for match_previous, state, reads, expected, text in self._rules:
+                if ((previous if match_previous else current) == state and read in reads
+                        and write == (read if expected is None else expected)):
+                    note = text
+                    break
+            self._algorithm_notes[key] = note
+        return note
+
+
+_catalogs: Dict[str, MessageCatalog] = {}
+_default_locale = 'tr'
+
+
+def get_locales() -> List[str]:
+    return list(LOCALES)
+
+
+def get_default_locale() -> str:
+    return _default_locale
+
+
+def set_default_locale(locale: str) -> None:
+    global _default_locale
+    get_catalog(locale)
+    _default_locale = locale
+
+
+def get_catalog(locale: Optional[str] = None) -> MessageCatalog:
+    locale = locale or _default_locale
+    catalog = _catalogs.get(locale)
+    if catalog is None:
+        module = LOCALES.get(locale)
+        if module is None:
+            raise ValueError(
+                f"Desteklenmeyen dil: {locale!r}. "
+                f"Seçenekler: {', '.join(LOCALES)}"
+            )
+        catalog = MessageCatalog(
+            locale,
+            {**messages_tr.MESSAGES, **module.MESSAGES},
+            {**messages_tr.STATE_DESCRIPTIONS, **module.STATE_DESCRIPTIONS},
+            {**messages_tr.ALGORITHM_NOTES, **module.ALGORITHM_NOTES}
+        )
+        _catalogs[locale] = catalog
+    return catalog
@@ -0,0 +1,145 @@
+MESSAGES = {
+    'direction.left': "Left",
+    'direction.right': "Right",
+    'direction.left_article': "left",
+    'direction.right_article': "right",
+    'direction.none': "None",
+    'step.summary': (
+        "Step {step}: {previous} → {current} | Read: {read}, "
+        "Written: {write}, Direction: {direction}"
+    ),
+    'tape.empty': "(Empty tape)",
+    'tape.position': "(Position: {head}, State: {state})",
+    'explain.halted': "The machine halted.",
+    'explain.invalid_transition': (
+        "Invalid transition: no transition is defined in state {state} for symbol '{read}'."
+    ),
+    'explain.step': (
+        "Step {step}: State Transition\n"
+        "  State: {previous} → {current}\n"
+        "  Read Symbol: '{read}'\n"
+        "  Written Symbol: '{write}'\n"
+        "  Direction: {direction}\n"
+        "  Head Position: {head}\n"
+        "\n"
+        "  State Description: {state_description}"
+        "{transition_section}\n"
+        "\n"
+        "  Tape:\n"
+        "{tape}"
+        "{algorithm_section}"
+    ),
+    'explain.transition_section': "\n\n  Transition: {text}",
+    'explain.algorithm_section': "\n\n  Algorithm: {text}",
+    'explain.transition': (
+        "In state {from_state} the symbol '{read}' was read, '{write}' was written, "
+        "the head moved {direction} and the machine entered state {to_state}."
+    ),
+    'explain.no_state_description': "No description available for this state.",
+    'log.entry': "{rule}\nStep {step}\n{rule}\n{body}{halted}\n",
+    'log.fields': (
+        "State Transition: {previous} → {current}\n"
+        "Read Symbol: '{read}'\n"
+        "Written Symbol: '{write}'\n"
+        "Direction: {direction}\n"
+        "Head Position: {head}"
+    ),
+    'log.halted': "\n\n*** MACHINE HALTED ***",
+}
+
+STATE_DESCRIPTIONS = {
+    'q0': "Initial state. Starts the first pass of the outer loop.",
+    'q1': "Starts the first pass of the inner loop.",
+    'q2': "Moves right and turns the first 'B' into a '2'.",
+    'q3': "Walks back to the marker during the inner loop.",
+    'q4': (
+        "Starts the next pass of the inner loop; "
+        "once the inner loop is done, starts the return of the outer loop."
+    ),
+    'q5': (
+        "Walks back during the outer loop "
+        "and restores the block of 1s on the way."
+    ),
+    'q6': "Starts the next pass of the outer loop.",
+    'q7': (
+        "Final configuration: moves the head "
+        "to the start of the block of 2s."
+    ),
+    'q8': (
+        "Final configuration: moves the head "
+        "to the start of the block of 2s."
+    ),
+}
+
+ALGORITHM_NOTES = {
+    'outer_start': (
+        "The first '0' was marked with 'X'. This starts the outer loop. "
+        "For every '0' the block of '1's will be copied (adding m to itself n times)."
+    ),
+    'outer_skip_zeros': "Outer loop: skipping the '0' symbols until the first '1'.",
+    'inner_start': (
+        "The first '1' was reached and marked with 'Y'. "
+        "This starts the inner loop. "
+        "The block of '1's will now be copied."
+    ),
+    'inner_seek_blank': (
+        "Inner loop: skipping the existing '1's and the '2's written so far, "
+        "looking for the first blank cell (B)."
+    ),
+    'inner_write_two': (
+        "The first blank cell (B) was reached and a '2' was written. "
+        "This is part of the product. "
+        "Now the head returns to process the next '1'."
+    ),
+    'inner_return': (
+        "Inner loop return: skipping '1's and '2's "
+        "back to the marked 'Y' symbol."
+    ),
+    'inner_marker_reached': (
+        "Back at the marked 'Y' symbol. "
+        "If more '1's remain, the inner loop continues; "
+        "otherwise the outer loop starts walking back."
+    ),
+    'inner_next': (
+        "The inner loop continues: the next '1' is marked with 'Y'. "
+        "A '2' will be written for this '1' too."
+    ),
+    'inner_done': (
+        "The inner loop is complete. Every '1' was processed. "
+        "Now the outer loop starts walking back."
+    ),
+    'outer_return': (
+        "Outer loop return: skipping the '0' symbols "
+        "back to the marked 'X' symbol."
+    ),
+    'restore_ones': (
+        "The marked 'Y' symbols are turned back into '1's. "
+        "This restores the original block of 1s."
+    ),
+    'outer_marker_reached': (
+        "Back at the marked 'X' symbol. "
+        "If more '0's remain, the outer loop continues; "
+        "otherwise the final configuration begins."
+    ),
+    'outer_next': (
+        "The outer loop continues: the next '0' is marked with 'X'. "
+        "The block of '1's will be copied for this '0' too."
+    ),
+    'outer_done': (
+        "Every '0' was processed. The outer loop is complete. "
+        "Moving to the final configuration: "
+        "the head will be placed at the start of the block of 2s."
+    ),
+    'final_seek': (
+        "Final configuration: skipping the block of '1's "
+        "to reach the start of the block of 2s."
+    ),
+    'final_reached': (
+        "The start of the block of 2s was reached. "
+        "The machine enters its final configuration."
+    ),
+    'final_halt': (
+        "Final configuration: the head is at the start of the block of 2s. "
+        "The computation is complete. Result: n×m '2's."
+    ),
+}
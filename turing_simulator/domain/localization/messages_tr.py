@@ -0,0 +1,145 @@
+MESSAGES = {
+    'direction.left': "Sol",
+    'direction.right': "Sağ",
+    'direction.left_article': "sola",
+    'direction.right_article': "sağa",
+    'direction.none': "Yok",
+    'step.summary': (
+        "Adım {step}: {previous} → {current} | Okunan: {read}, "
+        "Yazılan: {write}, Yön: {direction}"
+    ),
+    'tape.empty': "(Boş şerit)",
+    'tape.position': "(Pozisyon: {head}, Durum: {state})",
+    'explain.halted': "Makine durdu.",
+    'explain.invalid_transition': (
+        "Geçersiz geçiş: {state} durumunda '{read}' sembolü için geçiş tanımlı değil."
+    ),
+    'explain.step': (
+        "Adım {step}: Durum Geçişi\n"
+        "  Durum: {previous} → {current}\n"
+        "  Okunan Sembol: '{read}'\n"
+        "  Yazılan Sembol: '{write}'\n"
+        "  Hareket Yönü: {direction}\n"
+        "  Kafa Pozisyonu: {head}\n"
+        "\n"
+        "  Durum Açıklaması: {state_description}"
+        "{transition_section}\n"
+        "\n"
+        "  Şerit Durumu:\n"
+        "{tape}"
+        "{algorithm_section}"
+    ),
+    'explain.transition_section': "\n\n  Geçiş Açıklaması: {text}",
+    'explain.algorithm_section': "\n\n  Algoritma Mantığı: {text}",
+    'explain.transition': (
+        "{from_state} durumunda '{read}' sembolü okundu, '{write}' yazıldı, "
+        "{direction} hareket edildi ve {to_state} durumuna geçildi."
+    ),
+    'explain.no_state_description': "Durum açıklaması mevcut değil.",
+    'log.entry': "{rule}\nAdım {step}\n{rule}\n{body}{halted}\n",
+    'log.fields': (
+        "Durum Geçişi: {previous} → {current}\n"
+        "Okunan Sembol: '{read}'\n"
+        "Yazılan Sembol: '{write}'\n"
+        "Hareket Yönü: {direction}\n"
+        "Kafa Pozisyonu: {head}"
+    ),
+    'log.halted': "\n\n*** MAKİNE DURDU ***",
+}
+
+STATE_DESCRIPTIONS = {
+    'q0': "Başlangıç durumu. Dış döngünün ilk adımını başlatır.",
+    'q1': "İç döngünün ilk adımını başlatan durum.",
+    'q2': "İlk 'B'yi '2'ye çevirerek sağa hareket eden durum.",
+    'q3': "İç döngüde geriye dönüşü sağlayan durum.",
+    'q4': (
+        "İç döngünün sonraki adımlarını başlatan; "
+        "iç döngü bitti ise dış döngünün geriye dönüşünü başlatan durum."
+    ),
+    'q5': (
+        "Dış döngünün geriye dönüşünü sağlayan, "
+        "bu arada 1'ler öbeğine eski görünümünü kazandıran durum."
+    ),
+    'q6': "Dış döngünün sonraki adımlarını başlatan durum.",
+    'q7': (
+        "Bitiş konfigürasyonunda, okuma kafasının "
+        "2'ler öbeğinin başında olmasını sağlayan durumlar."
+    ),
+    'q8': (
+        "Bitiş konfigürasyonunda, okuma kafasının "
+        "2'ler öbeğinin başında olmasını sağlayan durumlar."
+    ),
+}
+
+ALGORITHM_NOTES = {
+    'outer_start': (
+        "İlk '0' sembolü 'X' ile işaretlendi. Bu, dış döngünün başlangıcını gösterir. "
+        "Her '0' için, '1'ler öbeği kopyalanacak (m'yi n kez toplama işlemi)."
+    ),
+    'outer_skip_zeros': "Dış döngüde: '0' sembollerini geçiyoruz. İlk '1'e ulaşmayı bekliyoruz.",
+    'inner_start': (
+        "İlk '1' sembolüne ulaşıldı ve 'Y' ile işaretlendi. "
+        "Bu, iç döngünün başlangıcını gösterir. "
+        "Şimdi bu '1' öbeğini kopyalayacağız."
+    ),
+    'inner_seek_blank': (
+        "İç döngüde: Mevcut '1'leri ve oluşturulmuş '2'leri geçiyoruz. "
+        "İlk boş hücreyi (B) arıyoruz."
+    ),
+    'inner_write_two': (
+        "İlk boş hücreye (B) ulaşıldı ve '2' yazıldı. "
+        "Bu, çarpma sonucunun bir parçasıdır. "
+        "Şimdi geriye dönüp bir sonraki '1'i işleyeceğiz."
+    ),
+    'inner_return': (
+        "İç döngüde geriye dönüş: '1'leri ve '2'leri geçerek "
+        "işaretlenmiş 'Y' sembolüne geri dönüyoruz."
+    ),
+    'inner_marker_reached': (
+        "İşaretlenmiş 'Y' sembolüne geri dönüldü. "
+        "Eğer daha fazla '1' varsa, iç döngü devam edecek. "
+        "Yoksa dış döngünün geriye dönüşüne geçilecek."
+    ),
+    'inner_next': (
+        "İç döngü devam ediyor: Bir sonraki '1' 'Y' ile işaretleniyor. "
+        "Bu '1' için de '2' yazılacak."
+    ),
+    'inner_done': (
+        "İç döngü tamamlandı. Tüm '1'ler işlendi. "
+        "Şimdi dış döngünün geriye dönüşüne geçiliyor."
+    ),
+    'outer_return': (
+        "Dış döngüde geriye dönüş: '0' sembollerini geçerek "
+        "işaretlenmiş 'X' sembolüne geri dönüyoruz."
+    ),
+    'restore_ones': (
+        "İşaretlenmiş 'Y' sembolleri tekrar '1'e çevriliyor. "
+        "Bu, 1'ler öbeğinin orijinal görünümünü geri kazandırır."
+    ),
+    'outer_marker_reached': (
+        "İşaretlenmiş 'X' sembolüne geri dönüldü. "
+        "Eğer daha fazla '0' varsa, dış döngü devam edecek. "
+        "Yoksa bitiş konfigürasyonuna geçilecek."
+    ),
+    'outer_next': (
+        "Dış döngü devam ediyor: Bir sonraki '0' 'X' ile işaretleniyor. "
+        "Bu '0' için de '1'ler öbeği kopyalanacak."
+    ),
+    'outer_done': (
+        "Tüm '0'ler işlendi. Dış döngü tamamlandı. "
+        "Şimdi bitiş konfigürasyonuna geçiliyor: "
+        "kafa 2'ler öbeğinin başına konumlandırılacak."
+    ),
+    'final_seek': (
+        "Bitiş konfigürasyonu: '1'ler öbeğini geçerek "
+        "2'ler öbeğinin başına ulaşıyoruz."
+    ),
+    'final_reached': (
+        "2'ler öbeğinin başına ulaşıldı. "
+        "Makine son konfigürasyonuna geçiyor."
+    ),
+    'final_halt': (
+        "Son konfigürasyon: Kafa 2'ler öbeğinin başında. "
+        "Hesaplama tamamlandı. Sonuç: n×m adet '2'."
+    ),
+}
@@ -1,4 +1,7 @@
 from .machine_multiply import create_multiply_machine
+from .machine_multiply_two_tape import create_two_tape_multiply_machine
+from .machine_registry import MACHINE_FACTORIES, create_machine, get_machine_ids
 
-__all__ = ['create_multiply_machine']
+__all__ = ['create_multiply_machine', 'create_two_tape_multiply_machine',
+           'MACHINE_FACTORIES', 'create_machine', 'get_machine_ids']
 
@@ -0,0 +1,97 @@
+from typing import Dict, Tuple
+from ..entities.state import State
+from ..entities.multi_tape_transition import MultiTapeTransition
+from ..engine.multi_tape_machine import MultiTapeTuringMachine
+
+
+def create_two_tape_multiply_machine() -> MultiTapeTuringMachine:
+    q0 = State(
+        name="q0",
+        is_initial=True,
+        description="Başlangıç durumu. 0'lar öbeğini geçerek 1'lere ulaşır."
+    )
+    q1 = State(
+        name="q1",
+        description="1'ler öbeğinin sonuna kadar sağa giden durum."
+    )
+    q2 = State(
+        name="q2",
+        description="1'ler öbeğinin son hücresini silerek öbeği bir hücre kısaltan durum."
+    )
+    q3 = State(
+        name="q3",
+        description=(
+            "1'ler öbeği üzerinde sola dönen; en sağdaki 0'ı 1'e çevirip "
+            "öbeği bir hücre sola kaydıran durum."
+        )
+    )
+    q4 = State(
+        name="q4",
+        description=(
+            "1'ler öbeği üzerinde sağa giderken her 1 için "
+            "ikinci şeride bir '2' yazan durum."
+        )
+    )
+    q5 = State(
+        name="q5",
+        description=(
+            "0 kalmadığında öbeğin sonuna dönüp "
+            "silinen son 1'i geri yazan durum."
+        )
+    )
+    q6 = State(
+        name="q6",
+        description="Bitiş durumu. İkinci şerit n·m adet '2' içerir."
+    )
+    
+    states = [q0, q1, q2, q3, q4, q5, q6]
+    
+    transitions: Dict[Tuple[State, Tuple[str, ...]], MultiTapeTransition] = {
+        (q0, ('0', 'B')): MultiTapeTransition(
+            q0, q0, ('0', 'B'), ('0', 'B'), ('R', 'S')
+        ),
+        (q0, ('1', 'B')): MultiTapeTransition(
+            q0, q1, ('1', 'B'), ('1', 'B'), ('R', 'S')
+        ),
+        (q1, ('1', 'B')): MultiTapeTransition(
+            q1, q1, ('1', 'B'), ('1', 'B'), ('R', 'S')
+        ),
+        (q1, ('B', 'B')): MultiTapeTransition(
+            q1, q2, ('B', 'B'), ('B', 'B'), ('L', 'S')
+        ),
+        (q2, ('1', 'B')): MultiTapeTransition(
+            q2, q3, ('1', 'B'), ('B', 'B'), ('L', 'S')
+        ),
+        (q3, ('1', 'B')): MultiTapeTransition(
+            q3, q3, ('1', 'B'), ('1', 'B'), ('L', 'S')
+        ),
+        (q3, ('0', 'B')): MultiTapeTransition(
+            q3, q4, ('0', 'B'), ('1', '2'), ('R', 'R')
+        ),
+        (q3, ('B', 'B')): MultiTapeTransition(
+            q3, q5, ('B', 'B'), ('B', 'B'), ('R', 'S')
+        ),
+        (q4, ('1', 'B')): MultiTapeTransition(
+            q4, q4, ('1', 'B'), ('1', '2'), ('R', 'R')
+        ),
+        (q4, ('B', 'B')): MultiTapeTransition(
+            q4, q2, ('B', 'B'), ('B', 'B'), ('L', 'S')
+        ),
+        (q5, ('1', 'B')): MultiTapeTransition(
+            q5, q5, ('1', 'B'), ('1', 'B'), ('R', 'S')
+        ),
+        (q5, ('B', 'B')): MultiTapeTransition(
+            q5, q6, ('B', 'B'), ('1', 'B'), ('S', 'S')
+        ),
+    }
+    
+    machine = MultiTapeTuringMachine(
+        states=states,
+        initial_state=q0,
+        transitions=transitions,
+        tape_count=2,
+        blank_symbol='B',
+        final_states=[q6]
+    )
+    
+    return machine
@@ -0,0 +1,19 @@
+from typing import Callable, Dict, List
+from ..entities.turing_machine import TuringMachine
+from .machine_multiply import create_multiply_machine
+
+
+MACHINE_FACTORIES: Dict[str, Callable[[], TuringMachine]] = {
+    'multiply': create_multiply_machine,
+}
+
+
+def create_machine(machine_id: str) -> TuringMachine:
+    factory = MACHINE_FACTORIES.get(machine_id)
+    if factory is None:
+        raise ValueError(f"Bilinmeyen makine: '{machine_id}'")
+    return factory()
+
+
+def get_machine_ids() -> List[str]:
+    return sorted(MACHINE_FACTORIES)
@@ -1,9 +1,13 @@
+import time
 from PyQt6.QtCore import QTimer, QObject, pyqtSignal
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from turing_simulator.domain.interfaces.ituring_machine import ITuringMachine
 from turing_simulator.domain.interfaces.itape import ITape
+from turing_simulator.domain.interfaces.istep_observer import IStepObserver
 from turing_simulator.domain.entities.step_result import StepResult
+from turing_simulator.domain.entities.turing_machine import TuringMachine
 from turing_simulator.application.services.machine_executor import MachineExecutor
+from .step_pacer import PacingStats, StepPacer
 
 
 class ExecutionController(QObject):
@@ -11,24 +15,59 @@ class ExecutionController(QObject):
     step_completed = pyqtSignal(StepResult)
     execution_finished = pyqtSignal(StepResult)
     execution_error = pyqtSignal(str)
+    pacing_updated = pyqtSignal(PacingStats)
     
-    def __init__(self, machine_executor: MachineExecutor):
+    def __init__(
+        self,
+        machine_executor: MachineExecutor,
+        max_steps: int = TuringMachine.MAX_STEPS
+    ):
         super().__init__()
         self._machine_executor = machine_executor
+        self._max_steps = max_steps
+        self._observers: Tuple[IStepObserver, ...] = ()
         self._machine: Optional[ITuringMachine] = None
         self._tape: Optional[ITape] = None
         self._timer: Optional[QTimer] = None
         self._is_running = False
         self._is_paused = False
         self._step_delay_ms = 500
+        self._adaptive = False
+        self._pacer = StepPacer()
     
     def set_machine(self, machine: ITuringMachine) -> None:
         self._machine = machine
     
+    def add_observer(self, observer: IStepObserver) -> None:
+        if observer not in self._observers:
+            self._observers = self._observers + (observer,)
+    
+    def remove_observer(self, observer: IStepObserver) -> None:
+        self._observers = tuple(
+            registered for registered in self._observers if registered is not observer
+        )
+    
     def set_speed(self, delay_ms: int) -> None:
         self._step_delay_ms = delay_ms
         if self._timer:
-            self._timer.setInterval(delay_ms)
+            self._timer.setInterval(self._tick_interval_ms())
+    
+    def set_adaptive(self, enabled: bool) -> None:
+        self._adaptive = enabled
+        self._pacer.reset()
+        if self._timer:
+            self._timer.setInterval(self._tick_interval_ms())
+    
+    def is_adaptive(self) -> bool:
+        return self._adaptive
+    
+    def get_pacing_stats(self) -> PacingStats:
+        return self._pacer.get_stats()
+    
+    def _tick_interval_ms(self) -> int:
+        if self._adaptive:
+            return max(1, int(self._pacer.get_target_frame_ms()))
+        return self._step_delay_ms
     
     def start_execution(
         self, 
@@ -45,14 +84,36 @@ class ExecutionController(QObject):
         
         self._tape = initial_tape
         self._machine.reset(initial_tape)
+        self._start_timer(step_callback, paused=False)
+    
+    def load_execution(
+        self,
+        restored_tape: ITape,
+        step_callback: Optional[Callable[[StepResult], None]] = None
+    ) -> None:
+        if not self._machine:
+            self.execution_error.emit("Makine tanımlanmamış")
+            return
+        
+        self._stop_execution()
+        self._tape = restored_tape
+        if not self._machine.is_halted():
+            self._start_timer(step_callback, paused=True)
+    
+    def _start_timer(
+        self,
+        step_callback: Optional[Callable[[StepResult], None]],
+        paused: bool
+    ) -> None:
         self._is_running = True
-        self._is_paused = False
+        self._is_paused = paused
+        self._pacer.reset()
         
         self._timer = QTimer()
         self._timer.timeout.connect(
             lambda: self._execute_step(step_callback)
         )
-        self._timer.setInterval(self._step_delay_ms)
+        self._timer.setInterval(self._tick_interval_ms())
         self._timer.start()
     
     def _execute_step(
@@ -62,25 +123,93 @@ class ExecutionController(QObject):
         if not self._machine or not self._is_running or self._is_paused:
             return
         
+        pacer = self._pacer
+        planned = pacer.begin_tick(time.perf_counter(), self._tick_interval_ms())
+        if not self._adaptive:
+            planned = 1
+        
+        steps = 0
         try:
-            result = self._machine_executor.step_with_explanation(self._machine)
-            self.step_completed.emit(result)
-            
-            if step_callback:
-                step_callback(result)
-            
-            if result.is_halted:
-                self._stop_execution()
-                self.execution_finished.emit(result)
+            while steps < planned and self._is_running and not self._is_paused:
+                if self._budget_exhausted():
+                    self._stop_execution()
+                    self.execution_error.emit(self._budget_message())
+                    break
+                
+                result = self._perform_step(step_callback)
+                steps += 1
+                
+                if result.is_halted:
+                    self._stop_execution()
+                    self.execution_finished.emit(result)
+                    break
         except RuntimeError as e:
             self._stop_execution()
             self.execution_error.emit(str(e))
+        
+        if pacer.end_tick(time.perf_counter(), steps, not self._is_running):
+            self.pacing_updated.emit(pacer.get_stats())
+    
+    def _perform_step(
+        self,
+        step_callback: Optional[Callable[[StepResult], None]]
+    ) -> StepResult:
+        if self._observers:
+            self._notify_pre_step()
+        
+        started = time.perf_counter()
+        result = self._machine.step()
+        stepped = time.perf_counter()
+        self._machine_executor.explain(result)
+        explained = time.perf_counter()
+        self.step_completed.emit(result)
+        
+        if step_callback:
+            step_callback(result)
+        
+        if self._observers:
+            self._notify_post_step(result)
+        
+        self._pacer.record_step(
+            stepped - started, explained - stepped, time.perf_counter() - explained
+        )
+        return result
+    
+    def _budget_exhausted(self) -> bool:
+        step_count = self._machine.get_step_count()
+        if step_count < self._max_steps:
+            return False
+        if self._observers:
+            for observer in self._observers:
+                observer.on_budget(step_count, self._max_steps)
+        return True
+    
+    def _budget_message(self) -> str:
+        return (
+            f"Makine {self._max_steps} adım içinde durmadı. "
+            "Sonsuz döngü olabilir."
+        )
+    
+    def _notify_pre_step(self) -> None:
+        step_number = self._machine.get_step_count() + 1
+        state = self._machine.get_current_state()
+        head_position = self._machine.get_head_position()
+        for observer in self._observers:
+            observer.on_pre_step(step_number, state, head_position)
+    
+    def _notify_post_step(self, result: StepResult) -> None:
+        for observer in self._observers:
+            observer.on_post_step(result)
+            if result.is_halted:
+                observer.on_halt(result)
     
     def pause(self) -> None:
         self._is_paused = True
+        self._pacer.interrupt()
     
     def resume(self) -> None:
         self._is_paused = False
+        self._pacer.interrupt()
     
     def stop(self) -> None:
         self._stop_execution()
@@ -101,10 +230,20 @@ class ExecutionController(QObject):
             self.execution_error.emit("Makine zaten durmuş")
             return None
         
+        if self._budget_exhausted():
+            self.execution_error.emit(self._budget_message())
+            return None
+        
         try:
+            if self._observers:
+                self._notify_pre_step()
+            
             result = self._machine_executor.step_with_explanation(self._machine)
             self.step_completed.emit(result)
             
+            if self._observers:
+                self._notify_post_step(result)
+            
             if result.is_halted:
                 self.execution_finished.emit(result)
             
@@ -0,0 +1,125 @@
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class PacingStats:
+    steps_per_tick: int
+    steps_per_second: float
+    engine_ms: float
+    explain_ms: float
+    callback_ms: float
+    render_ms: float
+    
+    def __str__(self) -> str:
+        return (f"{self.steps_per_second:.0f} adım/sn | "
+                f"{self.steps_per_tick} adım/kare")
+
+
+class StepPacer:
+    
+    TARGET_FRAME_MS = 16.0
+    MAX_STEPS_PER_TICK = 4096
+    SMOOTHING = 0.25
+    REPORT_INTERVAL = 0.5
+    MIN_WORK_SHARE = 0.5
+    
+    def __init__(self, target_frame_ms: float = TARGET_FRAME_MS):
+        self._target_frame = target_frame_ms / 1000.0
+        self.reset()
+    
+    def reset(self) -> None:
+        self._steps_per_tick = 1
+        self._engine = 0.0
+        self._explain = 0.0
+        self._callback = 0.0
+        self._render = 0.0
+        self._has_samples = False
+        self._interval = 0.0
+        self._tick_started: Optional[float] = None
+        self._last_tick_duration = 0.0
+        self._tick_engine = 0.0
+        self._tick_explain = 0.0
+        self._tick_callback = 0.0
+        self._window_started: Optional[float] = None
+        self._window_steps = 0
+        self._steps_per_second = 0.0
+    
+    def interrupt(self) -> None:
+        self._tick_started = None
+        self._window_started = None
+        self._window_steps = 0
+    
+    def get_target_frame_ms(self) -> float:
+        return self._target_frame * 1000.0
+    
+    def get_steps_per_tick(self) -> int:
+        return self._steps_per_tick
+    
+    def begin_tick(self, now: float, interval_ms: float) -> int:
+        interval = interval_ms / 1000.0
+        if self._tick_started is not None and interval == self._interval:
+            period = now - self._tick_started
+            overhead = max(0.0, period - max(interval, self._last_tick_duration))
+            self._render = self._smooth(self._render, overhead)
+        self._interval = interval
+        self._tick_started = now
+        if self._window_started is None:
+            self._window_started = now
+        self._tick_engine = 0.0
+        self._tick_explain = 0.0
+        self._tick_callback = 0.0
+        return self._steps_per_tick
+    
+    def record_step(self, engine: float, explain: float, callback: float) -> None:
+        self._tick_engine += engine
+        self._tick_explain += explain
+        self._tick_callback += callback
+    
+    def end_tick(self, now: float, steps: int, final: bool = False) -> bool:
+        if self._tick_started is None:
+            return False
+        self._last_tick_duration = now - self._tick_started
+        
+        if steps:
+            self._engine = self._smooth(self._engine, self._tick_engine / steps)
+            self._explain = self._smooth(self._explain, self._tick_explain / steps)
+            self._callback = self._smooth(self._callback, self._tick_callback / steps)
+            self._has_samples = True
+            self._steps_per_tick = self._plan_steps()
+        
+        self._window_steps += steps
+        elapsed = now - self._window_started
+        if elapsed <= 0.0 or (elapsed < self.REPORT_INTERVAL and not final):
+            return False
+        self._steps_per_second = self._window_steps / elapsed
+        self._window_started = now
+        self._window_steps = 0
+        return True
+    
+    def _plan_steps(self) -> int:
+        step_cost = self._engine + self._explain + self._callback
+        budget = max(
+            self._target_frame - self._render,
+            self._target_frame * self.MIN_WORK_SHARE
+        )
+        if step_cost <= 0.0 or budget <= step_cost:
+            return 1
+        planned = int(math.floor(budget / step_cost))
+        return max(1, min(planned, self._steps_per_tick * 2, self.MAX_STEPS_PER_TICK))
+    
+    def _smooth(self, previous: float, sample: float) -> float:
+        if not self._has_samples and previous == 0.0:
+            return sample
+        return previous + self.SMOOTHING * (sample - previous)
+    
+    def get_stats(self) -> PacingStats:
+        return PacingStats(
+            steps_per_tick=self._steps_per_tick,
+            steps_per_second=self._steps_per_second,
+            engine_ms=self._engine * 1000.0,
+            explain_ms=self._explain * 1000.0,
+            callback_ms=self._callback * 1000.0,
+            render_ms=self._render * 1000.0
+        )
@@ -0,0 +1,291 @@
+import multiprocessing
+import os
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, Deque, Iterator, List, Optional, Tuple
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont, QImage, QPainter
+from PyQt6.QtWidgets import QApplication
+from turing_simulator.domain.entities.tape import Tape
+from turing_simulator.domain.engine.generated_runner import GeneratedRunner
+from turing_simulator.domain.machines.machine_registry import create_machine
+from .widgets.tape_widget import TapeWidget
+
+
+PNG_COMPRESSION = 1
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    machine_id: str
+    symbols: Tuple[str, ...]
+    every: int = 1
+    width: int = 1000
+    height: int = 200
+    zoom_level: int = 0
+    max_steps: int = 1_000_000
+
+
+@dataclass
+class RenderReport:
+    output_path: str
+    frame_count: int
+    step_count: int
+    elapsed_seconds: float
+    
+    def frames_per_second(self) -> float:
+        return self.frame_count / self.elapsed_seconds if self.elapsed_seconds else 0.0
+    
+    def __str__(self) -> str:
+        return (f"{self.frame_count} kare ({self.step_count:,} adım) "
+                f"{self.elapsed_seconds:.2f} s içinde işlendi | "
+                f"{self.frames_per_second():.0f} kare/s → {self.output_path}")
+
+
+class ApngWriter:
+    
+    SIGNATURE = b'\x89PNG\r\n\x1a\n'
+    
+    def __init__(self, handle: BinaryIO, frame_count: int, delay_ms: int = 100):
+        self._handle = handle
+        self._frame_count = frame_count
+        self._delay_ms = delay_ms
+        self._sequence = 0
+        self._frames_written = 0
+        self._header: Optional[bytes] = None
+    
+    @staticmethod
+    def _chunks(png: bytes) -> Iterator[Tuple[bytes, bytes]]:
+        if not png.startswith(ApngWriter.SIGNATURE):
+            raise ValueError("Geçersiz PNG verisi.")
+        offset = len(ApngWriter.SIGNATURE)
+        while offset < len(png):
+            length, kind = struct.unpack_from('>I4s', png, offset)
+            yield kind, png[offset + 8:offset + 8 + length]
+            offset += 12 + length
+    
+    def _write_chunk(self, kind: bytes, data: bytes) -> None:
+        self._handle.write(_png_chunk(kind, data))
+    
+    def add_frame(self, png: bytes) -> None:
+        header = None
+        data = []
+        for kind, chunk in self._chunks(png):
+            if kind == b'IHDR':
+                header = chunk
+            elif kind == b'IDAT':
+                data.append(chunk)
+        if header is None:
+            raise ValueError("PNG verisinde IHDR bulunamadı.")
+        
+        if self._header is None:
+            self._header = header
+            self._handle.write(self.SIGNATURE)
+            self._write_chunk(b'IHDR', header)
+            self._write_chunk(b'acTL', struct.pack('>II', self._frame_count, 0))
+        elif header != self._header:
+            raise ValueError("Tüm kareler aynı boyut ve biçimde olmalıdır.")
+        
+        width, height = struct.unpack_from('>II', header)
+        self._write_chunk(b'fcTL', struct.pack(
+            '>IIIIIHHBB', self._sequence, width, height, 0, 0,
+            self._delay_ms, 1000, 0, 0
+        ))
+        self._sequence += 1
+        for chunk in data:
+            if self._frames_written == 0:
+                self._write_chunk(b'IDAT', chunk)
+            else:
+                self._write_chunk(b'fdAT', struct.pack('>I', self._sequence) + chunk)
+                self._sequence += 1
+        self._frames_written += 1
+    
+    def close(self) -> None:
+        if self._frames_written != self._frame_count:
+            raise ValueError(
+                f"{self._frame_count} kare bildirildi, {self._frames_written} kare yazıldı."
+            )
+        self._write_chunk(b'IEND', b'')
+
+
+_application: Optional[QApplication] = None
+_widget: Optional[TapeWidget] = None
+
+
+def _init_worker() -> None:
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+    global _application, _widget
+    if QApplication.instance() is None:
+        _application = QApplication([])
+    _widget = TapeWidget()
+    _widget.set_animation_duration(0)
+
+
+def _render_image(job: RenderJob, tape: Tape, head: int, state_name: str, step: int) -> QImage:
+    widget = _widget
+    if widget.size().width() != job.width or widget.size().height() != job.height:
+        widget.setMinimumSize(1, 1)
+        widget.setMaximumHeight(job.height)
+        widget.resize(job.width, job.height)
+    if widget.get_zoom_level() != job.zoom_level:
+        widget.set_zoom_level(job.zoom_level)
+    widget.update_tape(tape, head, state_name)
+    
+    image = QImage(job.width, job.height, QImage.Format.Format_RGB888)
+    image.fill(widget.palette().color(widget.backgroundRole()))
+    widget.render(image)
+    
+    painter = QPainter(image)
+    painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+    painter.setPen(QColor(60, 60, 60))
+    painter.drawText(
+        0, 10, job.width - 20, 20,
+        Qt.AlignmentFlag.AlignRight, f"Adım: {step}"
+    )
+    painter.end()
+    return image
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return (struct.pack('>I', len(data)) + kind + data
+            + struct.pack('>I', zlib.crc32(kind + data)))
+
+
+def encode_png(image: QImage, level: int = PNG_COMPRESSION) -> bytes:
+    image = image.convertToFormat(QImage.Format.Format_RGB888)
+    width, height = image.width(), image.height()
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    data = bytes(bits)
+    stride = image.bytesPerLine()
+    row = width * 3
+    raw = b''.join(
+        b'\x00' + data[offset:offset + row]
+        for offset in range(0, stride * height, stride)
+    )
+    return (
+        ApngWriter.SIGNATURE
+        + _png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+        + _png_chunk(b'IDAT', zlib.compress(raw, level))
+        + _png_chunk(b'IEND', b'')
+    )
+
+
+def _render_chunk(
+    job: RenderJob,
+    first_frame: int,
+    frame_count: int,
+    total_steps: int,
+    output_dir: Optional[str]
+) -> List[Tuple[int, bytes]]:
+    machine = create_machine(job.machine_id)
+    runner = GeneratedRunner(machine)
+    states = runner.get_states()
+    blank = machine.get_blank_symbol()
+    
+    growth = GeneratedRunner.GROWTH
+    origin = -growth
+    cells = bytearray(len(job.symbols) + 2 * growth)
+    for offset, symbol in enumerate(job.symbols):
+        if symbol != blank:
+            cells[offset - origin] = ord(symbol)
+    head = -origin
+    state_id = runner.get_state_id(machine.get_initial_state().name)
+    step_count = 0
+    
+    frames = []
+    for frame in range(first_frame, first_frame + frame_count):
+        target = min(frame * job.every, total_steps)
+        while step_count < target:
+            state_id, head, steps, is_halted, shift = runner.advance(
+                cells, head, state_id, target - step_count
+            )
+            origin -= shift
+            step_count += steps
+            if is_halted:
+                break
+        
+        tape = Tape.from_bytes(bytes(cells), origin, blank)
+        image = _render_image(
+            job, tape.snapshot(), origin + head, states[state_id].name, step_count
+        )
+        png = encode_png(image)
+        if output_dir is None:
+            frames.append((frame, png))
+        else:
+            with open(os.path.join(output_dir, f"frame_{frame:06d}.png"), 'wb') as handle:
+                handle.write(png)
+            frames.append((frame, b''))
+    return frames
+
+
+class FrameRenderer:
+    
+    CHUNK_FRAMES = 32
+    CHUNKS_IN_FLIGHT_PER_WORKER = 2
+    
+    def __init__(self, workers: Optional[int] = None):
+        self._workers = workers or os.cpu_count() or 1
+    
+    def count_steps(self, job: RenderJob) -> int:
+        machine = create_machine(job.machine_id)
+        tape = Tape(blank_symbol=machine.get_blank_symbol())
+        tape.initialize_from_list(list(job.symbols), start_position=0)
+        return GeneratedRunner(machine).run(tape, job.max_steps).step_count
+    
+    def plan(self, job: RenderJob) -> Tuple[int, int]:
+        if job.every < 1:
+            raise ValueError("Kare aralığı en az 1 adım olmalıdır.")
+        total_steps = self.count_steps(job)
+        return total_steps, -(-total_steps // job.every) + 1
+    
+    def _frames(
+        self,
+        job: RenderJob,
+        total_steps: int,
+        frame_count: int,
+        output_dir: Optional[str]
+    ) -> Iterator[Tuple[int, bytes]]:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(
+            max_workers=self._workers, mp_context=context, initializer=_init_worker
+        ) as executor:
+            limit = self._workers * self.CHUNKS_IN_FLIGHT_PER_WORKER
+            pending: Deque[Future] = deque()
+            for first in range(0, frame_count, self.CHUNK_FRAMES):
+                pending.append(executor.submit(
+                    _render_chunk, job, first,
+                    min(self.CHUNK_FRAMES, frame_count - first), total_steps, output_dir
+                ))
+                if len(pending) >= limit:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+    
+    def render_frames(self, job: RenderJob, output_dir: str) -> RenderReport:
+        started = time.perf_counter()
+        total_steps, frame_count = self.plan(job)
+        os.makedirs(output_dir, exist_ok=True)
+        for _ in self._frames(job, total_steps, frame_count, output_dir):
+            pass
+        return RenderReport(
+            output_dir, frame_count, total_steps, time.perf_counter() - started
+        )
+    
+    def render_apng(self, job: RenderJob, output_path: str, delay_ms: int = 100) -> RenderReport:
+        started = time.perf_counter()
+        total_steps, frame_count = self.plan(job)
+        temporary = output_path + '.tmp'
+        with open(temporary, 'wb') as handle:
+            writer = ApngWriter(handle, frame_count, delay_ms)
+            for _, png in self._frames(job, total_steps, frame_count, None):
+                writer.add_frame(png)
+            writer.close()
+        os.replace(temporary, output_path)
+        return RenderReport(
+            output_path, frame_count, total_steps, time.perf_counter() - started
+        )
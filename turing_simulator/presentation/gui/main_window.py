@@ -1,16 +1,29 @@
+import time
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QSpinBox, QMessageBox,
-    QSplitter, QScrollArea, QGroupBox
+    QSplitter, QScrollArea, QGroupBox, QFileDialog
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from typing import Optional
 from turing_simulator.domain.interfaces.ituring_machine import ITuringMachine
 from turing_simulator.domain.entities.tape import Tape
 from turing_simulator.domain.entities.step_result import StepResult
+from turing_simulator.domain.entities.tape_heatmap import TapeHeatmap
+from turing_simulator.domain.engine.transition_analyzer import TransitionAnalyzer
 from turing_simulator.application.services.machine_executor import MachineExecutor
 from turing_simulator.application.services.step_explainer import StepExplainer
+from turing_simulator.application.services.chrome_trace import (
+    ChromeTraceRecorder, ChromeTraceObserver, TracingStepExplainer
+)
+from turing_simulator.application.services.configuration_store import (
+    MachineConfiguration, ConfigurationStore
+)
+from turing_simulator.application.services.engine_process import EngineProcess
+from turing_simulator.application.services.output_verifier import multiply_output_verifier
+from turing_simulator.domain.machines.machine_registry import MACHINE_FACTORIES
 from .controllers.execution_controller import ExecutionController
+from .controllers.step_pacer import PacingStats
 from .widgets.machine_info_widget import MachineInfoWidget
 from .widgets.tape_widget import TapeWidget
 from .widgets.logger_widget import LoggerWidget
@@ -18,13 +31,25 @@ from .widgets.logger_widget import LoggerWidget
 
 class MainWindow(QMainWindow):
     
+    PROCESS_MAX_STEPS = 1_000_000_000
+    INPUT_SYMBOLS = ('0', '1')
+    PROCESS_POLL_MS = 33
+    
     def __init__(self, machine: ITuringMachine, parent=None):
         super().__init__(parent)
         self._machine = machine
         self._tape: Optional[Tape] = None
-        
-        step_explainer = StepExplainer()
-        machine_executor = MachineExecutor(step_explainer)
+        self._heatmap = TapeHeatmap()
+        self._trace_recorder: Optional[ChromeTraceRecorder] = None
+        self._trace_observers: list[ChromeTraceObserver] = []
+        self._engine_process: Optional[EngineProcess] = None
+        self._process_poll_timer = QTimer(self)
+        self._process_poll_timer.setInterval(self.PROCESS_POLL_MS)
+        self._process_poll_timer.timeout.connect(self._poll_engine_process)
+        self._process_last_sample = (0.0, 0)
+        
+        self._step_explainer = TracingStepExplainer(StepExplainer())
+        machine_executor = MachineExecutor(self._step_explainer)
         self._execution_controller = ExecutionController(machine_executor)
         self._execution_controller.set_machine(machine)
         
@@ -60,6 +85,7 @@ class MainWindow(QMainWindow):
         )
         self._tape_scroll.setMinimumHeight(280)
         self._tape_widget = TapeWidget()
+        self._tape_widget.set_heatmap(self._heatmap)
         self._tape_scroll.setWidget(self._tape_widget)
         tape_layout.addWidget(self._tape_scroll)
         tape_group.setLayout(tape_layout)
@@ -186,10 +212,36 @@ class MainWindow(QMainWindow):
         self._step_button.clicked.connect(self._on_step_clicked)
         layout.addWidget(self._step_button)
         
+        self._process_button = QPushButton("Ayrı Süreçte Çalıştır")
+        self._process_button.clicked.connect(self._on_process_clicked)
+        layout.addWidget(self._process_button)
+        
         self._reset_button = QPushButton("Sıfırla")
         self._reset_button.clicked.connect(self._on_reset_clicked)
         layout.addWidget(self._reset_button)
         
+        self._heatmap_button = QPushButton("Isı Haritası")
+        self._heatmap_button.setCheckable(True)
+        self._heatmap_button.toggled.connect(self._on_heatmap_toggled)
+        layout.addWidget(self._heatmap_button)
+        
+        self._heatmap_export_button = QPushButton("Isı Haritasını Kaydet")
+        self._heatmap_export_button.clicked.connect(self._on_heatmap_export_clicked)
+        layout.addWidget(self._heatmap_export_button)
+        
+        self._trace_button = QPushButton("İz Kaydı")
+        self._trace_button.setCheckable(True)
+        self._trace_button.toggled.connect(self._on_trace_toggled)
+        layout.addWidget(self._trace_button)
+        
+        self._save_config_button = QPushButton("Yapılandırmayı Kaydet")
+        self._save_config_button.clicked.connect(self._on_save_configuration_clicked)
+        layout.addWidget(self._save_config_button)
+        
+        self._open_config_button = QPushButton("Yapılandırma Aç")
+        self._open_config_button.clicked.connect(self._on_open_configuration_clicked)
+        layout.addWidget(self._open_config_button)
+        
         speed_label = QLabel("Hız (ms):")
         layout.addWidget(speed_label)
         
@@ -201,6 +253,15 @@ class MainWindow(QMainWindow):
         self._speed_input.valueChanged.connect(self._on_speed_changed)
         layout.addWidget(self._speed_input)
         
+        self._adaptive_button = QPushButton("Uyarlanır Hız")
+        self._adaptive_button.setCheckable(True)
+        self._adaptive_button.toggled.connect(self._on_adaptive_toggled)
+        layout.addWidget(self._adaptive_button)
+        
+        self._rate_label = QLabel("0 adım/sn")
+        self._rate_label.setMinimumWidth(160)
+        layout.addWidget(self._rate_label)
+        
         layout.addStretch()
         
         return panel
@@ -211,21 +272,17 @@ class MainWindow(QMainWindow):
             self._on_execution_finished
         )
         self._execution_controller.execution_error.connect(self._on_execution_error)
+        self._execution_controller.pacing_updated.connect(self._on_pacing_updated)
     
     def _load_machine_info(self) -> None:
         if not self._machine:
             return
         
-        transitions = self._machine.get_transitions()
-        
-        state_set = set()
-        for (state, _), transition in transitions.items():
-            state_set.add(state)
-            state_set.add(transition.to_state)
-        
-        states = list(state_set)
-        
-        self._machine_info_widget.set_machine(states, transitions)
+        self._machine_info_widget.set_machine(
+            self._machine.get_states(),
+            self._machine.get_transitions(),
+            TransitionAnalyzer.analyze(self._machine, self.INPUT_SYMBOLS)
+        )
     
     def _on_start_clicked(self) -> None:
         n = self._n_input.value()
@@ -243,6 +300,7 @@ class MainWindow(QMainWindow):
         )
         self._io_info.setStyleSheet("font-weight: bold; color: #3498db;")
         
+        self._heatmap.clear()
         self._logger_widget.clear()
         self._logger_widget.append_text(
             f"═══════════════════════════════════════════════════════════\n"
@@ -270,13 +328,135 @@ class MainWindow(QMainWindow):
             self._on_step_callback
         )
     
+    def _on_process_clicked(self) -> None:
+        machine_id = self._find_machine_id()
+        if machine_id is None:
+            QMessageBox.warning(
+                self, "Ayrı Süreç", "Bu makine ayrı süreçte çalıştırılamaz."
+            )
+            return
+        
+        self._execution_controller.stop()
+        n = self._n_input.value()
+        m = self._m_input.value()
+        self._tape = None
+        self._heatmap.clear()
+        self._logger_widget.clear()
+        self._logger_widget.append_text(
+            f"Ayrı süreçte çalıştırılıyor: n = {n}, m = {m}\n"
+        )
+        self._io_info.setText(
+            f"Giriş: n={n}, m={m} | Ayrı süreçte çalışıyor "
+            f"(Beklenen Çıkış: n×m={n * m})"
+        )
+        self._io_info.setStyleSheet("font-weight: bold; color: #3498db;")
+        
+        self._engine_process = EngineProcess(machine_id, max_steps=self.PROCESS_MAX_STEPS)
+        try:
+            self._engine_process.start(['0'] * n + ['1'] * m)
+        except (OSError, ValueError) as e:
+            self._engine_process.stop()
+            self._engine_process = None
+            QMessageBox.critical(self, "Hata", str(e))
+            return
+        
+        self._start_button.setEnabled(False)
+        self._process_button.setEnabled(False)
+        self._pause_button.setEnabled(True)
+        self._resume_button.setEnabled(False)
+        self._step_button.setEnabled(False)
+        
+        self._process_last_sample = (time.perf_counter(), 0)
+        self._process_poll_timer.start()
+    
+    def _find_machine_id(self) -> Optional[str]:
+        fingerprint = self._machine.get_fingerprint()
+        for machine_id, factory in MACHINE_FACTORIES.items():
+            if factory().get_fingerprint() == fingerprint:
+                return machine_id
+        return None
+    
+    def _poll_engine_process(self) -> None:
+        engine = self._engine_process
+        if engine is None:
+            self._process_poll_timer.stop()
+            return
+        
+        message = engine.poll_message()
+        configuration = engine.read_configuration()
+        self._tape_widget.update_tape(
+            engine.get_tape(), configuration.head_position, configuration.state_name
+        )
+        
+        now = time.perf_counter()
+        last_time, last_steps = self._process_last_sample
+        if now - last_time >= 0.5:
+            rate = (configuration.step_count - last_steps) / (now - last_time)
+            self._rate_label.setText(f"{rate:.0f} adım/sn")
+            self._process_last_sample = (now, configuration.step_count)
+        
+        if message is None:
+            return
+        
+        tape = engine.get_tape().snapshot().fork()
+        self._stop_engine_process()
+        self._tape = tape
+        self._tape_widget.update_tape(
+            tape.snapshot(), configuration.head_position, configuration.state_name
+        )
+        
+        self._start_button.setEnabled(True)
+        self._process_button.setEnabled(True)
+        self._pause_button.setEnabled(False)
+        self._resume_button.setEnabled(False)
+        self._step_button.setEnabled(True)
+        
+        kind, payload = message
+        if kind != 'halted':
+            self._logger_widget.append_text(f"Hata: {payload}\n")
+            QMessageBox.critical(self, "Hata", str(payload))
+            return
+        
+        for state in self._machine.get_states():
+            if state.name == configuration.state_name:
+                self._machine.restore(
+                    tape, state, configuration.head_position,
+                    configuration.step_count, True
+                )
+        self._logger_widget.append_text(
+            f"Ayrı süreç tamamlandı: {configuration.step_count} adım, "
+            f"son durum = {configuration.state_name}\n"
+        )
+        self._show_result()
+    
+    def _stop_engine_process(self) -> None:
+        self._process_poll_timer.stop()
+        if self._engine_process is not None:
+            self._tape_widget.update_tape(None, 0, None)
+            self._engine_process.stop()
+            self._engine_process = None
+    
+    def closeEvent(self, event) -> None:
+        self._stop_engine_process()
+        super().closeEvent(event)
+    
     def _on_pause_clicked(self) -> None:
+        if self._engine_process is not None:
+            self._engine_process.pause()
+            self._pause_button.setEnabled(False)
+            self._resume_button.setEnabled(True)
+            return
         self._execution_controller.pause()
         self._pause_button.setEnabled(False)
         self._resume_button.setEnabled(True)
         self._step_button.setEnabled(True)
     
     def _on_resume_clicked(self) -> None:
+        if self._engine_process is not None:
+            self._engine_process.resume()
+            self._pause_button.setEnabled(True)
+            self._resume_button.setEnabled(False)
+            return
         self._execution_controller.resume()
         self._pause_button.setEnabled(True)
         self._resume_button.setEnabled(False)
@@ -288,9 +468,11 @@ class MainWindow(QMainWindow):
             self._on_step_callback(result)
     
     def _on_reset_clicked(self) -> None:
+        self._stop_engine_process()
         self._execution_controller.stop()
         self._tape = None
-        self._tape_widget.update_tape({}, 0, None)
+        self._heatmap.clear()
+        self._tape_widget.update_tape(None, 0, None)
         self._logger_widget.clear()
         
         self._io_info.setText("Giriş: Henüz başlatılmadı")
@@ -304,9 +486,168 @@ class MainWindow(QMainWindow):
     def _on_speed_changed(self, value: int) -> None:
         self._execution_controller.set_speed(value)
     
+    def _on_adaptive_toggled(self, checked: bool) -> None:
+        self._speed_input.setEnabled(not checked)
+        self._execution_controller.set_adaptive(checked)
+    
+    def _on_pacing_updated(self, stats: PacingStats) -> None:
+        self._rate_label.setText(str(stats))
+        self._rate_label.setToolTip(
+            f"Motor: {stats.engine_ms:.3f} ms/adım\n"
+            f"Açıklama: {stats.explain_ms:.3f} ms/adım\n"
+            f"Arayüz: {stats.callback_ms:.3f} ms/adım\n"
+            f"Çizim: {stats.render_ms:.3f} ms/kare"
+        )
+    
+    def _on_heatmap_toggled(self, checked: bool) -> None:
+        self._tape_widget.set_heatmap_visible(checked)
+    
+    def _on_heatmap_export_clicked(self) -> None:
+        if self._heatmap.is_empty():
+            QMessageBox.information(
+                self, "Isı Haritası", "Kaydedilecek ısı haritası verisi yok."
+            )
+            return
+        
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Isı Haritasını Kaydet", "isi_haritasi.csv", "CSV (*.csv)"
+        )
+        if not file_path:
+            return
+        
+        try:
+            self._heatmap.export_csv(file_path)
+        except OSError as e:
+            QMessageBox.critical(self, "Hata", str(e))
+    
+    def _on_save_configuration_clicked(self) -> None:
+        if self._tape is None:
+            QMessageBox.information(
+                self, "Yapılandırma", "Kaydedilecek yapılandırma yok."
+            )
+            return
+        
+        configuration = MachineConfiguration.capture(
+            self._machine,
+            self._tape,
+            {'n': self._n_input.value(), 'm': self._m_input.value()}
+        )
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Yapılandırmayı Kaydet", "yapilandirma.tmcf",
+            "Turing Yapılandırması (*.tmcf)"
+        )
+        if not file_path:
+            return
+        
+        try:
+            ConfigurationStore().save(file_path, configuration)
+        except OSError as e:
+            QMessageBox.critical(self, "Hata", str(e))
+    
+    def _on_open_configuration_clicked(self) -> None:
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Yapılandırma Aç", "", "Turing Yapılandırması (*.tmcf)"
+        )
+        if not file_path:
+            return
+        
+        try:
+            configuration = ConfigurationStore().load(file_path)
+            self._stop_engine_process()
+            self._execution_controller.stop()
+            configuration.apply(self._machine)
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "Hata", str(e))
+            return
+        
+        self._show_configuration(configuration)
+    
+    def _show_configuration(self, configuration: MachineConfiguration) -> None:
+        self._tape = configuration.tape
+        n = configuration.metadata.get('n', self._n_input.value())
+        m = configuration.metadata.get('m', self._m_input.value())
+        self._n_input.setValue(n)
+        self._m_input.setValue(m)
+        
+        self._io_info.setText(
+            f"Giriş: n={n}, m={m} | Yüklenen yapılandırma: "
+            f"adım {configuration.step_count}, durum {configuration.state_name}"
+        )
+        self._io_info.setStyleSheet("font-weight: bold; color: #3498db;")
+        
+        self._heatmap.clear()
+        self._logger_widget.clear()
+        self._logger_widget.append_text(
+            f"Yapılandırma yüklendi: adım = {configuration.step_count}, "
+            f"durum = {configuration.state_name}, "
+            f"kafa = {configuration.head_position}\n\n"
+        )
+        self._tape_widget.update_tape(
+            self._tape.snapshot(),
+            configuration.head_position,
+            configuration.state_name
+        )
+        
+        self._execution_controller.load_execution(self._tape, self._on_step_callback)
+        
+        self._start_button.setEnabled(True)
+        self._pause_button.setEnabled(False)
+        self._resume_button.setEnabled(not configuration.is_halted)
+        self._step_button.setEnabled(not configuration.is_halted)
+    
+    def _on_trace_toggled(self, checked: bool) -> None:
+        if checked:
+            self._start_trace()
+        else:
+            self._finish_trace()
+    
+    def _start_trace(self) -> None:
+        self._trace_recorder = ChromeTraceRecorder()
+        engine_observer = ChromeTraceObserver(self._trace_recorder, 'engine')
+        gui_observer = ChromeTraceObserver(self._trace_recorder, 'gui')
+        self._trace_observers = [engine_observer, gui_observer]
+        
+        self._machine.add_observer(engine_observer)
+        self._execution_controller.add_observer(gui_observer)
+        self._step_explainer.set_recorder(self._trace_recorder)
+        self._tape_widget.set_trace_recorder(self._trace_recorder)
+    
+    def _finish_trace(self) -> None:
+        recorder = self._trace_recorder
+        if recorder is None:
+            return
+        
+        engine_observer, gui_observer = self._trace_observers
+        self._machine.remove_observer(engine_observer)
+        self._execution_controller.remove_observer(gui_observer)
+        self._step_explainer.set_recorder(None)
+        self._tape_widget.set_trace_recorder(None)
+        self._trace_recorder = None
+        self._trace_observers = []
+        
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "İz Kaydını Kaydet", "iz_kaydi.json", "Chrome Trace (*.json)"
+        )
+        if not file_path:
+            return
+        
+        try:
+            recorder.save(file_path)
+        except OSError as e:
+            QMessageBox.critical(self, "Hata", str(e))
+    
     def _on_step_callback(self, result: StepResult) -> None:
-        self._update_tape_display(result)
-        self._logger_widget.log_step(result)
+        if self._trace_recorder is None:
+            self._heatmap.record_step(result)
+            self._update_tape_display(result)
+            self._logger_widget.log_step(result)
+            return
+        
+        with self._trace_recorder.span('gui.şerit', 'gui'):
+            self._heatmap.record_step(result)
+            self._update_tape_display(result)
+        with self._trace_recorder.span('gui.log', 'gui'):
+            self._logger_widget.log_step(result)
     
     def _update_tape_display(self, result: Optional[StepResult] = None) -> None:
         if result:
@@ -317,7 +658,7 @@ class MainWindow(QMainWindow):
             )
         elif self._tape:
             self._tape_widget.update_tape(
-                self._tape.get_all_symbols(),
+                self._tape.snapshot(),
                 0,
                 self._machine.get_current_state().name if self._machine else None
             )
@@ -330,17 +671,17 @@ class MainWindow(QMainWindow):
         self._pause_button.setEnabled(False)
         self._resume_button.setEnabled(False)
         self._step_button.setEnabled(True)
-        
+        self._show_result()
+    
+    def _show_result(self) -> None:
         if self._tape:
-            twos_count = len([
-                s for s in self._tape.get_all_symbols().values() 
-                if s == '2'
-            ])
             n = self._n_input.value()
             m = self._m_input.value()
             expected = n * m
+            report = multiply_output_verifier(n, m).verify(self._tape)
+            twos_count = report.results[0].actual
             
-            if twos_count == expected:
+            if report.is_valid():
                 self._io_info.setText(
                     f"✓ Tamamlandı! Giriş: n={n}, m={m} | "
                     f"Çıkış: {twos_count} adet '2' (Doğru: n×m={expected})"
@@ -358,10 +699,12 @@ class MainWindow(QMainWindow):
                 f"<b>Fonksiyon:</b> f(n, m) = n × m<br>"
                 f"<b>Giriş:</b> n = {n} ({n} adet '0'), m = {m} ({m} adet '1')<br>"
                 f"<b>Beklenen Çıkış:</b> n×m = {expected} ({expected} adet '2')<br>"
-                f"<b>Gerçek Çıkış:</b> {twos_count} adet '2'<br><br>"
+                f"<b>Gerçek Çıkış:</b> {twos_count} adet '2'<br>"
+                + "<br>".join(str(result) for result in report.results)
+                + "<br><br>"
             )
             
-            if twos_count == expected:
+            if report.is_valid():
                 message += (
                     "<span style='color: green; font-weight: bold;'>"
                     "✓ Sonuç DOĞRU!</span>"
@@ -2,12 +2,16 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit
 from PyQt6.QtCore import Qt
 from typing import Optional
 from turing_simulator.domain.entities.step_result import StepResult
+from turing_simulator.domain.localization.message_catalog import get_catalog
 
 
 class LoggerWidget(QWidget):
     
-    def __init__(self, parent=None):
+    RULE = '=' * 70
+    
+    def __init__(self, parent=None, locale: Optional[str] = None):
         super().__init__(parent)
+        self._catalog = get_catalog(locale)
         self._setup_ui()
     
     def _setup_ui(self) -> None:
@@ -29,31 +33,23 @@ class LoggerWidget(QWidget):
         scrollbar.setValue(scrollbar.maximum())
     
     def _format_step_result(self, step_result: StepResult) -> str:
-        lines = [
-            f"{'='*70}",
-            f"Adım {step_result.step_number}",
-            f"{'='*70}",
-        ]
-        
-        if step_result.explanation:
-            lines.append(step_result.explanation)
-        else:
-            lines.extend([
-                f"Durum Geçişi: {step_result.previous_state.name} → "
-                f"{step_result.current_state.name}",
-                f"Okunan Sembol: '{step_result.read_symbol}'",
-                f"Yazılan Sembol: '{step_result.write_symbol}'",
-                f"Hareket Yönü: "
-                f"{'Sol' if step_result.direction == 'L' else 'Sağ' if step_result.direction == 'R' else 'Yok'}",
-                f"Kafa Pozisyonu: {step_result.head_position}",
-            ])
-        
-        if step_result.is_halted:
-            lines.append("")
-            lines.append("*** MAKİNE DURDU ***")
-        
-        lines.append("")
-        return "\n".join(lines)
+        catalog = self._catalog
+        body = step_result.explanation or catalog.format(
+            'log.fields',
+            previous=step_result.previous_state.name,
+            current=step_result.current_state.name,
+            read=step_result.read_symbol,
+            write=step_result.write_symbol,
+            direction=catalog.direction(step_result.direction),
+            head=step_result.head_position
+        )
+        return catalog.format(
+            'log.entry',
+            rule=self.RULE,
+            step=step_result.step_number,
+            body=body,
+            halted=catalog.get_template('log.halted') if step_result.is_halted else ""
+        )
     
     def clear(self) -> None:
         self._log_text.clear()
@@ -1,14 +1,39 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QPushButton
-from PyQt6.QtCore import Qt, QEvent, QPoint
-from PyQt6.QtGui import QPixmap, QWheelEvent, QMouseEvent
-import os
+from PyQt6.QtCore import Qt, QEvent, QPoint, QRectF
+from PyQt6.QtGui import QPixmap, QWheelEvent, QMouseEvent, QPainter, QPen, QColor, QFont, QFontMetrics
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from turing_simulator.domain.entities.state import State
+from turing_simulator.domain.entities.transition import Transition
+from turing_simulator.domain.engine.transition_analyzer import TransitionAnalysis
 
 
 class MachineInfoWidget(QWidget):
     
+    CACHE_SIZE = 6
+    ROW_HEIGHT = 28
+    CELL_PADDING = 16
+    HEADER_COLOR = QColor(52, 73, 94)
+    FINAL_ROW_COLOR = QColor(214, 234, 248)
+    EMPTY_CELL_COLOR = QColor(245, 245, 245)
+    GRID_COLOR = QColor(160, 160, 160)
+    HALT_CELL_COLOR = QColor(250, 219, 216)
+    SWEEP_CELL_COLOR = QColor(252, 243, 207)
+    DEAD_TEXT_COLOR = QColor(170, 170, 170)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._original_pixmap: QPixmap = None
+        self._states: List[State] = []
+        self._symbols: List[str] = []
+        self._cells: Dict[Tuple[str, str], str] = {}
+        self._analysis: Optional[TransitionAnalysis] = None
+        self._font = QFont("Arial", 10)
+        self._header_width = 0
+        self._column_width = 0
+        self._table_width = 0
+        self._table_height = 0
+        self._renderings: OrderedDict[int, QPixmap] = OrderedDict()
+        self._shown_level: Optional[int] = None
         self._zoom_factor = 1.0
         self._min_zoom = 0.1
         self._max_zoom = 5.0
@@ -70,12 +95,10 @@ class MachineInfoWidget(QWidget):
         controls_widget.setLayout(controls_layout)
         controls_widget.setMaximumWidth(50)
         main_layout.addWidget(controls_widget)
-        
-        self._load_image()
     
     def showEvent(self, event: QEvent) -> None:
         super().showEvent(event)
-        if self._original_pixmap and not self._original_pixmap.isNull():
+        if self._has_table():
             self._reset_zoom()
     
     def eventFilter(self, obj, event: QEvent) -> bool:
@@ -134,29 +157,108 @@ class MachineInfoWidget(QWidget):
                 pass
         return super().event(event)
     
-    def _load_image(self) -> None:
-        current_file = os.path.abspath(__file__)
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(current_file)))))
-        image_path = os.path.join(project_root, "image.png")
-        
-        if os.path.exists(image_path):
-            self._original_pixmap = QPixmap(image_path)
-            if not self._original_pixmap.isNull():
-                self._reset_zoom()
+    def _has_table(self) -> bool:
+        return self._table_width > 0 and self._table_height > 0
+    
+    def _zoom_level(self) -> int:
+        return max(1, round(self._zoom_factor / self._zoom_step))
     
     def _update_image(self) -> None:
-        if self._original_pixmap is None or self._original_pixmap.isNull():
+        if not self._has_table():
             return
         
-        scaled_pixmap = self._original_pixmap.scaled(
-            int(self._original_pixmap.width() * self._zoom_factor),
-            int(self._original_pixmap.height() * self._zoom_factor),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self._image_label.setPixmap(scaled_pixmap)
+        level = self._zoom_level()
+        if level == self._shown_level:
+            return
+        
+        pixmap = self._renderings.get(level)
+        if pixmap is None:
+            pixmap = self._render_table(level * self._zoom_step)
+            self._renderings[level] = pixmap
+            if len(self._renderings) > self.CACHE_SIZE:
+                self._renderings.popitem(last=False)
+        else:
+            self._renderings.move_to_end(level)
+        
+        self._shown_level = level
+        self._image_label.setPixmap(pixmap)
         self._image_label.adjustSize()
     
+    def _render_table(self, scale: float) -> QPixmap:
+        pixmap = QPixmap(
+            max(1, round(self._table_width * scale)),
+            max(1, round(self._table_height * scale))
+        )
+        pixmap.fill(Qt.GlobalColor.white)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.scale(scale, scale)
+        painter.setFont(self._font)
+        painter.setPen(QPen(self.GRID_COLOR, 1))
+        
+        row_height = self.ROW_HEIGHT
+        center = Qt.AlignmentFlag.AlignCenter
+        
+        painter.fillRect(QRectF(0, 0, self._table_width, row_height), self.HEADER_COLOR)
+        painter.setPen(Qt.GlobalColor.white)
+        painter.drawText(QRectF(0, 0, self._header_width, row_height), center, "δ")
+        for column, symbol in enumerate(self._symbols):
+            x = self._header_width + column * self._column_width
+            painter.drawText(QRectF(x, 0, self._column_width, row_height), center, symbol)
+        
+        for row, state in enumerate(self._states):
+            y = (row + 1) * row_height
+            if state.is_final:
+                painter.fillRect(QRectF(0, y, self._table_width, row_height), self.FINAL_ROW_COLOR)
+            analysis = self._analysis
+            reachable = analysis is None or state.name in analysis.reachable_states
+            painter.setPen(Qt.GlobalColor.black if reachable else self.DEAD_TEXT_COLOR)
+            painter.drawText(
+                QRectF(0, y, self._header_width, row_height), center,
+                self._state_label(state)
+            )
+            for column, symbol in enumerate(self._symbols):
+                x = self._header_width + column * self._column_width
+                cell = QRectF(x, y, self._column_width, row_height)
+                text = self._cells.get((state.name, symbol))
+                if text is None:
+                    if analysis is not None and analysis.is_halting(state.name, symbol):
+                        painter.fillRect(cell, self.HALT_CELL_COLOR)
+                        painter.setPen(Qt.GlobalColor.darkRed)
+                        painter.drawText(cell, center, "dur")
+                        continue
+                    painter.fillRect(cell, self.EMPTY_CELL_COLOR)
+                    painter.setPen(self.GRID_COLOR)
+                    painter.drawText(cell, center, "—")
+                elif analysis is not None and analysis.is_dead(state.name, symbol):
+                    painter.fillRect(cell, self.EMPTY_CELL_COLOR)
+                    painter.setPen(self.DEAD_TEXT_COLOR)
+                    painter.drawText(cell, center, text)
+                else:
+                    if analysis is not None and analysis.find_sweep(state.name, symbol):
+                        painter.fillRect(cell, self.SWEEP_CELL_COLOR)
+                    painter.setPen(Qt.GlobalColor.black)
+                    painter.drawText(cell, center, text)
+        
+        painter.setPen(QPen(self.GRID_COLOR, 1))
+        for row in range(len(self._states) + 2):
+            painter.drawLine(0, row * row_height, self._table_width, row * row_height)
+        painter.drawLine(0, 0, 0, self._table_height)
+        for column in range(len(self._symbols) + 1):
+            x = self._header_width + column * self._column_width
+            painter.drawLine(x, 0, x, self._table_height)
+        painter.end()
+        return pixmap
+    
+    def _state_label(self, state: State) -> str:
+        if state.is_initial:
+            return f"→ {state.name}"
+        if state.is_final:
+            return f"* {state.name}"
+        return state.name
+    
     def _zoom_in(self) -> None:
         if self._zoom_factor < self._max_zoom:
             self._zoom_factor = min(self._zoom_factor + self._zoom_step, self._max_zoom)
@@ -168,15 +270,15 @@ class MachineInfoWidget(QWidget):
             self._update_image()
     
     def _reset_zoom(self) -> None:
-        if self._original_pixmap is None or self._original_pixmap.isNull():
+        if not self._has_table():
             return
         
         scroll_width = self._scroll_area.width() - 20
         scroll_height = self._scroll_area.height() - 20
         
         if scroll_width > 0 and scroll_height > 0:
-            width_ratio = scroll_width / self._original_pixmap.width()
-            height_ratio = scroll_height / self._original_pixmap.height()
+            width_ratio = scroll_width / self._table_width
+            height_ratio = scroll_height / self._table_height
             self._zoom_factor = min(width_ratio, height_ratio, 1.0)
         else:
             self._zoom_factor = 0.5
@@ -186,6 +288,52 @@ class MachineInfoWidget(QWidget):
     def set_machine(
         self, 
         states: list, 
-        transitions: dict
+        transitions: dict,
+        analysis: Optional[TransitionAnalysis] = None
     ) -> None:
-        pass
+        self._analysis = analysis
+        self._image_label.setToolTip(
+            self._analysis_summary(analysis) if analysis is not None else ""
+        )
+        self._states = sorted(
+            states, key=lambda state: (not state.is_initial, len(state.name), state.name)
+        )
+        self._symbols = sorted({symbol for _, symbol in transitions})
+        self._cells = {
+            (state.name, symbol): self._cell_text(transition)
+            for (state, symbol), transition in transitions.items()
+        }
+        
+        metrics = QFontMetrics(self._font)
+        self._header_width = max(
+            [metrics.horizontalAdvance(self._state_label(state)) for state in self._states]
+            + [metrics.horizontalAdvance("δ")]
+        ) + self.CELL_PADDING
+        self._column_width = max(
+            [metrics.horizontalAdvance(text) for text in self._cells.values()]
+            + [metrics.horizontalAdvance(symbol) for symbol in self._symbols]
+            + [metrics.horizontalAdvance("—")]
+        ) + self.CELL_PADDING
+        self._table_width = self._header_width + len(self._symbols) * self._column_width
+        self._table_height = (len(self._states) + 1) * self.ROW_HEIGHT
+        
+        self._renderings.clear()
+        self._shown_level = None
+        self._reset_zoom()
+    
+    def _cell_text(self, transition: Transition) -> str:
+        return (f"{transition.to_state.name}, {transition.write_symbol}, "
+                f"{transition.direction}")
+    
+    def _analysis_summary(self, analysis: TransitionAnalysis) -> str:
+        lines = [str(analysis)]
+        if analysis.unreachable_states:
+            lines.append(
+                "Erişilemeyen durumlar: " + ", ".join(sorted(analysis.unreachable_states))
+            )
+        for sweep in analysis.sweeps:
+            lines.append(
+                f"Tarama: {sweep.state_name} {'/'.join(sweep.symbols)} "
+                f"üzerinde {sweep.direction} yönüne"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,80 @@
+import math
+from typing import Tuple
+
+
+class TapeViewport:
+    
+    CELL_SIZES = (60, 40, 28, 18, 12, 8, 5, 3, 2, 1)
+    LABEL_STEPS = (1, 2, 5)
+    
+    def __init__(self, level: int = 0):
+        self._level = 0
+        self._center = 0.0
+        self.set_level(level)
+    
+    def get_level(self) -> int:
+        return self._level
+    
+    def get_level_count(self) -> int:
+        return len(self.CELL_SIZES)
+    
+    def set_level(self, level: int) -> bool:
+        level = max(0, min(level, len(self.CELL_SIZES) - 1))
+        if level == self._level:
+            return False
+        self._level = level
+        return True
+    
+    def get_cell_size(self) -> int:
+        return self.CELL_SIZES[self._level]
+    
+    def get_gap(self) -> int:
+        cell_size = self.get_cell_size()
+        if cell_size >= 28:
+            return 8
+        if cell_size >= 5:
+            return 2
+        return 0
+    
+    def get_pitch(self) -> int:
+        return self.get_cell_size() + self.get_gap()
+    
+    def get_center(self) -> float:
+        return self._center
+    
+    def set_center(self, center: float) -> None:
+        self._center = center
+    
+    def get_scroll_px(self) -> int:
+        return round(self._center * self.get_pitch())
+    
+    def _base(self, width: int) -> int:
+        return width // 2 - self.get_cell_size() // 2 - self.get_scroll_px()
+    
+    def x_of(self, position: int, width: int) -> int:
+        return self._base(width) + position * self.get_pitch()
+    
+    def position_range(self, left: int, right: int, width: int) -> Tuple[int, int]:
+        base = self._base(width)
+        pitch = self.get_pitch()
+        return ((left - base) // pitch, (right - 1 - base) // pitch)
+    
+    def visible_range(self, width: int) -> Tuple[int, int]:
+        return self.position_range(0, width, width)
+    
+    def get_label_step(self, min_spacing: int) -> int:
+        pitch = self.get_pitch()
+        if pitch >= min_spacing:
+            return 1
+        magnitude = 1
+        while True:
+            for step in self.LABEL_STEPS:
+                if step * magnitude * pitch >= min_spacing:
+                    return step * magnitude
+            magnitude *= 10
+    
+    def cells_across(self, pixels: float) -> float:
+        return pixels / self.get_pitch()
+    
+    def distance_px(self, position: float) -> float:
+        return math.fabs(position - self._center) * self.get_pitch()
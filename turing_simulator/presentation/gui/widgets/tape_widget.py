@@ -1,7 +1,11 @@
-from PyQt6.QtWidgets import QWidget, QScrollArea
-from PyQt6.QtCore import Qt, QPoint
-from PyQt6.QtGui import QPainter, QPen, QBrush, QFont, QColor, QPolygon
-from typing import Dict, Optional
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QPoint, QRect, QRectF, QVariantAnimation, QEasingCurve
+from PyQt6.QtGui import QPainter, QPen, QBrush, QFont, QColor, QPolygon, QImage, QPalette
+from typing import Dict, Iterator, Optional, Tuple
+from turing_simulator.domain.interfaces.itape import ITape
+from turing_simulator.domain.entities.tape_heatmap import TapeHeatmap
+from turing_simulator.application.services.chrome_trace import ChromeTraceRecorder
+from .tape_viewport import TapeViewport
 
 
 class TapeWidget(QWidget):
@@ -15,54 +19,285 @@ class TapeWidget(QWidget):
         'B': QColor(240, 240, 240),
     }
     
+    HEATMAP_VISIT_COLOR = QColor(230, 60, 60)
+    HEATMAP_WRITE_COLOR = QColor(60, 110, 230)
+    HEAD_CELL_COLOR = QColor(255, 240, 200)
+    UNKNOWN_SYMBOL_COLOR = QColor(60, 60, 60)
+    
+    ROW_TOP = 70
+    ROW_HEIGHT = 60
+    LABEL_OFFSET = 18
+    HEAT_OFFSET = 42
+    HEAT_ROW_HEIGHT = 16
+    TEXT_MIN_CELL_SIZE = 18
+    LABEL_MIN_SPACING = 56
+    ANIMATION_MS = 120
+    WHEEL_PAN_PX = 120
+    HEAD_ARROW_TOP = ROW_TOP - 35
+    HEAD_ARROW_HEIGHT = 25
+    HEAD_ARROW_SIZE = 10
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._tape_snapshot: Dict[int, str] = {}
+        self._tape_snapshot: Optional[ITape] = None
+        self._window = ""
+        self._window_start = 0
         self._head_position = 0
         self._current_state: Optional[str] = None
-        self._cell_size = 60
-        self._visible_cells = 25
-        self.setMinimumSize(1200, 200)
+        self._viewport = TapeViewport()
+        self._follow_head = True
+        self._heatmap: Optional[TapeHeatmap] = None
+        self._show_heatmap = False
+        self._heat_state: Tuple[int, int, int] = (0, 0, 0)
+        self._trace_recorder: Optional[ChromeTraceRecorder] = None
+        self._palette_table = self._build_palette_table()
+        
+        self._animation = QVariantAnimation(self)
+        self._animation.setDuration(self.ANIMATION_MS)
+        self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._animation.valueChanged.connect(self._on_center_changed)
+        
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
+        self.setToolTip(
+            "Ctrl + tekerlek veya +/-: yakınlaştır | Tekerlek: kaydır | "
+            "Çift tıklama: kafayı takip et"
+        )
+        self.setMinimumSize(400, 200)
         self.setMaximumHeight(400)
     
+    def _build_palette_table(self) -> list:
+        table = [self.UNKNOWN_SYMBOL_COLOR.rgb()] * 256
+        table[0] = self.SYMBOL_COLORS['B'].rgb()
+        for symbol, color in self.SYMBOL_COLORS.items():
+            if symbol != 'B':
+                table[ord(symbol)] = color.rgb()
+        return table
+    
+    def set_heatmap(self, heatmap: Optional[TapeHeatmap]) -> None:
+        self._heatmap = heatmap
+        self.update()
+    
+    def set_heatmap_visible(self, visible: bool) -> None:
+        self._show_heatmap = visible
+        self.setMinimumHeight(260 if visible else 200)
+        self.update()
+    
+    def is_heatmap_visible(self) -> bool:
+        return self._show_heatmap
+    
+    def set_trace_recorder(self, recorder: Optional[ChromeTraceRecorder]) -> None:
+        self._trace_recorder = recorder
+    
+    def set_animation_duration(self, milliseconds: int) -> None:
+        self._animation.setDuration(max(0, milliseconds))
+    
+    def get_zoom_level(self) -> int:
+        return self._viewport.get_level()
+    
+    def get_cell_size(self) -> int:
+        return self._viewport.get_cell_size()
+    
+    def set_zoom_level(self, level: int) -> None:
+        if self._viewport.set_level(level):
+            self._refresh_window()
+            self.update()
+    
+    def zoom_in(self) -> None:
+        self.set_zoom_level(self._viewport.get_level() - 1)
+    
+    def zoom_out(self) -> None:
+        self.set_zoom_level(self._viewport.get_level() + 1)
+    
+    def set_follow_head(self, follow: bool) -> None:
+        self._follow_head = follow
+        if follow:
+            self._move_center(self._head_position)
+    
+    def is_following_head(self) -> bool:
+        return self._follow_head
+    
     def update_tape(
         self, 
-        tape_snapshot: Dict[int, str], 
+        tape_snapshot: Optional[ITape], 
         head_position: int, 
         current_state: Optional[str] = None
     ) -> None:
-        self._tape_snapshot = tape_snapshot.copy()
-        
-        visible_min = head_position - self._visible_cells // 2
-        visible_max = head_position + self._visible_cells // 2
-        
-        for pos in range(visible_min, visible_max + 1):
-            if pos not in self._tape_snapshot:
-                self._tape_snapshot[pos] = 'B'
+        had_tape = self._tape_snapshot is not None
+        previous_head = self._head_position
+        previous_window = self._window
+        previous_start = self._window_start
         
+        self._tape_snapshot = tape_snapshot
         self._head_position = head_position
         self._current_state = current_state
-        self.update()
-        self._scroll_to_head()
-    
-    def _scroll_to_head(self) -> None:
-        parent = self.parent()
-        while parent and not isinstance(parent, QScrollArea):
-            parent = parent.parent()
-        
-        if isinstance(parent, QScrollArea):
-            cell_width = self._cell_size + 8
-            scroll_x = max(
-                0, 
-                (self._head_position - self._visible_cells // 2) * cell_width
+        
+        if tape_snapshot is None or not had_tape:
+            self._animation.stop()
+            self._viewport.set_center(float(head_position))
+            self._refresh_window()
+            self.update()
+            return
+        
+        self._refresh_window()
+        self._invalidate_changes(previous_window, previous_start, previous_head)
+        if self._follow_head:
+            self._move_center(head_position)
+    
+    def _refresh_window(self) -> None:
+        if self._tape_snapshot is None:
+            self._window = ""
+            self._window_start = 0
+            return
+        first, last = self._viewport.visible_range(self.width())
+        self._window = self._tape_snapshot.read_range(first, last + 1)
+        self._window_start = first
+    
+    def _invalidate_changes(
+        self,
+        previous_window: str,
+        previous_start: int,
+        previous_head: int
+    ) -> None:
+        self.update(QRect(0, 0, self.width(), self.ROW_TOP))
+        
+        if self._show_heatmap and self._heatmap is not None:
+            strip = self._strip_rect()
+            self.update(QRect(0, strip.bottom() + 1, self.width(), self.height() - strip.bottom()))
+            heat_state = (
+                self._heatmap.get_step_count(),
+                self._heatmap.get_max_visits(),
+                self._heatmap.get_max_writes()
             )
-            parent.horizontalScrollBar().setValue(int(scroll_x))
+            previous_state, self._heat_state = self._heat_state, heat_state
+            if heat_state[1:] != previous_state[1:] or heat_state[0] - previous_state[0] > 1:
+                self.update(self._strip_rect())
+                return
+        
+        changed = {previous_head, self._head_position}
+        low = max(previous_start, self._window_start)
+        high = min(
+            previous_start + len(previous_window),
+            self._window_start + len(self._window)
+        )
+        if high > low:
+            old = previous_window[low - previous_start:high - previous_start]
+            new = self._window[low - self._window_start:high - self._window_start]
+            if old != new:
+                changed.update(
+                    low + offset
+                    for offset, (before, after) in enumerate(zip(old, new))
+                    if before != after
+                )
+        for position in changed:
+            self.update(self._column_rect(position))
+        self.update(self._head_arrow_rect(self._head_arrow_x(previous_head)))
+        self.update(self._head_arrow_rect(self._head_arrow_x(self._head_position)))
+    
+    def _head_arrow_x(self, position: int) -> int:
+        return self._viewport.x_of(position, self.width()) + self._viewport.get_cell_size() // 2
+    
+    def _head_arrow_rect(self, x: int) -> QRect:
+        margin = self.HEAD_ARROW_SIZE + 4
+        return QRect(
+            x - margin, self.HEAD_ARROW_TOP - 4,
+            2 * margin + 1, self.HEAD_ARROW_HEIGHT + 8
+        )
+    
+    def _column_rect(self, position: int) -> QRect:
+        strip = self._strip_rect()
+        x = self._viewport.x_of(position, self.width())
+        return QRect(x - 1, strip.top(), self._viewport.get_pitch() + 2, strip.height())
+    
+    def _strip_rect(self) -> QRect:
+        bottom = self.ROW_TOP + self.ROW_HEIGHT + self.HEAT_OFFSET
+        if self._show_heatmap and self._heatmap is not None:
+            bottom += 2 * self.HEAT_ROW_HEIGHT + 2
+        return QRect(0, self.ROW_TOP, self.width(), bottom - self.ROW_TOP)
+    
+    def _move_center(self, target: float) -> None:
+        self._animation.stop()
+        current = self._viewport.get_center()
+        if current == target:
+            return
+        if (self._animation.duration() == 0
+                or self._viewport.distance_px(target) >= self.width()
+                or not self.isVisible()):
+            self._set_center(float(target))
+            return
+        self._animation.setStartValue(float(current))
+        self._animation.setEndValue(float(target))
+        self._animation.start()
+    
+    def _on_center_changed(self, value) -> None:
+        self._set_center(float(value))
+    
+    def _set_center(self, center: float) -> None:
+        previous_px = self._viewport.get_scroll_px()
+        previous_arrow_x = self._head_arrow_x(self._head_position)
+        self._viewport.set_center(center)
+        dx = previous_px - self._viewport.get_scroll_px()
+        if not dx:
+            return
+        self._refresh_window()
+        if abs(dx) >= self.width():
+            self.update()
+        else:
+            self.scroll(dx, 0, self._strip_rect())
+            self.update(self._head_arrow_rect(previous_arrow_x))
+            self.update(self._head_arrow_rect(self._head_arrow_x(self._head_position)))
+    
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._refresh_window()
+    
+    def wheelEvent(self, event) -> None:
+        delta = event.angleDelta().y() or event.angleDelta().x()
+        if not delta:
+            event.ignore()
+            return
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            if delta > 0:
+                self.zoom_in()
+            else:
+                self.zoom_out()
+        else:
+            self._follow_head = False
+            cells = self._viewport.cells_across(self.WHEEL_PAN_PX * delta / 120)
+            target = self._viewport.get_center()
+            if self._animation.state() == QVariantAnimation.State.Running:
+                target = float(self._animation.endValue())
+            self._move_center(target - cells)
+        event.accept()
+    
+    def mouseDoubleClickEvent(self, event) -> None:
+        self.set_follow_head(True)
+        event.accept()
+    
+    def keyPressEvent(self, event) -> None:
+        key = event.key()
+        if key in (Qt.Key.Key_Plus, Qt.Key.Key_Equal):
+            self.zoom_in()
+        elif key == Qt.Key.Key_Minus:
+            self.zoom_out()
+        elif key == Qt.Key.Key_Home:
+            self.set_follow_head(True)
+        else:
+            super().keyPressEvent(event)
     
     def paintEvent(self, event) -> None:
+        if self._trace_recorder is None:
+            self._paint(event.rect())
+            return
+        with self._trace_recorder.span('gui.boyama', 'gui'):
+            self._paint(event.rect())
+    
+    def _paint(self, rect: QRect) -> None:
         painter = QPainter(self)
+        painter.fillRect(rect, self.palette().color(QPalette.ColorRole.Window))
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        if not self._tape_snapshot:
+        if self._tape_snapshot is None:
             painter.drawText(
                 self.rect(), 
                 Qt.AlignmentFlag.AlignCenter, 
@@ -70,22 +305,12 @@ class TapeWidget(QWidget):
             )
             return
         
-        display_min = self._head_position - self._visible_cells // 2
-        display_max = self._head_position + self._visible_cells // 2
-        
-        x_start = 20
-        y_start = 70
+        if rect.intersects(self._strip_rect()):
+            self._paint_strip(painter, rect)
         
-        for i, pos in enumerate(range(display_min, display_max + 1)):
-            x = x_start + i * (self._cell_size + 8)
-            y = y_start
-            self._draw_cell(painter, x, y, pos)
-        
-        head_idx = self._head_position - display_min
-        head_x = x_start + head_idx * (self._cell_size + 8) + self._cell_size // 2
-        head_y = y_start - 35
-        
-        self._draw_head_arrow(painter, head_x, head_y)
+        head_x = self._head_arrow_x(self._head_position)
+        if rect.intersects(self._head_arrow_rect(head_x)):
+            self._draw_head_arrow(painter, head_x, self.HEAD_ARROW_TOP)
         
         info_y = 10
         
@@ -112,74 +337,149 @@ class TapeWidget(QWidget):
             f"1'ler: {stats['ones']} | "
             f"2'ler: {stats['twos']} | "
             f"X'ler: {stats['x']} | "
-            f"Y'ler: {stats['y']}"
+            f"Y'ler: {stats['y']} | "
+            f"Hücre: {self._viewport.get_cell_size()} px"
         )
         painter.drawText(
             20, info_y + 25, 800, 20, 
             Qt.AlignmentFlag.AlignLeft, 
             stats_text
         )
+        
+        if self._show_heatmap and self._heatmap is not None:
+            heatmap_text = (
+                f"Isı haritası (üst: ziyaret, alt: yazma) | "
+                f"Maks. ziyaret: {self._heatmap.get_max_visits()} | "
+                f"Maks. yazma: {self._heatmap.get_max_writes()}"
+            )
+            painter.drawText(
+                20, self.ROW_TOP + self.ROW_HEIGHT + self.HEAT_OFFSET + 40, 800, 20, 
+                Qt.AlignmentFlag.AlignLeft, 
+                heatmap_text
+            )
     
-    def _calculate_statistics(self) -> Dict[str, int]:
-        stats = {
-            'zeros': 0,
-            'ones': 0,
-            'twos': 0,
-            'x': 0,
-            'y': 0,
-        }
+    def _paint_strip(self, painter: QPainter, rect: QRect) -> None:
+        viewport = self._viewport
+        width = self.width()
+        cell_size = viewport.get_cell_size()
+        pitch = viewport.get_pitch()
+        first, last = viewport.position_range(rect.left(), rect.right() + 1, width)
+        cells = self._tape_snapshot.read_range(first, last + 1)
+        heat_y = self.ROW_TOP + self.ROW_HEIGHT + self.HEAT_OFFSET
+        show_heat = self._show_heatmap and self._heatmap is not None
         
-        for symbol in self._tape_snapshot.values():
-            if symbol == '0':
-                stats['zeros'] += 1
-            elif symbol == '1':
-                stats['ones'] += 1
-            elif symbol == '2':
-                stats['twos'] += 1
-            elif symbol == 'X':
-                stats['x'] += 1
-            elif symbol == 'Y':
-                stats['y'] += 1
+        if cell_size >= self.TEXT_MIN_CELL_SIZE:
+            per_cell_labels = pitch >= self.LABEL_MIN_SPACING
+            for offset, symbol in enumerate(cells):
+                position = first + offset
+                x = viewport.x_of(position, width)
+                self._draw_cell(painter, x, self.ROW_TOP, position, symbol, per_cell_labels)
+                if show_heat:
+                    self._draw_heat_cell(painter, x, heat_y, position)
+            if not per_cell_labels:
+                self._draw_position_ticks(painter, rect)
+            return
+        
+        if viewport.get_gap():
+            for offset, symbol in enumerate(cells):
+                position = first + offset
+                x = viewport.x_of(position, width)
+                color = self.SYMBOL_COLORS.get(symbol, self.UNKNOWN_SYMBOL_COLOR)
+                painter.fillRect(x, self.ROW_TOP, cell_size, self.ROW_HEIGHT, color)
+        else:
+            data = bytes(self._tape_snapshot.read_range_bytes(first, last + 1))
+            image = QImage(data, len(data), 1, len(data), QImage.Format.Format_Indexed8)
+            image.setColorTable(self._palette_table)
+            painter.drawImage(
+                QRectF(viewport.x_of(first, width), self.ROW_TOP,
+                       len(data) * pitch, self.ROW_HEIGHT),
+                image
+            )
+        
+        if first <= self._head_position <= last:
+            painter.fillRect(
+                viewport.x_of(self._head_position, width), self.ROW_TOP,
+                max(cell_size, 2), 6, QColor(255, 50, 50)
+            )
+        if show_heat:
+            for position in range(first, last + 1):
+                self._draw_heat_bar(
+                    painter, viewport.x_of(position, width), heat_y, cell_size, position
+                )
+        self._draw_position_ticks(painter, rect)
+    
+    def _draw_position_ticks(self, painter: QPainter, rect: QRect) -> None:
+        viewport = self._viewport
+        width = self.width()
+        step = viewport.get_label_step(self.LABEL_MIN_SPACING)
+        span = self.LABEL_MIN_SPACING
+        first, last = viewport.position_range(rect.left() - span, rect.right() + 1 + span, width)
+        label_y = self.ROW_TOP + self.ROW_HEIGHT + 4
+        half_cell = viewport.get_cell_size() // 2
+        
+        painter.setFont(QFont("Arial", 8))
+        painter.setPen(QPen(QColor(80, 80, 80)))
+        position = -(-first // step) * step
+        while position <= last:
+            x = viewport.x_of(position, width) + half_cell
+            painter.drawLine(x, label_y, x, label_y + 4)
+            painter.drawText(
+                x - span // 2, label_y + 6, span, 16,
+                Qt.AlignmentFlag.AlignCenter,
+                str(position)
+            )
+            position += step
+    
+    def _calculate_statistics(self) -> Dict[str, int]:
+        if self._tape_snapshot is None:
+            return {'zeros': 0, 'ones': 0, 'twos': 0, 'x': 0, 'y': 0}
         
-        return stats
+        counts = self._tape_snapshot.get_symbol_counts()
+        return {
+            'zeros': counts.get('0', 0),
+            'ones': counts.get('1', 0),
+            'twos': counts.get('2', 0),
+            'x': counts.get('X', 0),
+            'y': counts.get('Y', 0),
+        }
     
     def _draw_cell(
         self, 
         painter: QPainter, 
         x: int, 
         y: int, 
-        position: int
+        position: int,
+        symbol: str,
+        show_label: bool = True
     ) -> None:
+        cell_size = self._viewport.get_cell_size()
+        height = self.ROW_HEIGHT
         pen = QPen(QColor(100, 100, 100), 2)
         painter.setPen(pen)
         
-        symbol = self._tape_snapshot.get(position, 'B')
-        
         if position == self._head_position:
-            brush = QBrush(QColor(255, 240, 200))
+            brush = QBrush(self.HEAD_CELL_COLOR)
         else:
             brush = QBrush(QColor(255, 255, 255))
         
         painter.setBrush(brush)
-        painter.drawRect(x, y, self._cell_size, self._cell_size)
+        painter.drawRect(x, y, cell_size, height)
         
+        font = QFont("Arial", min(20, max(8, cell_size // 3)), QFont.Weight.Bold)
+        painter.setFont(font)
         if symbol == 'B':
             bg_brush = QBrush(QColor(240, 240, 240))
             painter.setBrush(bg_brush)
             painter.drawRect(
                 x + 1, y + 1, 
-                self._cell_size - 2, 
-                self._cell_size - 2
+                cell_size - 2, 
+                height - 2
             )
             painter.setBrush(brush)
             display_symbol = 'B'
-            font = QFont("Arial", 20, QFont.Weight.Bold)
-            painter.setFont(font)
             painter.setPen(QPen(QColor(80, 80, 80), 3))
         else:
             display_symbol = symbol
-            font = QFont("Arial", 20, QFont.Weight.Bold)
-            painter.setFont(font)
             color = self.SYMBOL_COLORS.get(symbol, QColor(0, 0, 0))
             painter.setPen(QPen(color, 2))
             
@@ -189,34 +489,93 @@ class TapeWidget(QWidget):
             painter.setBrush(bg_brush)
             painter.drawRect(
                 x + 1, y + 1, 
-                self._cell_size - 2, 
-                self._cell_size - 2
+                cell_size - 2, 
+                height - 2
             )
             painter.setBrush(brush)
         
         painter.drawText(
-            x, y, self._cell_size, self._cell_size,
+            x, y, cell_size, height,
             Qt.AlignmentFlag.AlignCenter, 
             display_symbol
         )
         
+        if not show_label:
+            return
         font_small = QFont("Arial", 9, QFont.Weight.Bold)
         painter.setFont(font_small)
         painter.setPen(QPen(QColor(80, 80, 80)))
         painter.drawText(
-            x, y + self._cell_size + 18, 
-            self._cell_size, 18,
+            x, y + height + self.LABEL_OFFSET, 
+            cell_size, 18,
             Qt.AlignmentFlag.AlignCenter, 
             str(position)
         )
     
+    def _draw_heat_cell(
+        self, 
+        painter: QPainter, 
+        x: int, 
+        y: int, 
+        position: int
+    ) -> None:
+        bar_height = self.HEAT_ROW_HEIGHT
+        cell_size = self._viewport.get_cell_size()
+        rows = self._heat_rows(position)
+        
+        painter.setFont(QFont("Arial", 8))
+        for row, (count, color) in enumerate(rows):
+            bar_y = y + row * (bar_height + 2)
+            
+            painter.setPen(QPen(QColor(200, 200, 200), 1))
+            painter.setBrush(QBrush(color))
+            painter.drawRect(x, bar_y, cell_size, bar_height)
+            
+            painter.setPen(QPen(QColor(40, 40, 40)))
+            painter.drawText(
+                x, bar_y, cell_size, bar_height,
+                Qt.AlignmentFlag.AlignCenter,
+                str(count)
+            )
+    
+    def _draw_heat_bar(
+        self,
+        painter: QPainter,
+        x: int,
+        y: int,
+        width: int,
+        position: int
+    ) -> None:
+        for row, (_, color) in enumerate(self._heat_rows(position)):
+            painter.fillRect(
+                x, y + row * (self.HEAT_ROW_HEIGHT + 2), width, self.HEAT_ROW_HEIGHT, color
+            )
+    
+    def _heat_rows(self, position: int) -> Iterator[Tuple[int, QColor]]:
+        rows = (
+            (
+                self._heatmap.get_visits(position),
+                self._heatmap.get_max_visits(),
+                self.HEATMAP_VISIT_COLOR
+            ),
+            (
+                self._heatmap.get_writes(position),
+                self._heatmap.get_max_writes(),
+                self.HEATMAP_WRITE_COLOR
+            ),
+        )
+        for count, maximum, base_color in rows:
+            color = QColor(base_color)
+            color.setAlpha(int(255 * count / maximum) if maximum else 0)
+            yield count, color
+    
     def _draw_head_arrow(self, painter: QPainter, x: int, y: int) -> None:
         pen = QPen(QColor(255, 50, 50), 4)
         painter.setPen(pen)
         
-        painter.drawLine(x, y, x, y + 25)
+        painter.drawLine(x, y, x, y + self.HEAD_ARROW_HEIGHT)
         
-        arrow_size = 10
+        arrow_size = self.HEAD_ARROW_SIZE
         painter.drawLine(x, y, x - arrow_size, y + arrow_size)
         painter.drawLine(x, y, x + arrow_size, y + arrow_size)
         
@@ -0,0 +1,390 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from turing_simulator.domain.entities.memory_budget import MemoryBudget, MemoryLimitExceeded
+from turing_simulator.domain.entities.step_result import StepResult
+from turing_simulator.domain.entities.tape import Tape
+from turing_simulator.domain.machines.machine_registry import create_machine, get_machine_ids
+
+
+class RequestError(Exception):
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _ClientDisconnected(Exception):
+    pass
+
+
+@dataclass
+class RunRequest:
+    machine_id: str
+    tape: List[str]
+    max_steps: int
+    timeout_seconds: float
+    every: int = 1
+    window: int = 0
+    
+    @classmethod
+    def from_json(
+        cls,
+        payload: Dict[str, Any],
+        step_limit: int,
+        timeout_limit: float
+    ) -> 'RunRequest':
+        if not isinstance(payload, dict):
+            raise RequestError(400, "İstek gövdesi bir JSON nesnesi olmalıdır.")
+        
+        machine_id = payload.get('machine', 'multiply')
+        if machine_id not in get_machine_ids():
+            raise RequestError(404, f"Bilinmeyen makine: '{machine_id}'")
+        
+        if 'tape' in payload:
+            tape = payload['tape']
+            if isinstance(tape, str):
+                tape = list(tape)
+            if not isinstance(tape, list) or not all(
+                isinstance(symbol, str) and len(symbol) == 1 and 0 < ord(symbol) < 256
+                for symbol in tape
+            ):
+                raise RequestError(
+                    400, "'tape' tek karakterlik Latin-1 semboller içermelidir."
+                )
+        elif 'n' in payload and 'm' in payload:
+            n, m = payload['n'], payload['m']
+            if not isinstance(n, int) or not isinstance(m, int) or n < 1 or m < 1:
+                raise RequestError(400, "'n' ve 'm' pozitif tam sayı olmalıdır.")
+            tape = ['0'] * n + ['1'] * m
+        else:
+            raise RequestError(400, "'tape' ya da 'n' ve 'm' alanları gereklidir.")
+        
+        try:
+            max_steps = int(payload.get('max_steps', step_limit))
+            timeout_seconds = float(payload.get('timeout', timeout_limit))
+            every = int(payload.get('every', 1))
+            window = int(payload.get('window', 0))
+        except (TypeError, ValueError):
+            raise RequestError(400, "Bütçe alanları sayısal olmalıdır.")
+        
+        if max_steps < 1 or timeout_seconds <= 0 or every < 1 or window < 0:
+            raise RequestError(400, "Bütçe alanları pozitif olmalıdır.")
+        
+        return cls(
+            machine_id=machine_id,
+            tape=tape,
+            max_steps=min(max_steps, step_limit),
+            timeout_seconds=min(timeout_seconds, timeout_limit),
+            every=every,
+            window=min(window, 100)
+        )
+
+
+def step_result_to_dict(result: StepResult, window: int = 0) -> Dict[str, Any]:
+    data = {
+        'step': result.step_number,
+        'from': result.previous_state.name,
+        'to': result.current_state.name,
+        'read': result.read_symbol,
+        'write': result.write_symbol,
+        'move': result.direction,
+        'head': result.head_position,
+        'halted': result.is_halted,
+    }
+    if window and result.tape_snapshot is not None:
+        start = result.head_position - window
+        data['window_start'] = start
+        data['window'] = result.tape_snapshot.read_range(
+            start, result.head_position + window + 1
+        )
+    return data
+
+
+class SimulationServer:
+    
+    MAX_BODY_BYTES = 1 << 20
+    MAX_HEADER_LINES = 100
+    
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 8765,
+        workers: int = 4,
+        max_runs_per_client: int = 2,
+        queue_size: int = 256,
+        step_limit: int = 100000,
+        timeout_limit: float = 60.0,
+        memory_limit: int = 64 << 20,
+        spill_limit: int = 0,
+        spill_directory: Optional[str] = None
+    ):
+        self._host = host
+        self._port = port
+        self._workers = workers
+        self._max_runs_per_client = max_runs_per_client
+        self._queue_size = queue_size
+        self._step_limit = step_limit
+        self._timeout_limit = timeout_limit
+        self._memory_limit = memory_limit
+        self._spill_limit = spill_limit
+        self._spill_directory = spill_directory
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._client_runs: Dict[str, int] = {}
+        self._completed_runs = 0
+        self._rejected_runs = 0
+    
+    async def start(self) -> Tuple[str, int]:
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix='tm-worker'
+        )
+        self._server = await asyncio.start_server(
+            self._handle_connection, self._host, self._port
+        )
+        return self._server.sockets[0].getsockname()[:2]
+    
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+    
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        client = (writer.get_extra_info('peername') or ('unknown',))[0]
+        try:
+            method, path, body = await self._read_request(reader)
+            await self._dispatch(method, path, body, client, writer)
+        except RequestError as e:
+            await self._send_json(writer, e.status, {'error': str(e)})
+        except (ConnectionError, asyncio.IncompleteReadError, _ClientDisconnected):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+    
+    async def _read_request(
+        self,
+        reader: asyncio.StreamReader
+    ) -> Tuple[str, str, bytes]:
+        request_line = (await reader.readline()).decode('latin-1').strip()
+        parts = request_line.split()
+        if len(parts) != 3:
+            raise RequestError(400, "Geçersiz HTTP istek satırı.")
+        method, path, _ = parts
+        
+        headers: Dict[str, str] = {}
+        for _ in range(self.MAX_HEADER_LINES):
+            line = (await reader.readline()).decode('latin-1').strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise RequestError(431, "Çok fazla başlık satırı.")
+        
+        try:
+            length = int(headers.get('content-length', '0'))
+        except ValueError:
+            raise RequestError(400, "Geçersiz Content-Length.")
+        if length < 0 or length > self.MAX_BODY_BYTES:
+            raise RequestError(413, "İstek gövdesi çok büyük.")
+        
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), path, body
+    
+    async def _dispatch(
+        self,
+        method: str,
+        path: str,
+        body: bytes,
+        client: str,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        if method == 'GET' and path == '/health':
+            await self._send_json(writer, 200, {
+                'status': 'ok',
+                'active_runs': sum(self._client_runs.values()),
+                'completed_runs': self._completed_runs,
+                'rejected_runs': self._rejected_runs,
+            })
+        elif method == 'GET' and path == '/machines':
+            await self._send_json(writer, 200, {'machines': get_machine_ids()})
+        elif method == 'POST' and path == '/runs':
+            try:
+                payload = json.loads(body.decode('utf-8') or '{}')
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                raise RequestError(400, "İstek gövdesi geçerli JSON değil.")
+            request = RunRequest.from_json(
+                payload, self._step_limit, self._timeout_limit
+            )
+            await self._stream_run(request, client, writer)
+        else:
+            raise RequestError(404, "Bulunamadı.")
+    
+    async def _stream_run(
+        self,
+        request: RunRequest,
+        client: str,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        if self._client_runs.get(client, 0) >= self._max_runs_per_client:
+            self._rejected_runs += 1
+            raise RequestError(429, "İstemci eşzamanlı çalıştırma sınırına ulaştı.")
+        
+        self._client_runs[client] = self._client_runs.get(client, 0) + 1
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        cancelled = threading.Event()
+        
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: application/x-ndjson\r\n"
+            b"Transfer-Encoding: chunked\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        
+        future = loop.run_in_executor(
+            self._executor, self._run_job, request, loop, queue, cancelled
+        )
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                await self._write_chunk(writer, item)
+            await future
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+            self._completed_runs += 1
+        finally:
+            cancelled.set()
+            while not queue.empty():
+                queue.get_nowait()
+            self._client_runs[client] -= 1
+            if not self._client_runs[client]:
+                del self._client_runs[client]
+    
+    async def _write_chunk(self, writer: asyncio.StreamWriter, item: Dict[str, Any]) -> None:
+        if writer.is_closing():
+            raise _ClientDisconnected()
+        line = json.dumps(item, ensure_ascii=False).encode('utf-8') + b"\n"
+        writer.write(f"{len(line):X}\r\n".encode('ascii') + line + b"\r\n")
+        await writer.drain()
+    
+    def _run_job(
+        self,
+        request: RunRequest,
+        loop: asyncio.AbstractEventLoop,
+        queue: asyncio.Queue,
+        cancelled: threading.Event
+    ) -> None:
+        def publish(item: Optional[Dict[str, Any]]) -> None:
+            while not cancelled.is_set():
+                put = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+                try:
+                    put.result(timeout=0.5)
+                    return
+                except FutureTimeoutError:
+                    put.cancel()
+            raise _ClientDisconnected()
+        
+        started = time.perf_counter()
+        deadline = started + request.timeout_seconds
+        budget: Optional[MemoryBudget] = None
+        
+        result: Optional[StepResult] = None
+        reason = 'halted'
+        try:
+            machine = create_machine(request.machine_id)
+            budget = MemoryBudget(self._memory_limit, self._spill_limit, self._spill_directory)
+            tape = Tape(blank_symbol=machine.get_blank_symbol())
+            memory = None
+            try:
+                tape.set_memory_budget(budget)
+                tape.initialize_from_list(request.tape, start_position=0)
+                machine.reset(tape)
+                while not machine.is_halted():
+                    if machine.get_step_count() >= request.max_steps:
+                        reason = 'step_budget'
+                        break
+                    if time.perf_counter() > deadline:
+                        reason = 'timeout'
+                        break
+                    
+                    result = machine.step()
+                    if result.is_halted or result.step_number % request.every == 0:
+                        publish({
+                            'type': 'step',
+                            **step_result_to_dict(result, request.window)
+                        })
+            except MemoryLimitExceeded as e:
+                reason = 'memory_budget'
+                memory = e.report
+            
+            publish({
+                'type': 'summary',
+                'reason': reason,
+                'steps': machine.get_step_count(),
+                'state': machine.get_current_state().name,
+                'head': machine.get_head_position(),
+                'symbol_counts': tape.get_symbol_counts(),
+                'elapsed_seconds': time.perf_counter() - started,
+                'memory': (memory or budget.get_report()).to_dict(),
+            })
+        except _ClientDisconnected:
+            return
+        except Exception as e:
+            try:
+                publish({'type': 'error', 'error': str(e)})
+            except _ClientDisconnected:
+                return
+        finally:
+            if budget is not None:
+                budget.close()
+        try:
+            publish(None)
+        except _ClientDisconnected:
+            pass
+    
+    async def _send_json(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: Dict[str, Any]
+    ) -> None:
+        reasons = {
+            200: 'OK', 400: 'Bad Request', 404: 'Not Found', 413: 'Payload Too Large',
+            429: 'Too Many Requests', 431: 'Request Header Fields Too Large',
+        }
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        writer.write(
+            f"HTTP/1.1 {status} {reasons.get(status, 'Error')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode('latin-1') + body
+        )
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
@@ -0,0 +1,51 @@
+import argparse
+import asyncio
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from turing_simulator.presentation.server.simulation_server import SimulationServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Turing makinesi simülasyon sunucusu")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--max-runs-per-client', type=int, default=2)
+    parser.add_argument('--step-limit', type=int, default=100000)
+    parser.add_argument('--memory-limit', type=int, default=64, help="Çalıştırma başına bellek sınırı (MiB)")
+    parser.add_argument('--spill-limit', type=int, default=0, help="Diske taşıma sınırı (MiB, 0 = kapalı)")
+    parser.add_argument('--spill-dir', default=None, help="Taşıma dosyasının dizini")
+    args = parser.parse_args()
+    
+    server = SimulationServer(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        max_runs_per_client=args.max_runs_per_client,
+        step_limit=args.step_limit,
+        memory_limit=args.memory_limit << 20,
+        spill_limit=args.spill_limit << 20,
+        spill_directory=args.spill_dir
+    )
+    
+    async def run() -> None:
+        host, port = await server.start()
+        print(f"Sunucu dinleniyor: http://{host}:{port}")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.stop()
+    
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Tuple
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, project_dir)
+
+from turing_simulator.domain.machines import create_multiply_machine
+from turing_simulator.domain.entities.tape import Tape
+from turing_simulator.domain.engine import CompiledTransitionTable, GeneratedRunner, MacroRunner
+
+
+def unary_tape(n: int, m: int) -> Tape:
+    tape = Tape(blank_symbol='B')
+    tape.initialize_from_list(['0'] * n + ['1'] * m, start_position=0)
+    return tape
+
+
+def count_twos(tape: Tape) -> int:
+    return tape.count_symbol('2')
+
+
+def table_loop(table: CompiledTransitionTable, tape: Tape, max_steps: int) -> int:
+    next_states, writes, moves = table.get_columns()
+    final = table.get_final_flags()
+    stride = table.get_stride()
+    no_transition = table.NO_TRANSITION
+    growth = GeneratedRunner.GROWTH
+    
+    symbols = tape.get_all_symbols()
+    origin = min(min(symbols, default=0), 0) - growth
+    cells = bytearray(max(max(symbols, default=0), 0) + growth - origin + 1)
+    for position, symbol in symbols.items():
+        cells[position - origin] = table.encode_symbol(symbol)
+    
+    state_id = table.get_initial_state_id()
+    head = -origin
+    steps = 0
+    while steps < max_steps:
+        steps += 1
+        symbol_id = cells[head]
+        index = state_id * stride + symbol_id
+        if symbol_id >= stride or next_states[index] == no_transition:
+            break
+        cells[head] = writes[index]
+        head += moves[index]
+        if head < 0:
+            cells[0:0] = bytes(growth)
+            head += growth
+            origin -= growth
+        elif head == len(cells):
+            cells.extend(bytes(growth))
+        state_id = next_states[index]
+        if final[state_id]:
+            break
+    
+    for index, symbol_id in enumerate(cells):
+        if symbol_id:
+            tape.write(origin + index, table.decode_symbol(symbol_id))
+    return steps
+
+
+def best_of(repeat: int, run: Callable[[], Tuple[int, int]]) -> Tuple[int, int, float]:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        steps, product = run()
+        best = min(best, time.perf_counter() - started)
+    return steps, product, best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Kod üreten motoru tablo döngüsü ve makro motorla karşılaştırır"
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5, 10, 20, 40])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-steps', type=int, default=100_000_000)
+    args = parser.parse_args()
+    
+    machine = create_multiply_machine()
+    table = CompiledTransitionTable.from_machine(machine)
+    
+    compile_started = time.perf_counter()
+    generated_runner = GeneratedRunner(machine)
+    compile_time = time.perf_counter() - compile_started
+    print(f"Kod üretimi ve derleme: {compile_time * 1000:.2f} ms")
+    
+    def run_table(n: int, m: int) -> Tuple[int, int]:
+        tape = unary_tape(n, m)
+        steps = table_loop(table, tape, args.max_steps)
+        return steps, count_twos(tape)
+    
+    def run_macro(n: int, m: int) -> Tuple[int, int]:
+        tape = unary_tape(n, m)
+        summary = MacroRunner(machine).run(tape, args.max_steps)
+        return summary.step_count, count_twos(tape)
+    
+    def run_generated(n: int, m: int) -> Tuple[int, int]:
+        tape = unary_tape(n, m)
+        summary = generated_runner.run(tape, args.max_steps)
+        return summary.step_count, count_twos(tape)
+    
+    print(f"{'n=m':>5} | {'adım':>12} | {'tablo (ms)':>10} | {'makro (ms)':>10} | "
+          f"{'üretilmiş (ms)':>14} | {'hızlanma':>8}")
+    for size in args.sizes:
+        results = [
+            best_of(args.repeat, lambda run=run: run(size, size))
+            for run in (run_table, run_macro, run_generated)
+        ]
+        if any(steps != results[0][0] or product != size * size
+               for steps, product, _ in results):
+            print(f"Hatalı sonuç: n=m={size}")
+            sys.exit(1)
+        table_time, macro_time, generated_time = (elapsed for _, _, elapsed in results)
+        print(f"{size:>5} | {results[0][0]:>12,} | {table_time * 1000:>10.2f} | "
+              f"{macro_time * 1000:>10.2f} | {generated_time * 1000:>14.2f} | "
+              f"{table_time / generated_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Tuple
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, project_dir)
+
+from turing_simulator.domain.machines import (
+    create_multiply_machine, create_two_tape_multiply_machine
+)
+from turing_simulator.domain.entities.tape import Tape
+from turing_simulator.domain.engine import MacroRunner, MultiTapeRunner
+
+
+def unary_tape(n: int, m: int) -> Tape:
+    tape = Tape(blank_symbol='B')
+    tape.initialize_from_list(['0'] * n + ['1'] * m, start_position=0)
+    return tape
+
+
+def count_twos(tape: Tape) -> int:
+    return tape.count_symbol('2')
+
+
+def best_of(repeat: int, run: Callable[[], Tuple[int, int]]) -> Tuple[int, int, float]:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        steps, product = run()
+        best = min(best, time.perf_counter() - started)
+    return steps, product, best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Tek şeritli ve iki şeritli çarpma makinelerini karşılaştırır"
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5, 10, 20, 40])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-steps', type=int, default=100_000_000)
+    args = parser.parse_args()
+    
+    reference_machine = create_multiply_machine()
+    reference_machine.MAX_STEPS = args.max_steps
+    single_runner = MacroRunner(create_multiply_machine())
+    two_tape_runner = MultiTapeRunner(create_two_tape_multiply_machine())
+    
+    def run_reference(n: int, m: int) -> Tuple[int, int]:
+        tape = unary_tape(n, m)
+        reference_machine.execute(tape)
+        return reference_machine.get_step_count(), count_twos(tape)
+    
+    def run_single(n: int, m: int) -> Tuple[int, int]:
+        tape = unary_tape(n, m)
+        summary = single_runner.run(tape, args.max_steps)
+        return summary.step_count, count_twos(tape)
+    
+    def run_two_tape(n: int, m: int) -> Tuple[int, int]:
+        tapes = [unary_tape(n, m), Tape(blank_symbol='B')]
+        summary = two_tape_runner.run(tapes, args.max_steps)
+        return summary.step_count, count_twos(tapes[1])
+    
+    print(f"{'n=m':>5} | {'tek şerit adım':>15} | {'referans (ms)':>13} | {'makro (ms)':>10} | "
+          f"{'iki şerit adım':>15} | {'süre (ms)':>10} | {'adım oranı':>10} | {'hızlanma':>9}")
+    for size in args.sizes:
+        reference_steps, reference_product, reference_time = best_of(
+            args.repeat, lambda: run_reference(size, size)
+        )
+        single_steps, single_product, single_time = best_of(
+            args.repeat, lambda: run_single(size, size)
+        )
+        two_steps, two_product, two_time = best_of(
+            args.repeat, lambda: run_two_tape(size, size)
+        )
+        if (reference_product != size * size or single_product != size * size
+                or two_product != size * size or reference_steps != single_steps):
+            print(f"Hatalı sonuç: n=m={size}")
+            sys.exit(1)
+        print(f"{size:>5} | {single_steps:>15,} | {reference_time * 1000:>13.2f} | "
+              f"{single_time * 1000:>10.2f} | {two_steps:>15,} | {two_time * 1000:>10.2f} | "
+              f"{single_steps / two_steps:>9.1f}x | {reference_time / two_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
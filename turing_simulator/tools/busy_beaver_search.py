@@ -0,0 +1,38 @@
+import argparse
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, project_dir)
+
+from turing_simulator.application.services.busy_beaver_search import BusyBeaverSearch
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Küçük Turing makinelerini sayarak Busy Beaver araması yapar"
+    )
+    parser.add_argument('--states', type=int, default=3)
+    parser.add_argument('--symbols', type=int, default=2)
+    parser.add_argument('--max-steps', type=int, default=10_000)
+    parser.add_argument('--max-cells', type=int, default=1_000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--results', default='busy_beaver.bin')
+    parser.add_argument('--checkpoint', default=None)
+    args = parser.parse_args()
+    
+    search = BusyBeaverSearch(
+        states=args.states,
+        symbols=args.symbols,
+        max_steps=args.max_steps,
+        max_cells=args.max_cells,
+        workers=args.workers
+    )
+    report = search.run(args.results, args.checkpoint)
+    print(report)
+    sys.exit(0 if report.is_complete() else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import argparse
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, project_dir)
+
+from turing_simulator.domain.machines.machine_registry import create_machine, get_machine_ids
+from turing_simulator.domain.entities.tape import Tape
+from turing_simulator.domain.localization.message_catalog import get_locales
+from turing_simulator.application.services.machine_executor import MachineExecutor
+from turing_simulator.application.services.machine_verifier import unary_input
+from turing_simulator.application.services.step_explainer import StepExplainer
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Çalışmanın tüm adım açıklamalarını seçilen dilde dosyaya yazar"
+    )
+    parser.add_argument('output', help="Açıklamaların yazılacağı metin dosyası")
+    parser.add_argument('--machine', default='multiply', choices=get_machine_ids())
+    parser.add_argument('--n', type=int, default=3)
+    parser.add_argument('--m', type=int, default=3)
+    parser.add_argument('--locale', default='tr', choices=get_locales())
+    parser.add_argument('--summary', action='store_true', help="Yalnızca tek satırlık adım özetleri")
+    args = parser.parse_args()
+    
+    machine = create_machine(args.machine)
+    tape = Tape(blank_symbol=machine.get_blank_symbol())
+    tape.initialize_from_list(unary_input(args.n, args.m), start_position=0)
+    
+    started = time.perf_counter()
+    with open(args.output, 'w', encoding='utf-8') as handle:
+        if args.summary:
+            def write_step(result):
+                handle.write(result.format_summary(args.locale))
+                handle.write("\n")
+            
+            machine.execute(tape, write_step)
+        else:
+            def write_step(result):
+                handle.write(result.explanation)
+                handle.write("\n\n")
+            
+            executor = MachineExecutor(StepExplainer(args.locale))
+            executor.execute_with_explanation(machine, tape, write_step)
+        step_count = machine.get_step_count()
+    
+    elapsed = time.perf_counter() - started
+    print(f"{step_count:,} adım {elapsed:.2f} s içinde yazıldı → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, project_dir)
+
+from turing_simulator.presentation.server.simulation_server import SimulationServer
+
+
+async def read_chunked_lines(reader: asyncio.StreamReader):
+    buffer = b''
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            return
+        size = int(size_line.strip() or b'0', 16)
+        if size == 0:
+            await reader.readline()
+            break
+        buffer += await reader.readexactly(size)
+        await reader.readexactly(2)
+        while b'\n' in buffer:
+            line, buffer = buffer.split(b'\n', 1)
+            if line:
+                yield json.loads(line)
+
+
+async def run_once(host: str, port: int, payload: Dict) -> Dict:
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode('utf-8')
+    writer.write(
+        f"POST /runs HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+        .encode('latin-1') + body
+    )
+    await writer.drain()
+    
+    status_line = (await reader.readline()).decode('latin-1')
+    status = int(status_line.split()[1])
+    while (await reader.readline()).strip():
+        pass
+    
+    first_event: Optional[float] = None
+    events = 0
+    summary: Dict = {}
+    if status == 200:
+        async for event in read_chunked_lines(reader):
+            if first_event is None:
+                first_event = time.perf_counter() - started
+            events += 1
+            if event.get('type') in ('summary', 'error'):
+                summary = event
+    
+    writer.close()
+    await writer.wait_closed()
+    return {
+        'status': status,
+        'events': events,
+        'first_event': first_event or 0.0,
+        'latency': time.perf_counter() - started,
+        'steps': summary.get('steps', 0),
+    }
+
+
+async def client_loop(host: str, port: int, runs: int, payload: Dict) -> List[Dict]:
+    return [await run_once(host, port, payload) for _ in range(runs)]
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    server = None
+    host, port = args.host, args.port
+    if args.spawn_server:
+        server = SimulationServer(
+            host=host, port=0, workers=args.workers,
+            max_runs_per_client=args.clients
+        )
+        host, port = await server.start()
+    
+    payload = {'n': args.n, 'm': args.m, 'every': args.every, 'window': args.window}
+    started = time.perf_counter()
+    batches = await asyncio.gather(*(
+        client_loop(host, port, args.runs, payload) for _ in range(args.clients)
+    ))
+    elapsed = time.perf_counter() - started
+    
+    if server is not None:
+        await server.stop()
+    
+    results = [result for batch in batches for result in batch]
+    ok = [result for result in results if result['status'] == 200]
+    latencies = [result['latency'] for result in ok]
+    total_steps = sum(result['steps'] for result in ok)
+    total_events = sum(result['events'] for result in ok)
+    
+    print(f"İstek: {len(results)} | Başarılı: {len(ok)} | "
+          f"Reddedilen: {len(results) - len(ok)}")
+    print(f"Süre: {elapsed:.3f} s | Çalıştırma/s: {len(ok) / elapsed:.1f} | "
+          f"Adım/s: {total_steps / elapsed:,.0f} | Olay/s: {total_events / elapsed:,.0f}")
+    if latencies:
+        print(f"Gecikme p50: {percentile(latencies, 0.5) * 1000:.1f} ms | "
+              f"p95: {percentile(latencies, 0.95) * 1000:.1f} ms | "
+              f"ortalama: {statistics.mean(latencies) * 1000:.1f} ms | "
+              f"ilk olay ortalama: "
+              f"{statistics.mean(r['first_event'] for r in ok) * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simülasyon sunucusu yük testi")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--n', type=int, default=4)
+    parser.add_argument('--m', type=int, default=4)
+    parser.add_argument('--every', type=int, default=1)
+    parser.add_argument('--window', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--spawn-server', action='store_true')
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import argparse
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, project_dir)
+
+from turing_simulator.domain.machines.machine_registry import get_machine_ids
+from turing_simulator.application.services.machine_verifier import unary_input
+from turing_simulator.presentation.gui.frame_renderer import FrameRenderer, RenderJob
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Çalışmanın her k. adımını ekran olmadan PNG karelere veya APNG'ye çizer"
+    )
+    parser.add_argument('output', help="Kare dizini veya .png uzantılı APNG dosyası")
+    parser.add_argument('--machine', default='multiply', choices=get_machine_ids())
+    parser.add_argument('--n', type=int, default=3)
+    parser.add_argument('--m', type=int, default=3)
+    parser.add_argument('--every', type=int, default=1)
+    parser.add_argument('--width', type=int, default=1000)
+    parser.add_argument('--height', type=int, default=200)
+    parser.add_argument('--zoom', type=int, default=0)
+    parser.add_argument('--delay', type=int, default=100, help="APNG kare süresi (ms)")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    
+    job = RenderJob(
+        machine_id=args.machine,
+        symbols=tuple(unary_input(args.n, args.m)),
+        every=args.every,
+        width=args.width,
+        height=args.height,
+        zoom_level=args.zoom
+    )
+    renderer = FrameRenderer(workers=args.workers)
+    if args.output.lower().endswith('.png'):
+        report = renderer.render_apng(job, args.output, args.delay)
+    else:
+        report = renderer.render_frames(job, args.output)
+    print(report)
+    print(f"Gerçek zamanlı oynatmaya göre: {args.delay * report.frames_per_second() / 1000:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, project_dir)
+
+from turing_simulator.domain.machines.machine_registry import get_machine_ids
+from turing_simulator.application.services.trace_regression import (
+    GoldenFile, TraceRegression, get_engine_names
+)
+
+
+def default_golden_path(machine_id: str) -> str:
+    return os.path.join(current_dir, 'golden', f"{machine_id}_traces.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Altın iz özetleriyle motorların adım adım aynı çalıştığını doğrular"
+    )
+    parser.add_argument('command', choices=['record', 'check'])
+    parser.add_argument('--machine', default='multiply', choices=get_machine_ids())
+    parser.add_argument('--golden', default=None)
+    parser.add_argument('--max-n', type=int, default=None)
+    parser.add_argument('--max-m', type=int, default=None)
+    parser.add_argument('--interval', type=int, default=TraceRegression.DEFAULT_INTERVAL)
+    parser.add_argument('--engines', nargs='+', choices=get_engine_names(), default=None)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    
+    path = args.golden or default_golden_path(args.machine)
+    regression = TraceRegression(machine_id=args.machine, workers=args.workers)
+    
+    if args.command == 'record':
+        golden = regression.record(args.max_n or 8, args.max_m or 8, args.interval)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        golden.save(path)
+        total = sum(trace.step_count for trace in golden.traces.values())
+        print(f"{len(golden.traces)} altın iz kaydedildi ({total:,} adım): {path}")
+        return
+    
+    report = regression.check(
+        GoldenFile.load(path), args.engines, args.max_n, args.max_m
+    )
+    print(report)
+    sys.exit(0 if report.is_clean() else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import argparse
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, project_dir)
+
+from turing_simulator.domain.machines.machine_registry import get_machine_ids
+from turing_simulator.application.services.machine_verifier import MachineVerifier
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Makineyi giriş uzayı üzerinde doğrular")
+    parser.add_argument('--machine', default='multiply', choices=get_machine_ids())
+    parser.add_argument('--max-n', type=int, default=20)
+    parser.add_argument('--max-m', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--stop-on-first', action='store_true')
+    args = parser.parse_args()
+    
+    verifier = MachineVerifier(machine_id=args.machine, workers=args.workers)
+    report = verifier.verify(args.max_n, args.max_m, stop_on_first=args.stop_on_first)
+    print(report)
+    sys.exit(0 if report.is_verified() else 1)
+
+
+if __name__ == "__main__":
+    main()